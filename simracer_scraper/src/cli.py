@@ -9,6 +9,7 @@ import yaml
 from .database import Database
 from .orchestrator import Orchestrator
 from .schema_validator import SchemaValidator
+from .utils.browser_manager import stop_warm_browser
 
 
 def setup_logging(level: str = "INFO"):
@@ -60,6 +61,9 @@ Examples:
 
   # Refresh all drivers from a specific league
   python scraper.py scrape drivers --league 1558
+
+  # Stop the warm Chromium started for OBRL_CDP_URL
+  python scraper.py stop-browser
         """,
     )
 
@@ -111,8 +115,20 @@ Examples:
         help="Log level (default: INFO)",
     )
 
+    # Stop-browser command
+    subparsers.add_parser(
+        "stop-browser",
+        help="Stop the detached warm Chromium started for OBRL_CDP_URL",
+    )
+
     args = parser.parse_args()
 
+    if args.command == "stop-browser":
+        setup_logging("INFO")
+        if not stop_warm_browser():
+            logging.getLogger(__name__).info("No warm Chromium running")
+        return 0
+
     # If no command provided, default to scrape with config
     if not args.command:
         args.command = "scrape"
@@ -1,10 +1,506 @@
 """Database manager for SimRacer scraper."""
 
 import sqlite3
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime
+
+# Entity type -> (table, ID column), shared by the cache checks and scrape logging
+_ENTITY_TABLES = {
+    "league": ("leagues", "league_id"),
+    "series": ("series", "series_id"),
+    "season": ("seasons", "season_id"),
+    "race": ("races", "schedule_id"),
+    "driver": ("drivers", "driver_id"),
+    "team": ("teams", "team_id"),
+}
+_VALID_ENTITY_TYPES = frozenset(_ENTITY_TABLES)
+_VALID_SCRAPE_STATUSES = ("success", "failed", "skipped")
+
+_SCHEMA_SQL = """
+BEGIN;
+
+-- Table: leagues
+CREATE TABLE IF NOT EXISTS leagues (
+    league_id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    description TEXT,
+    url TEXT NOT NULL UNIQUE,
+    scraped_at TIMESTAMP NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+CREATE INDEX IF NOT EXISTS idx_leagues_url ON leagues(url);
+CREATE INDEX IF NOT EXISTS idx_leagues_scraped_at ON leagues(scraped_at);
+
+-- Table: teams
+CREATE TABLE IF NOT EXISTS teams (
+    team_id INTEGER PRIMARY KEY,
+    league_id INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    driver_count INTEGER,
+    url TEXT,
+    scraped_at TIMESTAMP NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (league_id) REFERENCES leagues(league_id)
+);
+CREATE INDEX IF NOT EXISTS idx_teams_league_id ON teams(league_id);
+CREATE INDEX IF NOT EXISTS idx_teams_url ON teams(url);
+CREATE INDEX IF NOT EXISTS idx_teams_scraped_at ON teams(scraped_at);
+
+-- Table: drivers
+CREATE TABLE IF NOT EXISTS drivers (
+    driver_id INTEGER PRIMARY KEY,
+    league_id INTEGER NOT NULL,
+    team_id INTEGER,
+    name TEXT NOT NULL,
+    first_name TEXT,
+    last_name TEXT,
+    car_numbers TEXT,
+    primary_number TEXT,
+    club TEXT,
+    club_id INTEGER,
+    irating INTEGER,
+    safety_rating REAL,
+    license_class TEXT,
+    url TEXT NOT NULL UNIQUE,
+    scraped_at TIMESTAMP NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (league_id) REFERENCES leagues(league_id),
+    FOREIGN KEY (team_id) REFERENCES teams(team_id)
+);
+CREATE INDEX IF NOT EXISTS idx_drivers_league_id ON drivers(league_id);
+CREATE INDEX IF NOT EXISTS idx_drivers_team_id ON drivers(team_id);
+CREATE INDEX IF NOT EXISTS idx_drivers_url ON drivers(url);
+CREATE INDEX IF NOT EXISTS idx_drivers_name ON drivers(name);
+CREATE INDEX IF NOT EXISTS idx_drivers_scraped_at ON drivers(scraped_at);
+
+-- Table: series
+CREATE TABLE IF NOT EXISTS series (
+    series_id INTEGER PRIMARY KEY,
+    league_id INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    description TEXT,
+    created_date DATE,
+    num_seasons INTEGER,
+    url TEXT NOT NULL UNIQUE,
+    scraped_at TIMESTAMP NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (league_id) REFERENCES leagues(league_id)
+);
+CREATE INDEX IF NOT EXISTS idx_series_league_id ON series(league_id);
+CREATE INDEX IF NOT EXISTS idx_series_url ON series(url);
+CREATE INDEX IF NOT EXISTS idx_series_scraped_at ON series(scraped_at);
+
+-- Table: seasons
+CREATE TABLE IF NOT EXISTS seasons (
+    season_id INTEGER PRIMARY KEY,
+    series_id INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    description TEXT,
+    url TEXT NOT NULL UNIQUE,
+    scraped_at TIMESTAMP NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (series_id) REFERENCES series(series_id)
+);
+CREATE INDEX IF NOT EXISTS idx_seasons_series_id ON seasons(series_id);
+CREATE INDEX IF NOT EXISTS idx_seasons_url ON seasons(url);
+CREATE INDEX IF NOT EXISTS idx_seasons_scraped_at ON seasons(scraped_at);
+
+-- Table: races
+CREATE TABLE IF NOT EXISTS races (
+    race_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    schedule_id INTEGER NOT NULL UNIQUE,
+    season_id INTEGER NOT NULL,
+    race_number INTEGER NOT NULL,
+    event_name TEXT,
+    date TIMESTAMP,
+    race_time TEXT,
+    practice_time TEXT,
+    track_id INTEGER,
+    track_config_id INTEGER,
+    track_name TEXT,
+    track_type TEXT,
+    track_length REAL,
+    track_config_iracing_id TEXT,
+    planned_laps INTEGER,
+    points_race BOOLEAN,
+    off_week BOOLEAN,
+    night_race BOOLEAN,
+    playoff_race BOOLEAN,
+    race_duration_minutes INTEGER,
+    total_laps INTEGER,
+    leaders INTEGER,
+    lead_changes INTEGER,
+    cautions INTEGER,
+    caution_laps INTEGER,
+    num_drivers INTEGER,
+    weather_type TEXT,
+    cloud_conditions TEXT,
+    temperature_f INTEGER,
+    humidity_pct INTEGER,
+    fog_pct INTEGER,
+    weather_wind_speed TEXT,
+    weather_wind_dir TEXT,
+    weather_wind_unit TEXT,
+    url TEXT NOT NULL UNIQUE,
+    is_complete BOOLEAN DEFAULT 0,
+    scraped_at TIMESTAMP NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (season_id) REFERENCES seasons(season_id)
+);
+CREATE INDEX IF NOT EXISTS idx_races_schedule_id ON races(schedule_id);
+CREATE INDEX IF NOT EXISTS idx_races_season_id ON races(season_id);
+CREATE INDEX IF NOT EXISTS idx_races_url ON races(url);
+CREATE INDEX IF NOT EXISTS idx_races_date ON races(date);
+CREATE INDEX IF NOT EXISTS idx_races_is_complete ON races(is_complete);
+CREATE INDEX IF NOT EXISTS idx_races_scraped_at ON races(scraped_at);
+
+-- Table: race_results
+CREATE TABLE IF NOT EXISTS race_results (
+    result_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    race_id INTEGER NOT NULL,
+    driver_id INTEGER NOT NULL,
+    team TEXT,
+    finish_position INTEGER,
+    starting_position INTEGER,
+    car_number TEXT,
+    qualifying_time TEXT,
+    fastest_lap TEXT,
+    fastest_lap_number INTEGER,
+    average_lap TEXT,
+    interval TEXT,
+    laps_completed INTEGER,
+    laps_led INTEGER,
+    incident_points INTEGER,
+    race_points INTEGER,
+    bonus_points INTEGER,
+    penalty_points INTEGER,
+    total_points INTEGER,
+    fast_laps INTEGER,
+    quality_passes INTEGER,
+    closing_passes INTEGER,
+    total_passes INTEGER,
+    average_running_position REAL,
+    irating INTEGER,
+    status TEXT,
+    car_id INTEGER,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (race_id) REFERENCES races(race_id),
+    FOREIGN KEY (driver_id) REFERENCES drivers(driver_id),
+    UNIQUE(race_id, driver_id)
+);
+CREATE INDEX IF NOT EXISTS idx_race_results_race_id ON race_results(race_id);
+CREATE INDEX IF NOT EXISTS idx_race_results_driver_id ON race_results(driver_id);
+CREATE INDEX IF NOT EXISTS idx_race_results_position ON race_results(finish_position);
+
+-- Table: scrape_log
+CREATE TABLE IF NOT EXISTS scrape_log (
+    log_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    entity_type TEXT NOT NULL CHECK(entity_type IN ('league', 'team', 'driver', 'series', 'season', 'race')),
+    entity_id INTEGER,
+    entity_url TEXT NOT NULL,
+    status TEXT NOT NULL CHECK(status IN ('success', 'failed', 'skipped')),
+    error_message TEXT,
+    duration_ms INTEGER,
+    timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+CREATE INDEX IF NOT EXISTS idx_scrape_log_entity_type ON scrape_log(entity_type);
+CREATE INDEX IF NOT EXISTS idx_scrape_log_status ON scrape_log(status);
+CREATE INDEX IF NOT EXISTS idx_scrape_log_timestamp ON scrape_log(timestamp);
+
+-- Table: schema_alerts
+CREATE TABLE IF NOT EXISTS schema_alerts (
+    alert_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    entity_type TEXT NOT NULL,
+    alert_type TEXT NOT NULL,
+    details TEXT NOT NULL,
+    url TEXT,
+    resolved BOOLEAN DEFAULT 0,
+    timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+CREATE INDEX IF NOT EXISTS idx_schema_alerts_resolved ON schema_alerts(resolved);
+CREATE INDEX IF NOT EXISTS idx_schema_alerts_timestamp ON schema_alerts(timestamp);
+
+COMMIT;
+"""
+
+_UPSERT_LEAGUE_SQL = """
+    INSERT INTO leagues (league_id, name, url, description, scraped_at, updated_at)
+    VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+    ON CONFLICT(league_id) DO UPDATE SET
+        name = excluded.name,
+        url = excluded.url,
+        description = excluded.description,
+        scraped_at = excluded.scraped_at,
+        updated_at = CURRENT_TIMESTAMP
+"""
+
+_UPSERT_SERIES_SQL = """
+    INSERT INTO series (
+        series_id, league_id, name, url, description,
+        created_date, num_seasons, scraped_at, updated_at
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+    ON CONFLICT(series_id) DO UPDATE SET
+        league_id = excluded.league_id,
+        name = excluded.name,
+        url = excluded.url,
+        description = excluded.description,
+        created_date = excluded.created_date,
+        num_seasons = excluded.num_seasons,
+        scraped_at = excluded.scraped_at,
+        updated_at = CURRENT_TIMESTAMP
+"""
+
+_UPSERT_SEASON_SQL = """
+    INSERT INTO seasons (
+        season_id, series_id, name, description, url,
+        scraped_at, updated_at
+    )
+    VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+    ON CONFLICT(season_id) DO UPDATE SET
+        series_id = excluded.series_id,
+        name = excluded.name,
+        description = excluded.description,
+        url = excluded.url,
+        scraped_at = excluded.scraped_at,
+        updated_at = CURRENT_TIMESTAMP
+"""
+
+_UPSERT_RACE_SQL = """
+    INSERT INTO races (
+        schedule_id, season_id, race_number, event_name, date, race_time, practice_time,
+        track_id, track_config_id, track_name, track_type, track_length, track_config_iracing_id,
+        planned_laps, points_race, off_week, night_race, playoff_race,
+        race_duration_minutes, total_laps, leaders, lead_changes, cautions, caution_laps, num_drivers,
+        weather_type, cloud_conditions, temperature_f, humidity_pct, fog_pct,
+        weather_wind_speed, weather_wind_dir, weather_wind_unit,
+        url, is_complete, scraped_at, updated_at
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+    ON CONFLICT(schedule_id) DO UPDATE SET
+        season_id = excluded.season_id,
+        race_number = excluded.race_number,
+        event_name = excluded.event_name,
+        date = excluded.date,
+        race_time = excluded.race_time,
+        practice_time = excluded.practice_time,
+        track_id = excluded.track_id,
+        track_config_id = excluded.track_config_id,
+        track_name = excluded.track_name,
+        track_type = excluded.track_type,
+        track_length = excluded.track_length,
+        track_config_iracing_id = excluded.track_config_iracing_id,
+        planned_laps = excluded.planned_laps,
+        points_race = excluded.points_race,
+        off_week = excluded.off_week,
+        night_race = excluded.night_race,
+        playoff_race = excluded.playoff_race,
+        race_duration_minutes = excluded.race_duration_minutes,
+        total_laps = excluded.total_laps,
+        leaders = excluded.leaders,
+        lead_changes = excluded.lead_changes,
+        cautions = excluded.cautions,
+        caution_laps = excluded.caution_laps,
+        num_drivers = excluded.num_drivers,
+        weather_type = excluded.weather_type,
+        cloud_conditions = excluded.cloud_conditions,
+        temperature_f = excluded.temperature_f,
+        humidity_pct = excluded.humidity_pct,
+        fog_pct = excluded.fog_pct,
+        weather_wind_speed = excluded.weather_wind_speed,
+        weather_wind_dir = excluded.weather_wind_dir,
+        weather_wind_unit = excluded.weather_wind_unit,
+        url = excluded.url,
+        is_complete = excluded.is_complete,
+        scraped_at = excluded.scraped_at,
+        updated_at = CURRENT_TIMESTAMP
+"""
+
+_UPSERT_TEAM_SQL = """
+    INSERT INTO teams (
+        team_id, league_id, name, driver_count, url, scraped_at, updated_at
+    )
+    VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+    ON CONFLICT(team_id) DO UPDATE SET
+        league_id = excluded.league_id,
+        name = excluded.name,
+        driver_count = excluded.driver_count,
+        url = excluded.url,
+        scraped_at = excluded.scraped_at,
+        updated_at = CURRENT_TIMESTAMP
+"""
+
+_UPSERT_DRIVER_SQL = """
+    INSERT INTO drivers (
+        driver_id, league_id, team_id, name, first_name, last_name,
+        car_numbers, primary_number, club, club_id, irating, safety_rating,
+        license_class, url, scraped_at, updated_at
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+    ON CONFLICT(driver_id) DO UPDATE SET
+        league_id = excluded.league_id,
+        team_id = excluded.team_id,
+        name = excluded.name,
+        first_name = excluded.first_name,
+        last_name = excluded.last_name,
+        car_numbers = excluded.car_numbers,
+        primary_number = excluded.primary_number,
+        club = excluded.club,
+        club_id = excluded.club_id,
+        irating = excluded.irating,
+        safety_rating = excluded.safety_rating,
+        license_class = excluded.license_class,
+        url = excluded.url,
+        scraped_at = excluded.scraped_at,
+        updated_at = CURRENT_TIMESTAMP
+"""
+
+_UPSERT_RACE_RESULT_SQL = """
+    INSERT INTO race_results (
+        race_id, driver_id, team, finish_position, starting_position, car_number,
+        qualifying_time, fastest_lap, fastest_lap_number, average_lap, interval,
+        laps_completed, laps_led, incident_points, race_points, bonus_points,
+        penalty_points, total_points,
+        fast_laps, quality_passes, closing_passes, total_passes, average_running_position,
+        irating, status, car_id, updated_at
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+    ON CONFLICT(race_id, driver_id) DO UPDATE SET
+        team = excluded.team,
+        finish_position = excluded.finish_position,
+        starting_position = excluded.starting_position,
+        car_number = excluded.car_number,
+        qualifying_time = excluded.qualifying_time,
+        fastest_lap = excluded.fastest_lap,
+        fastest_lap_number = excluded.fastest_lap_number,
+        average_lap = excluded.average_lap,
+        interval = excluded.interval,
+        laps_completed = excluded.laps_completed,
+        laps_led = excluded.laps_led,
+        incident_points = excluded.incident_points,
+        race_points = excluded.race_points,
+        bonus_points = excluded.bonus_points,
+        penalty_points = excluded.penalty_points,
+        total_points = excluded.total_points,
+        fast_laps = excluded.fast_laps,
+        quality_passes = excluded.quality_passes,
+        closing_passes = excluded.closing_passes,
+        total_passes = excluded.total_passes,
+        average_running_position = excluded.average_running_position,
+        irating = excluded.irating,
+        status = excluded.status,
+        car_id = excluded.car_id,
+        updated_at = CURRENT_TIMESTAMP
+"""
+
+
+def _series_params(series_id: int, league_id: int, data: dict) -> tuple:
+    """
+    Build the _UPSERT_SERIES_SQL parameters for one series.
+
+    Raises:
+        ValueError: If name, url, or scraped_at is missing
+    """
+    # Required fields
+    name = data.get("name")
+    url = data.get("url")
+    scraped_at = data.get("scraped_at")
+
+    if not name or not url or not scraped_at:
+        raise ValueError("name, url, and scraped_at are required fields")
+
+    return (
+        series_id,
+        league_id,
+        name,
+        url,
+        data.get("description"),
+        data.get("created_date"),
+        data.get("num_seasons"),
+        scraped_at,
+    )
+
+
+def _driver_params(driver_id: int, league_id: int, data: dict) -> tuple:
+    """
+    Build the _UPSERT_DRIVER_SQL parameters for one driver.
+
+    Raises:
+        ValueError: If name, url, or scraped_at is missing
+    """
+    # Required fields
+    name = data.get("name")
+    url = data.get("url")
+    scraped_at = data.get("scraped_at")
+
+    if not name or not url or not scraped_at:
+        raise ValueError("name, url, and scraped_at are required fields")
+
+    return (
+        driver_id,
+        league_id,
+        data.get("team_id"),
+        name,
+        data.get("first_name"),
+        data.get("last_name"),
+        data.get("car_numbers"),
+        data.get("primary_number"),
+        data.get("club"),
+        data.get("club_id"),
+        data.get("irating"),
+        data.get("safety_rating"),
+        data.get("license_class"),
+        url,
+        scraped_at,
+    )
+
+
+def _race_result_params(race_id: int, driver_id: int, data: dict) -> tuple:
+    """Build the _UPSERT_RACE_RESULT_SQL parameters for one result (all fields optional)."""
+    return (
+        race_id,
+        driver_id,
+        data.get("team"),
+        data.get("finish_position"),
+        data.get("starting_position"),
+        data.get("car_number"),
+        data.get("qualifying_time"),
+        data.get("fastest_lap"),
+        data.get("fastest_lap_number"),
+        data.get("average_lap"),
+        data.get("interval"),
+        data.get("laps_completed"),
+        data.get("laps_led"),
+        data.get("incident_points"),
+        data.get("race_points"),
+        data.get("bonus_points"),
+        data.get("penalty_points"),
+        data.get("total_points"),
+        data.get("fast_laps"),
+        data.get("quality_passes"),
+        data.get("closing_passes"),
+        data.get("total_passes"),
+        data.get("average_running_position"),
+        data.get("irating"),
+        data.get("status"),
+        data.get("car_id"),
+    )
 
 
 class Database:
-    """SQLite database manager for SimRacer scraper."""
+    """SQLite database manager for SimRacer scraper.
+
+    Every query method starts with a "self.conn is None" check and raises
+    RuntimeError("Database not connected") before touching SQLite.
+    """
 
     def __init__(self, db_path: str = ":memory:"):
         """
@@ -15,6 +511,7 @@ class Database:
         """
         self.db_path = db_path
         self.conn: sqlite3.Connection | None = None
+        self._transaction_depth = 0
 
     def __enter__(self):
         """Context manager entry."""
@@ -31,278 +528,68 @@ class Database:
         self.conn.row_factory = sqlite3.Row
         # Enable foreign keys
         self.conn.execute("PRAGMA foreign_keys = ON")
+        # WAL + synchronous=NORMAL: commits append to the log instead of
+        # fsyncing the main file (no-op for in-memory databases)
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.execute("PRAGMA synchronous = NORMAL")
 
-    def close(self):
-        """Close database connection."""
-        if self.conn:
-            self.conn.close()
-            self.conn = None
-
-    def initialize_schema(self):
-        """Create all tables and indexes."""
-        if not self.conn:
-            raise RuntimeError("Database not connected")
-
-        cursor = self.conn.cursor()
-
-        # Table: leagues
-        cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS leagues (
-                league_id INTEGER PRIMARY KEY,
-                name TEXT NOT NULL,
-                description TEXT,
-                url TEXT NOT NULL UNIQUE,
-                scraped_at TIMESTAMP NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
         """
-        )
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_leagues_url ON leagues(url)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_leagues_scraped_at ON leagues(scraped_at)")
+        Group writes into a single transaction (one commit instead of one per upsert).
 
-        # Table: teams
-        cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS teams (
-                team_id INTEGER PRIMARY KEY,
-                league_id INTEGER NOT NULL,
-                name TEXT NOT NULL,
-                driver_count INTEGER,
-                url TEXT,
-                scraped_at TIMESTAMP NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (league_id) REFERENCES leagues(league_id)
-            )
-        """
-        )
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_teams_league_id ON teams(league_id)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_teams_scraped_at ON teams(scraped_at)")
+        Upserts made inside the block skip their own commit. Commits on success,
+        rolls back on exception. Nested blocks join the outermost transaction.
 
-        # Table: drivers
-        cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS drivers (
-                driver_id INTEGER PRIMARY KEY,
-                league_id INTEGER NOT NULL,
-                team_id INTEGER,
-                name TEXT NOT NULL,
-                first_name TEXT,
-                last_name TEXT,
-                car_numbers TEXT,
-                primary_number TEXT,
-                club TEXT,
-                club_id INTEGER,
-                irating INTEGER,
-                safety_rating REAL,
-                license_class TEXT,
-                url TEXT NOT NULL UNIQUE,
-                scraped_at TIMESTAMP NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (league_id) REFERENCES leagues(league_id),
-                FOREIGN KEY (team_id) REFERENCES teams(team_id)
-            )
-        """
-        )
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_drivers_league_id ON drivers(league_id)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_drivers_team_id ON drivers(team_id)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_drivers_url ON drivers(url)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_drivers_name ON drivers(name)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_drivers_scraped_at ON drivers(scraped_at)")
+        Yields:
+            The underlying sqlite3 connection
 
-        # Table: series
-        cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS series (
-                series_id INTEGER PRIMARY KEY,
-                league_id INTEGER NOT NULL,
-                name TEXT NOT NULL,
-                description TEXT,
-                created_date DATE,
-                num_seasons INTEGER,
-                url TEXT NOT NULL UNIQUE,
-                scraped_at TIMESTAMP NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (league_id) REFERENCES leagues(league_id)
-            )
+        Raises:
+            RuntimeError: If database not connected
         """
-        )
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_series_league_id ON series(league_id)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_series_url ON series(url)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_series_scraped_at ON series(scraped_at)")
+        if self.conn is None:
+            raise RuntimeError("Database not connected")
 
-        # Table: seasons
-        cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS seasons (
-                season_id INTEGER PRIMARY KEY,
-                series_id INTEGER NOT NULL,
-                name TEXT NOT NULL,
-                description TEXT,
-                url TEXT NOT NULL UNIQUE,
-                scraped_at TIMESTAMP NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (series_id) REFERENCES series(series_id)
-            )
-        """
-        )
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_seasons_series_id ON seasons(series_id)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_seasons_url ON seasons(url)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_seasons_scraped_at ON seasons(scraped_at)")
+        self._transaction_depth += 1
+        try:
+            yield self.conn
+        except BaseException:
+            self._transaction_depth -= 1
+            if self._transaction_depth == 0:
+                self.conn.rollback()
+            raise
+        self._transaction_depth -= 1
+        if self._transaction_depth == 0:
+            self.conn.commit()
+
+    def _commit(self):
+        """Commit pending writes unless inside a transaction() block."""
+        if self._transaction_depth == 0:
+            self.conn.commit()
 
-        # Table: races
-        cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS races (
-                race_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                schedule_id INTEGER NOT NULL UNIQUE,
-                season_id INTEGER NOT NULL,
-                race_number INTEGER NOT NULL,
-                event_name TEXT,
-                date TIMESTAMP,
-                race_time TEXT,
-                practice_time TEXT,
-                track_id INTEGER,
-                track_config_id INTEGER,
-                track_name TEXT,
-                track_type TEXT,
-                track_length REAL,
-                track_config_iracing_id TEXT,
-                planned_laps INTEGER,
-                points_race BOOLEAN,
-                off_week BOOLEAN,
-                night_race BOOLEAN,
-                playoff_race BOOLEAN,
-                race_duration_minutes INTEGER,
-                total_laps INTEGER,
-                leaders INTEGER,
-                lead_changes INTEGER,
-                cautions INTEGER,
-                caution_laps INTEGER,
-                num_drivers INTEGER,
-                weather_type TEXT,
-                cloud_conditions TEXT,
-                temperature_f INTEGER,
-                humidity_pct INTEGER,
-                fog_pct INTEGER,
-                weather_wind_speed TEXT,
-                weather_wind_dir TEXT,
-                weather_wind_unit TEXT,
-                url TEXT NOT NULL UNIQUE,
-                is_complete BOOLEAN DEFAULT 0,
-                scraped_at TIMESTAMP NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (season_id) REFERENCES seasons(season_id)
-            )
-        """
-        )
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_races_schedule_id ON races(schedule_id)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_races_season_id ON races(season_id)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_races_url ON races(url)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_races_date ON races(date)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_races_is_complete ON races(is_complete)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_races_scraped_at ON races(scraped_at)")
-
-        # Table: race_results
-        cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS race_results (
-                result_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                race_id INTEGER NOT NULL,
-                driver_id INTEGER NOT NULL,
-                team TEXT,
-                finish_position INTEGER,
-                starting_position INTEGER,
-                car_number TEXT,
-                qualifying_time TEXT,
-                fastest_lap TEXT,
-                fastest_lap_number INTEGER,
-                average_lap TEXT,
-                interval TEXT,
-                laps_completed INTEGER,
-                laps_led INTEGER,
-                incident_points INTEGER,
-                race_points INTEGER,
-                bonus_points INTEGER,
-                penalty_points INTEGER,
-                total_points INTEGER,
-                fast_laps INTEGER,
-                quality_passes INTEGER,
-                closing_passes INTEGER,
-                total_passes INTEGER,
-                average_running_position REAL,
-                irating INTEGER,
-                status TEXT,
-                car_id INTEGER,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (race_id) REFERENCES races(race_id),
-                FOREIGN KEY (driver_id) REFERENCES drivers(driver_id),
-                UNIQUE(race_id, driver_id)
-            )
-        """
-        )
-        cursor.execute(
-            "CREATE INDEX IF NOT EXISTS idx_race_results_race_id ON race_results(race_id)"
-        )
-        cursor.execute(
-            "CREATE INDEX IF NOT EXISTS idx_race_results_driver_id ON race_results(driver_id)"
-        )
-        cursor.execute(
-            "CREATE INDEX IF NOT EXISTS idx_race_results_position ON race_results(finish_position)"
-        )
+    def close(self):
+        """Close database connection."""
+        if self.conn is not None:
+            # Refresh planner statistics the session showed to be stale (usually a no-op)
+            try:
+                self.conn.execute("PRAGMA optimize")
+            except sqlite3.Error:
+                pass  # Best effort - never block closing
+            self.conn.close()
+            self.conn = None
 
-        # Table: scrape_log
-        cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS scrape_log (
-                log_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                entity_type TEXT NOT NULL CHECK(entity_type IN ('league', 'team', 'driver', 'series', 'season', 'race')),
-                entity_id INTEGER,
-                entity_url TEXT NOT NULL,
-                status TEXT NOT NULL CHECK(status IN ('success', 'failed', 'skipped')),
-                error_message TEXT,
-                duration_ms INTEGER,
-                timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
+    def initialize_schema(self):
         """
-        )
-        cursor.execute(
-            "CREATE INDEX IF NOT EXISTS idx_scrape_log_entity_type ON scrape_log(entity_type)"
-        )
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_scrape_log_status ON scrape_log(status)")
-        cursor.execute(
-            "CREATE INDEX IF NOT EXISTS idx_scrape_log_timestamp ON scrape_log(timestamp)"
-        )
+        Create all tables and indexes.
 
-        # Table: schema_alerts
-        cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS schema_alerts (
-                alert_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                entity_type TEXT NOT NULL,
-                alert_type TEXT NOT NULL,
-                details TEXT NOT NULL,
-                url TEXT,
-                resolved BOOLEAN DEFAULT 0,
-                timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
+        The DDL runs as one script inside a single transaction. executescript()
+        commits any pending transaction first, so call this outside of a
+        transaction() block.
         """
-        )
-        cursor.execute(
-            "CREATE INDEX IF NOT EXISTS idx_schema_alerts_resolved ON schema_alerts(resolved)"
-        )
-        cursor.execute(
-            "CREATE INDEX IF NOT EXISTS idx_schema_alerts_timestamp ON schema_alerts(timestamp)"
-        )
+        if self.conn is None:
+            raise RuntimeError("Database not connected")
 
-        self.conn.commit()
+        self.conn.executescript(_SCHEMA_SQL)
 
     def upsert_league(self, league_id: int, data: dict) -> int:
         """
@@ -315,7 +602,7 @@ class Database:
         Returns:
             The league_id of the inserted/updated record
         """
-        if not self.conn:
+        if self.conn is None:
             raise RuntimeError("Database not connected")
 
         cursor = self.conn.cursor()
@@ -331,21 +618,9 @@ class Database:
         # Optional fields
         description = data.get("description")
 
-        cursor.execute(
-            """
-            INSERT INTO leagues (league_id, name, url, description, scraped_at, updated_at)
-            VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-            ON CONFLICT(league_id) DO UPDATE SET
-                name = excluded.name,
-                url = excluded.url,
-                description = excluded.description,
-                scraped_at = excluded.scraped_at,
-                updated_at = CURRENT_TIMESTAMP
-        """,
-            (league_id, name, url, description, scraped_at),
-        )
+        cursor.execute(_UPSERT_LEAGUE_SQL, (league_id, name, url, description, scraped_at))
 
-        self.conn.commit()
+        self._commit()
         return league_id
 
     def get_league(self, league_id: int) -> dict | None:
@@ -358,7 +633,7 @@ class Database:
         Returns:
             Dictionary with league data or None if not found
         """
-        if not self.conn:
+        if self.conn is None:
             raise RuntimeError("Database not connected")
 
         cursor = self.conn.cursor()
@@ -379,7 +654,7 @@ class Database:
         Returns:
             Dictionary with league data or None if not found
         """
-        if not self.conn:
+        if self.conn is None:
             raise RuntimeError("Database not connected")
 
         cursor = self.conn.cursor()
@@ -402,55 +677,39 @@ class Database:
         Returns:
             The series_id of the inserted/updated record
         """
-        if not self.conn:
+        if self.conn is None:
             raise RuntimeError("Database not connected")
 
         cursor = self.conn.cursor()
+        cursor.execute(_UPSERT_SERIES_SQL, _series_params(series_id, league_id, data))
 
-        # Required fields
-        name = data.get("name")
-        url = data.get("url")
-        scraped_at = data.get("scraped_at")
+        self._commit()
+        return series_id
 
-        if not name or not url or not scraped_at:
-            raise ValueError("name, url, and scraped_at are required fields")
+    def upsert_series_bulk(self, league_id: int, series: list[dict]) -> int:
+        """
+        Insert or update many series records in one transaction.
 
-        # Optional fields
-        description = data.get("description")
-        created_date = data.get("created_date")
-        num_seasons = data.get("num_seasons")
+        Args:
+            league_id: League ID (foreign key) shared by all series
+            series: Series dictionaries, each with "series_id" plus the
+                fields accepted by upsert_series()
 
-        cursor.execute(
-            """
-            INSERT INTO series (
-                series_id, league_id, name, url, description,
-                created_date, num_seasons, scraped_at, updated_at
-            )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-            ON CONFLICT(series_id) DO UPDATE SET
-                league_id = excluded.league_id,
-                name = excluded.name,
-                url = excluded.url,
-                description = excluded.description,
-                created_date = excluded.created_date,
-                num_seasons = excluded.num_seasons,
-                scraped_at = excluded.scraped_at,
-                updated_at = CURRENT_TIMESTAMP
-        """,
-            (
-                series_id,
-                league_id,
-                name,
-                url,
-                description,
-                created_date,
-                num_seasons,
-                scraped_at,
-            ),
-        )
+        Returns:
+            Number of series records written
 
-        self.conn.commit()
-        return series_id
+        Raises:
+            ValueError: If any series is missing a required field (nothing is written)
+        """
+        if self.conn is None:
+            raise RuntimeError("Database not connected")
+
+        params = [_series_params(s["series_id"], league_id, s) for s in series]
+
+        with self.transaction():
+            self.conn.executemany(_UPSERT_SERIES_SQL, params)
+
+        return len(params)
 
     def get_series(self, series_id: int) -> dict | None:
         """
@@ -462,7 +721,7 @@ class Database:
         Returns:
             Dictionary with series data or None if not found
         """
-        if not self.conn:
+        if self.conn is None:
             raise RuntimeError("Database not connected")
 
         cursor = self.conn.cursor()
@@ -483,7 +742,7 @@ class Database:
         Returns:
             List of dictionaries with series data
         """
-        if not self.conn:
+        if self.conn is None:
             raise RuntimeError("Database not connected")
 
         cursor = self.conn.cursor()
@@ -504,7 +763,7 @@ class Database:
         Returns:
             The season_id of the inserted/updated record
         """
-        if not self.conn:
+        if self.conn is None:
             raise RuntimeError("Database not connected")
 
         cursor = self.conn.cursor()
@@ -521,20 +780,7 @@ class Database:
         description = data.get("description")
 
         cursor.execute(
-            """
-            INSERT INTO seasons (
-                season_id, series_id, name, description, url,
-                scraped_at, updated_at
-            )
-            VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-            ON CONFLICT(season_id) DO UPDATE SET
-                series_id = excluded.series_id,
-                name = excluded.name,
-                description = excluded.description,
-                url = excluded.url,
-                scraped_at = excluded.scraped_at,
-                updated_at = CURRENT_TIMESTAMP
-        """,
+            _UPSERT_SEASON_SQL,
             (
                 season_id,
                 series_id,
@@ -545,7 +791,7 @@ class Database:
             ),
         )
 
-        self.conn.commit()
+        self._commit()
         return season_id
 
     def get_season(self, season_id: int) -> dict | None:
@@ -558,7 +804,7 @@ class Database:
         Returns:
             Dictionary with season data or None if not found
         """
-        if not self.conn:
+        if self.conn is None:
             raise RuntimeError("Database not connected")
 
         cursor = self.conn.cursor()
@@ -579,7 +825,7 @@ class Database:
         Returns:
             List of dictionaries with season data
         """
-        if not self.conn:
+        if self.conn is None:
             raise RuntimeError("Database not connected")
 
         cursor = self.conn.cursor()
@@ -600,7 +846,7 @@ class Database:
         Returns:
             The race_id (auto-increment) of the inserted/updated record
         """
-        if not self.conn:
+        if self.conn is None:
             raise RuntimeError("Database not connected")
 
         cursor = self.conn.cursor()
@@ -647,55 +893,7 @@ class Database:
         is_complete = data.get("is_complete", False)
 
         cursor.execute(
-            """
-            INSERT INTO races (
-                schedule_id, season_id, race_number, event_name, date, race_time, practice_time,
-                track_id, track_config_id, track_name, track_type, track_length, track_config_iracing_id,
-                planned_laps, points_race, off_week, night_race, playoff_race,
-                race_duration_minutes, total_laps, leaders, lead_changes, cautions, caution_laps, num_drivers,
-                weather_type, cloud_conditions, temperature_f, humidity_pct, fog_pct,
-                weather_wind_speed, weather_wind_dir, weather_wind_unit,
-                url, is_complete, scraped_at, updated_at
-            )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-            ON CONFLICT(schedule_id) DO UPDATE SET
-                season_id = excluded.season_id,
-                race_number = excluded.race_number,
-                event_name = excluded.event_name,
-                date = excluded.date,
-                race_time = excluded.race_time,
-                practice_time = excluded.practice_time,
-                track_id = excluded.track_id,
-                track_config_id = excluded.track_config_id,
-                track_name = excluded.track_name,
-                track_type = excluded.track_type,
-                track_length = excluded.track_length,
-                track_config_iracing_id = excluded.track_config_iracing_id,
-                planned_laps = excluded.planned_laps,
-                points_race = excluded.points_race,
-                off_week = excluded.off_week,
-                night_race = excluded.night_race,
-                playoff_race = excluded.playoff_race,
-                race_duration_minutes = excluded.race_duration_minutes,
-                total_laps = excluded.total_laps,
-                leaders = excluded.leaders,
-                lead_changes = excluded.lead_changes,
-                cautions = excluded.cautions,
-                caution_laps = excluded.caution_laps,
-                num_drivers = excluded.num_drivers,
-                weather_type = excluded.weather_type,
-                cloud_conditions = excluded.cloud_conditions,
-                temperature_f = excluded.temperature_f,
-                humidity_pct = excluded.humidity_pct,
-                fog_pct = excluded.fog_pct,
-                weather_wind_speed = excluded.weather_wind_speed,
-                weather_wind_dir = excluded.weather_wind_dir,
-                weather_wind_unit = excluded.weather_wind_unit,
-                url = excluded.url,
-                is_complete = excluded.is_complete,
-                scraped_at = excluded.scraped_at,
-                updated_at = CURRENT_TIMESTAMP
-        """,
+            _UPSERT_RACE_SQL,
             (
                 schedule_id,
                 season_id,
@@ -736,7 +934,7 @@ class Database:
             ),
         )
 
-        self.conn.commit()
+        self._commit()
         return cursor.lastrowid
 
     def get_race(self, schedule_id: int) -> dict | None:
@@ -749,7 +947,7 @@ class Database:
         Returns:
             Dictionary with race data or None if not found
         """
-        if not self.conn:
+        if self.conn is None:
             raise RuntimeError("Database not connected")
 
         cursor = self.conn.cursor()
@@ -770,7 +968,7 @@ class Database:
         Returns:
             List of dictionaries with race data
         """
-        if not self.conn:
+        if self.conn is None:
             raise RuntimeError("Database not connected")
 
         cursor = self.conn.cursor()
@@ -789,7 +987,7 @@ class Database:
         Returns:
             True if race exists and is_complete=1, False otherwise
         """
-        if not self.conn:
+        if self.conn is None:
             raise RuntimeError("Database not connected")
 
         cursor = self.conn.cursor()
@@ -808,7 +1006,7 @@ class Database:
         Returns:
             List of dictionaries with race data for incomplete races
         """
-        if not self.conn:
+        if self.conn is None:
             raise RuntimeError("Database not connected")
 
         cursor = self.conn.cursor()
@@ -832,7 +1030,7 @@ class Database:
         Returns:
             The team_id of the inserted/updated record
         """
-        if not self.conn:
+        if self.conn is None:
             raise RuntimeError("Database not connected")
 
         cursor = self.conn.cursor()
@@ -848,24 +1046,9 @@ class Database:
         url = data.get("url")
         driver_count = data.get("driver_count")
 
-        cursor.execute(
-            """
-            INSERT INTO teams (
-                team_id, league_id, name, driver_count, url, scraped_at, updated_at
-            )
-            VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-            ON CONFLICT(team_id) DO UPDATE SET
-                league_id = excluded.league_id,
-                name = excluded.name,
-                driver_count = excluded.driver_count,
-                url = excluded.url,
-                scraped_at = excluded.scraped_at,
-                updated_at = CURRENT_TIMESTAMP
-        """,
-            (team_id, league_id, name, driver_count, url, scraped_at),
-        )
+        cursor.execute(_UPSERT_TEAM_SQL, (team_id, league_id, name, driver_count, url, scraped_at))
 
-        self.conn.commit()
+        self._commit()
         return team_id
 
     def get_team(self, team_id: int) -> dict | None:
@@ -878,7 +1061,7 @@ class Database:
         Returns:
             Dictionary with team data or None if not found
         """
-        if not self.conn:
+        if self.conn is None:
             raise RuntimeError("Database not connected")
 
         cursor = self.conn.cursor()
@@ -899,7 +1082,7 @@ class Database:
         Returns:
             List of dictionaries with team data
         """
-        if not self.conn:
+        if self.conn is None:
             raise RuntimeError("Database not connected")
 
         cursor = self.conn.cursor()
@@ -920,77 +1103,39 @@ class Database:
         Returns:
             The driver_id of the inserted/updated record
         """
-        if not self.conn:
+        if self.conn is None:
             raise RuntimeError("Database not connected")
 
         cursor = self.conn.cursor()
+        cursor.execute(_UPSERT_DRIVER_SQL, _driver_params(driver_id, league_id, data))
 
-        # Required fields
-        name = data.get("name")
-        url = data.get("url")
-        scraped_at = data.get("scraped_at")
+        self._commit()
+        return driver_id
 
-        if not name or not url or not scraped_at:
-            raise ValueError("name, url, and scraped_at are required fields")
+    def upsert_drivers_bulk(self, league_id: int, drivers: list[dict]) -> int:
+        """
+        Insert or update many driver records in one transaction.
 
-        # Optional fields
-        team_id = data.get("team_id")
-        first_name = data.get("first_name")
-        last_name = data.get("last_name")
-        car_numbers = data.get("car_numbers")
-        primary_number = data.get("primary_number")
-        club = data.get("club")
-        club_id = data.get("club_id")
-        irating = data.get("irating")
-        safety_rating = data.get("safety_rating")
-        license_class = data.get("license_class")
+        Args:
+            league_id: League ID (foreign key) shared by all drivers
+            drivers: Driver dictionaries, each with "driver_id" plus the
+                fields accepted by upsert_driver()
 
-        cursor.execute(
-            """
-            INSERT INTO drivers (
-                driver_id, league_id, team_id, name, first_name, last_name,
-                car_numbers, primary_number, club, club_id, irating, safety_rating,
-                license_class, url, scraped_at, updated_at
-            )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-            ON CONFLICT(driver_id) DO UPDATE SET
-                league_id = excluded.league_id,
-                team_id = excluded.team_id,
-                name = excluded.name,
-                first_name = excluded.first_name,
-                last_name = excluded.last_name,
-                car_numbers = excluded.car_numbers,
-                primary_number = excluded.primary_number,
-                club = excluded.club,
-                club_id = excluded.club_id,
-                irating = excluded.irating,
-                safety_rating = excluded.safety_rating,
-                license_class = excluded.license_class,
-                url = excluded.url,
-                scraped_at = excluded.scraped_at,
-                updated_at = CURRENT_TIMESTAMP
-        """,
-            (
-                driver_id,
-                league_id,
-                team_id,
-                name,
-                first_name,
-                last_name,
-                car_numbers,
-                primary_number,
-                club,
-                club_id,
-                irating,
-                safety_rating,
-                license_class,
-                url,
-                scraped_at,
-            ),
-        )
+        Returns:
+            Number of driver records written
 
-        self.conn.commit()
-        return driver_id
+        Raises:
+            ValueError: If any driver is missing a required field (nothing is written)
+        """
+        if self.conn is None:
+            raise RuntimeError("Database not connected")
+
+        params = [_driver_params(d["driver_id"], league_id, d) for d in drivers]
+
+        with self.transaction():
+            self.conn.executemany(_UPSERT_DRIVER_SQL, params)
+
+        return len(params)
 
     def get_driver(self, driver_id: int) -> dict | None:
         """
@@ -1002,7 +1147,7 @@ class Database:
         Returns:
             Dictionary with driver data or None if not found
         """
-        if not self.conn:
+        if self.conn is None:
             raise RuntimeError("Database not connected")
 
         cursor = self.conn.cursor()
@@ -1020,7 +1165,7 @@ class Database:
         Returns:
             List of dictionaries with driver data
         """
-        if not self.conn:
+        if self.conn is None:
             raise RuntimeError("Database not connected")
 
         cursor = self.conn.cursor()
@@ -1039,7 +1184,7 @@ class Database:
         Returns:
             List of dictionaries with driver data
         """
-        if not self.conn:
+        if self.conn is None:
             raise RuntimeError("Database not connected")
 
         cursor = self.conn.cursor()
@@ -1059,7 +1204,7 @@ class Database:
         Returns:
             List of dictionaries with driver data matching the name
         """
-        if not self.conn:
+        if self.conn is None:
             raise RuntimeError("Database not connected")
 
         cursor = self.conn.cursor()
@@ -1089,107 +1234,39 @@ class Database:
         Returns:
             The result_id of the inserted/updated record
         """
-        if not self.conn:
+        if self.conn is None:
             raise RuntimeError("Database not connected")
 
         cursor = self.conn.cursor()
+        cursor.execute(_UPSERT_RACE_RESULT_SQL, _race_result_params(race_id, driver_id, data))
 
-        # All fields are optional for race results
-        team = data.get("team")
-        finish_position = data.get("finish_position")
-        starting_position = data.get("starting_position")
-        car_number = data.get("car_number")
-        qualifying_time = data.get("qualifying_time")
-        fastest_lap = data.get("fastest_lap")
-        fastest_lap_number = data.get("fastest_lap_number")
-        average_lap = data.get("average_lap")
-        interval = data.get("interval")
-        laps_completed = data.get("laps_completed")
-        laps_led = data.get("laps_led")
-        incident_points = data.get("incident_points")
-        race_points = data.get("race_points")
-        bonus_points = data.get("bonus_points")
-        penalty_points = data.get("penalty_points")
-        total_points = data.get("total_points")
-        fast_laps = data.get("fast_laps")
-        quality_passes = data.get("quality_passes")
-        closing_passes = data.get("closing_passes")
-        total_passes = data.get("total_passes")
-        average_running_position = data.get("average_running_position")
-        irating = data.get("irating")
-        status = data.get("status")
-        car_id = data.get("car_id")
+        self._commit()
+        return cursor.lastrowid
 
-        cursor.execute(
-            """
-            INSERT INTO race_results (
-                race_id, driver_id, team, finish_position, starting_position, car_number,
-                qualifying_time, fastest_lap, fastest_lap_number, average_lap, interval,
-                laps_completed, laps_led, incident_points, race_points, bonus_points,
-                penalty_points, total_points,
-                fast_laps, quality_passes, closing_passes, total_passes, average_running_position,
-                irating, status, car_id, updated_at
-            )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-            ON CONFLICT(race_id, driver_id) DO UPDATE SET
-                team = excluded.team,
-                finish_position = excluded.finish_position,
-                starting_position = excluded.starting_position,
-                car_number = excluded.car_number,
-                qualifying_time = excluded.qualifying_time,
-                fastest_lap = excluded.fastest_lap,
-                fastest_lap_number = excluded.fastest_lap_number,
-                average_lap = excluded.average_lap,
-                interval = excluded.interval,
-                laps_completed = excluded.laps_completed,
-                laps_led = excluded.laps_led,
-                incident_points = excluded.incident_points,
-                race_points = excluded.race_points,
-                bonus_points = excluded.bonus_points,
-                penalty_points = excluded.penalty_points,
-                total_points = excluded.total_points,
-                fast_laps = excluded.fast_laps,
-                quality_passes = excluded.quality_passes,
-                closing_passes = excluded.closing_passes,
-                total_passes = excluded.total_passes,
-                average_running_position = excluded.average_running_position,
-                irating = excluded.irating,
-                status = excluded.status,
-                car_id = excluded.car_id,
-                updated_at = CURRENT_TIMESTAMP
-        """,
-            (
-                race_id,
-                driver_id,
-                team,
-                finish_position,
-                starting_position,
-                car_number,
-                qualifying_time,
-                fastest_lap,
-                fastest_lap_number,
-                average_lap,
-                interval,
-                laps_completed,
-                laps_led,
-                incident_points,
-                race_points,
-                bonus_points,
-                penalty_points,
-                total_points,
-                fast_laps,
-                quality_passes,
-                closing_passes,
-                total_passes,
-                average_running_position,
-                irating,
-                status,
-                car_id,
-            ),
-        )
+    def upsert_race_results_bulk(self, race_id: int, results: list[dict]) -> int:
+        """
+        Insert or update all results of a race in one transaction.
 
-        self.conn.commit()
-        return cursor.lastrowid
+        Args:
+            race_id: Race ID (foreign key)
+            results: Result dictionaries, each with "driver_id" plus the
+                fields accepted by upsert_race_result()
+
+        Returns:
+            Number of result records written
+
+        Raises:
+            sqlite3.IntegrityError: If any row is invalid (the whole batch is rolled back)
+        """
+        if self.conn is None:
+            raise RuntimeError("Database not connected")
+
+        params = [_race_result_params(race_id, r["driver_id"], r) for r in results]
+
+        with self.transaction():
+            self.conn.executemany(_UPSERT_RACE_RESULT_SQL, params)
+
+        return len(params)
 
     def get_race_results(self, race_id: int) -> list[dict]:
         """
@@ -1201,7 +1278,7 @@ class Database:
         Returns:
             List of dictionaries with race result data, ordered by finish position
         """
-        if not self.conn:
+        if self.conn is None:
             raise RuntimeError("Database not connected")
 
         cursor = self.conn.cursor()
@@ -1222,7 +1299,7 @@ class Database:
         Returns:
             List of dictionaries with race result data
         """
-        if not self.conn:
+        if self.conn is None:
             raise RuntimeError("Database not connected")
 
         cursor = self.conn.cursor()
@@ -1247,23 +1324,13 @@ class Database:
         Returns:
             Tuple of (should_scrape: bool, reason: str)
         """
-        if not self.conn:
+        if self.conn is None:
             raise RuntimeError("Database not connected")
 
-        # Map entity types to tables and ID columns
-        table_map = {
-            "league": ("leagues", "league_id"),
-            "series": ("series", "series_id"),
-            "season": ("seasons", "season_id"),
-            "race": ("races", "schedule_id"),
-            "team": ("teams", "team_id"),
-            "driver": ("drivers", "driver_id"),
-        }
-
-        if entity_type not in table_map:
+        if entity_type not in _VALID_ENTITY_TYPES:
             raise ValueError(f"Unknown entity type: {entity_type}")
 
-        table, id_col = table_map[entity_type]
+        table, id_col = _ENTITY_TABLES[entity_type]
         cursor = self.conn.cursor()
 
         # Tables that have status column
@@ -1290,8 +1357,6 @@ class Database:
             return False, "cache_valid_indefinitely"
 
         # Check if cache is stale based on time
-        from datetime import datetime
-
         try:
             scraped_time = datetime.fromisoformat(scraped_at)
             age_hours = (datetime.now() - scraped_time).total_seconds() / 3600
@@ -1341,27 +1406,16 @@ class Database:
             >>> db.is_url_cached("http://test.com/league/1558", "league", max_age_days=None)
             True  # URL exists, age doesn't matter (indefinite cache)
         """
-        if not self.conn:
+        if self.conn is None:
             raise RuntimeError("Database not connected. Use 'with Database()' or call connect()")
 
         # Validate entity_type
-        valid_types = ["league", "series", "season", "race", "driver", "team"]
-        if entity_type not in valid_types:
+        if entity_type not in _VALID_ENTITY_TYPES:
             raise ValueError(
-                f"Invalid entity_type '{entity_type}'. Must be one of: {', '.join(valid_types)}"
+                f"Invalid entity_type '{entity_type}'. Must be one of: {', '.join(_ENTITY_TABLES)}"
             )
 
-        # Map entity type to table and URL column
-        table_map = {
-            "league": "leagues",
-            "series": "series",
-            "season": "seasons",
-            "race": "races",
-            "driver": "drivers",
-            "team": "teams",
-        }
-
-        table = table_map[entity_type]
+        table = _ENTITY_TABLES[entity_type][0]
 
         # Query for URL and scraped_at timestamp
         cursor = self.conn.execute(f"SELECT scraped_at FROM {table} WHERE url = ?", (url,))
@@ -1382,8 +1436,6 @@ class Database:
             return False
 
         try:
-            from datetime import datetime
-
             scraped_time = datetime.fromisoformat(scraped_at)
             age_days = (datetime.now() - scraped_time).total_seconds() / 86400  # seconds in a day
 
@@ -1453,7 +1505,7 @@ class Database:
             ... )
             3
         """
-        if not self.conn:
+        if self.conn is None:
             raise RuntimeError("Database not connected. Use 'with Database()' or call connect()")
 
         # Validate required fields
@@ -1461,17 +1513,15 @@ class Database:
             raise ValueError("entity_url and status are required fields")
 
         # Validate entity_type
-        valid_entity_types = ["league", "series", "season", "race", "driver", "team"]
-        if entity_type not in valid_entity_types:
+        if entity_type not in _VALID_ENTITY_TYPES:
             raise ValueError(
-                f"Invalid entity_type '{entity_type}'. Must be one of: {', '.join(valid_entity_types)}"
+                f"Invalid entity_type '{entity_type}'. Must be one of: {', '.join(_ENTITY_TABLES)}"
             )
 
         # Validate status
-        valid_statuses = ["success", "failed", "skipped"]
-        if status not in valid_statuses:
+        if status not in _VALID_SCRAPE_STATUSES:
             raise ValueError(
-                f"Invalid status '{status}'. Must be one of: {', '.join(valid_statuses)}"
+                f"Invalid status '{status}'. Must be one of: {', '.join(_VALID_SCRAPE_STATUSES)}"
             )
 
         # Insert log record
@@ -1483,6 +1533,6 @@ class Database:
             """,
             (entity_type, entity_id, entity_url, status, error_msg, duration_ms),
         )
-        self.conn.commit()
+        self._commit()
 
         return cursor.lastrowid
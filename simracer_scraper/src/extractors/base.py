@@ -8,17 +8,53 @@ This module provides the BaseExtractor class that handles:
 - Common extraction utilities
 """
 
+import gzip
+import hashlib
+import os
 import random
+import tempfile
 import time
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 import requests
-from bs4 import BeautifulSoup
-from playwright.sync_api import sync_playwright
+from bs4 import BeautifulSoup, SoupStrainer
 
 if TYPE_CHECKING:
+    from playwright.sync_api import Browser, Page, Playwright
+
     from ..utils.browser_manager import BrowserManager
 
+# BeautifulSoup tree builder for fetched pages (lxml is a C parser, much faster
+# than the pure-Python html.parser on full race pages)
+HTML_PARSER = "lxml"
+
+# Opt-in development cache: when set, fetched pages are stored gzipped on disk
+# keyed by URL and fetch mode, and served from there on later runs (no request,
+# no rendering)
+PAGE_CACHE_ENV = "OBRL_TEST_CACHE"
+PAGE_CACHE_DIR = Path.home() / ".cache" / "obrl" / "pages"
+
+
+def _page_cache_path(url: str, render_js: bool) -> Path | None:
+    """Return the disk cache file for a URL, or None if the cache is disabled.
+
+    Static and rendered fetches of the same URL are cached separately.
+    """
+    if os.environ.get(PAGE_CACHE_ENV, "") in ("", "0"):
+        return None
+    key = f"{'rendered' if render_js else 'static'}:{url}"
+    return PAGE_CACHE_DIR / f"{hashlib.sha256(key.encode()).hexdigest()}.html.gz"
+
+
+def _response_text(response: requests.Response) -> str:
+    """Decode a static response body, defaulting to UTF-8 when no charset is declared."""
+    # Without a charset in Content-Type, requests falls back to ISO-8859-1 for
+    # text/* responses (and charset detection otherwise) - SimRacerHub pages are UTF-8
+    if "charset=" not in response.headers.get("Content-Type", "").lower():
+        response.encoding = "utf-8"
+    return response.text
+
 
 class BaseExtractor:
     """Base class for extractors with HTTP fetching and parsing utilities.
@@ -75,11 +111,12 @@ class BaseExtractor:
         self.render_js = render_js
         self._browser_manager = browser_manager
         self.user_agent = user_agent or "SimRacerScraper/1.0 (Educational purposes; +https://github.com/yourusername/simracer_scraper)"
-        self._last_request_time = 0  # Fallback for standalone use
-        self._playwright = None
-        self._browser = None
+        # Monotonic time of the last standalone request (None: no request yet)
+        self._last_request_time: float | None = None
+        self._playwright: Playwright | None = None
+        self._browser: Browser | None = None
 
-    def fetch_page(self, url: str) -> BeautifulSoup:
+    def fetch_page(self, url: str, parse_only: SoupStrainer | None = None) -> BeautifulSoup:
         """Fetch and parse a page with rate limiting and retries.
 
         Chooses between static HTTP fetching (fast) or browser rendering (slow)
@@ -87,6 +124,8 @@ class BaseExtractor:
 
         Args:
             url: URL to fetch
+            parse_only: Optional SoupStrainer limiting which elements are built
+                into the tree (skips DOM construction for the rest of the page)
 
         Returns:
             BeautifulSoup object of parsed HTML
@@ -96,20 +135,89 @@ class BaseExtractor:
             requests.exceptions.Timeout: If request times out after retries
             Exception: If browser rendering fails
         """
+        if _page_cache_path(url, self.render_js):
+            # Development cache stores pages as UTF-8 - parse them here
+            return BeautifulSoup(
+                self.fetch_raw(url), HTML_PARSER, parse_only=parse_only, from_encoding="utf-8"
+            )
+
+        if self.render_js:
+            return self._fetch_with_browser(url, parse_only)
+        else:
+            return self._fetch_static(url, parse_only)
+
+    def fetch_raw(self, url: str) -> bytes:
+        """Fetch a page's HTML without parsing it.
+
+        Same rate limiting, retries, and static/browser choice as fetch_page(),
+        for callers that store the page or parse it themselves. Served from the
+        disk cache when OBRL_TEST_CACHE is set.
+
+        Args:
+            url: URL to fetch
+
+        Returns:
+            HTML encoded as UTF-8 (static pages are first decoded with their
+            Content-Type charset, so cached and fresh fetches parse the same)
+
+        Raises:
+            requests.exceptions.RequestException: If request fails after retries
+            Exception: If browser rendering fails
+        """
+        cache_path = _page_cache_path(url, self.render_js)
+        if cache_path:
+            try:
+                return gzip.decompress(cache_path.read_bytes())
+            except (OSError, EOFError):
+                pass  # Not cached yet, or a corrupt entry (BadGzipFile is an OSError)
+
         if self.render_js:
-            return self._fetch_with_browser(url)
+            raw = self._render_with_retries(url).encode()
         else:
-            return self._fetch_static(url)
+            raw = _response_text(self._get_with_retries(url)).encode("utf-8")
+
+        if cache_path:
+            # Write to a temp file and rename so an interrupted run never leaves a
+            # truncated entry behind
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = tempfile.NamedTemporaryFile(dir=cache_path.parent, suffix=".tmp", delete=False)
+            try:
+                with tmp:
+                    tmp.write(gzip.compress(raw))
+                os.replace(tmp.name, cache_path)
+            except BaseException:
+                Path(tmp.name).unlink(missing_ok=True)
+                raise
+
+        return raw
 
-    def _fetch_static(self, url: str) -> BeautifulSoup:
+    def _fetch_static(self, url: str, parse_only: SoupStrainer | None = None) -> BeautifulSoup:
         """Fetch page with static HTTP request (fast, no JavaScript).
 
         Args:
             url: URL to fetch
+            parse_only: Optional SoupStrainer passed through to BeautifulSoup
 
         Returns:
             BeautifulSoup object of parsed HTML
 
+        Raises:
+            requests.exceptions.RequestException: If request fails after retries
+        """
+        response = self._get_with_retries(url)
+
+        # Parse with BeautifulSoup
+        return BeautifulSoup(_response_text(response), HTML_PARSER, parse_only=parse_only)
+
+    def _get_with_retries(self, url: str) -> requests.Response:
+        """Rate-limited HTTP GET with retries and exponential backoff.
+
+        Args:
+            url: URL to fetch
+
+        Returns:
+            Successful response
+
         Raises:
             requests.exceptions.RequestException: If request fails after retries
         """
@@ -128,10 +236,9 @@ class BaseExtractor:
                 response.raise_for_status()
 
                 # Update last request time
-                self._last_request_time = time.time()
+                self._last_request_time = time.monotonic()
 
-                # Parse with BeautifulSoup
-                return BeautifulSoup(response.text, "html.parser")
+                return response
 
             except (
                 requests.exceptions.RequestException,
@@ -153,15 +260,18 @@ class BaseExtractor:
             raise last_exception
         raise requests.exceptions.RequestException("Unknown error during fetch")
 
-    def _fetch_with_browser(self, url: str) -> BeautifulSoup:
+    def _fetch_with_browser(
+        self, url: str, parse_only: SoupStrainer | None = None
+    ) -> BeautifulSoup:
         """Fetch page with browser rendering (slow, executes JavaScript).
 
         Uses Playwright to render JavaScript before parsing. If browser_manager
-        is provided, uses the shared browser instance. Otherwise, creates and
-        manages its own browser for standalone use.
+        is provided, borrows a page from its shared context pool. Otherwise,
+        creates and manages its own browser for standalone use.
 
         Args:
             url: URL to fetch
+            parse_only: Optional SoupStrainer passed through to BeautifulSoup
 
         Returns:
             BeautifulSoup object of parsed HTML (after JS execution)
@@ -169,50 +279,53 @@ class BaseExtractor:
         Raises:
             Exception: If browser rendering fails
         """
+        html = self._render_with_retries(url)
+
+        # Parse with BeautifulSoup
+        return BeautifulSoup(html, HTML_PARSER, parse_only=parse_only)
+
+    def _render_with_retries(self, url: str) -> str:
+        """Rate-limited browser render with retries and exponential backoff.
+
+        Args:
+            url: URL to fetch
+
+        Returns:
+            Rendered HTML content (after JS execution)
+
+        Raises:
+            Exception: If browser rendering fails after retries
+        """
         self._rate_limit()
 
-        # Get browser: shared or standalone
-        if self._browser_manager:
-            # Use shared browser from manager (prevents async conflicts)
-            browser = self._browser_manager.get_browser()
-        else:
-            # Fallback: use own browser (standalone extractor)
-            if self._browser is None:
-                self._init_browser()
-            browser = self._browser
+        # Standalone extractors own their browser; shared ones borrow pooled pages
+        if not self._browser_manager and self._browser is None:
+            self._init_browser()
 
         attempt = 0
         last_exception = None
 
         while attempt <= self.max_retries:
             try:
-                # Create a new page (tab) for this request
-                page = browser.new_page()
-                page.set_default_timeout(self.timeout * 1000)  # Playwright uses milliseconds
-
-                # Navigate to URL and wait for network to be idle
-                page.goto(url, wait_until="networkidle")
-
-                # Additional wait for dynamic content - wait for tables to be present
-                # This ensures JavaScript has time to populate the page
-                try:
-                    page.wait_for_selector("table", timeout=5000)
-                except Exception:
-                    # Table might not exist on all pages, continue anyway
-                    pass
-
-                # Get the rendered HTML
-                html = page.content()
-
-                # Close the page (but NOT the browser - it's shared or will be reused)
-                page.close()
+                if self._browser_manager:
+                    # Page from the shared context pool (context is recycled on release)
+                    with self._browser_manager.acquire_page() as page:
+                        html = self._render_page(page, url)
+                else:
+                    # Create a new page (tab) for this request
+                    assert self._browser is not None  # Set by _init_browser() above
+                    page = self._browser.new_page()
+                    try:
+                        html = self._render_page(page, url)
+                    finally:
+                        # Close the page (but NOT the browser - it will be reused)
+                        page.close()
 
                 # Update last request time (only for standalone fallback)
                 if not self._browser_manager:
-                    self._last_request_time = time.time()
+                    self._last_request_time = time.monotonic()
 
-                # Parse with BeautifulSoup
-                return BeautifulSoup(html, "html.parser")
+                return html
 
             except Exception as e:
                 last_exception = e
@@ -230,8 +343,37 @@ class BaseExtractor:
             raise last_exception
         raise Exception("Unknown error during browser fetch")
 
+    def _render_page(self, page: "Page", url: str) -> str:
+        """Navigate a page to a URL and return the rendered HTML.
+
+        Args:
+            page: Playwright page to navigate
+            url: URL to load
+
+        Returns:
+            Rendered HTML content (after JS execution)
+        """
+        page.set_default_timeout(self.timeout * 1000)  # Playwright uses milliseconds
+
+        # Navigate to URL and wait for network to be idle
+        page.goto(url, wait_until="networkidle")
+
+        # Additional wait for dynamic content - wait for tables to be present
+        # This ensures JavaScript has time to populate the page
+        try:
+            page.wait_for_selector("table", timeout=5000)
+        except Exception:
+            # Table might not exist on all pages, continue anyway
+            pass
+
+        html: str = page.content()
+        return html
+
     def _init_browser(self):
         """Initialize Playwright browser (headless Chromium)."""
+        # Imported lazily: static-only extractors never pay Playwright's import cost
+        from playwright.sync_api import sync_playwright
+
         self._playwright = sync_playwright().start()
         self._browser = self._playwright.chromium.launch(headless=True)
 
@@ -268,10 +410,10 @@ class BaseExtractor:
             else:
                 delay = self.rate_limit_seconds
 
-            if delay <= 0:
-                return
+            if delay <= 0 or self._last_request_time is None:
+                return  # No delay configured, or first request goes immediately
 
-            elapsed = time.time() - self._last_request_time
+            elapsed = time.monotonic() - self._last_request_time
             if elapsed < delay:
                 time.sleep(delay - elapsed)
 
@@ -280,7 +422,7 @@ class BaseExtractor:
 
         Args:
             soup: BeautifulSoup object
-            selector: CSS selector or tag name
+            selector: Tag name (matched with find, not parsed as a CSS selector)
 
         Returns:
             Stripped text content or None if not found
@@ -300,7 +442,7 @@ class BaseExtractor:
 
         Args:
             soup: BeautifulSoup object
-            selector: CSS selector or tag name
+            selector: Tag name (matched with find, not parsed as a CSS selector)
 
         Returns:
             List of stripped text content from all matching elements
@@ -8,11 +8,17 @@ from typing import TYPE_CHECKING, Any
 
 from bs4 import BeautifulSoup
 
-from .base import BaseExtractor
+from .base import HTML_PARSER, BaseExtractor
 
 if TYPE_CHECKING:
     from ..utils.browser_manager import BrowserManager
 
+# Race info patterns, compiled once and applied to every race page
+_DURATION_RE = re.compile(r"(?:(\d+)h\s*)?(\d+)m")
+_TEMP_RE = re.compile(r"(\d+)°\s*([CF])")
+_PCT_RE = re.compile(r"(\d+)%?")
+_REACT_DOM_RE = re.compile(r"ReactDOM")
+
 
 class RaceExtractor(BaseExtractor):
     """Extractor for race result pages.
@@ -89,21 +95,44 @@ class RaceExtractor(BaseExtractor):
             ValueError: If URL is invalid or missing schedule_id
             requests.exceptions.RequestException: If fetch fails
         """
+        # Validate URL format before spending a request on it
+        self._validate_url(url)
+
+        # Parse the whole page: the "Date:"/"Track:" text fallback reads the
+        # document text, including whitespace between blocks
+        soup = self.fetch_page(url)
+
+        return self.extract_from_soup(soup, url)
+
+    def extract_from_soup(self, soup: BeautifulSoup, url: str) -> dict[str, Any]:
+        """Extract race data from an already fetched race detail page.
+
+        Same as extract() without the fetch, for callers that already hold the
+        parsed page (e.g. to save it as well).
+
+        Args:
+            soup: Parsed race detail page
+            url: URL the page was fetched from
+
+        Returns:
+            Same structure as extract()
+
+        Raises:
+            ValueError: If URL is invalid or missing schedule_id
+        """
         # Validate URL format
         self._validate_url(url)
 
         # Extract schedule_id from URL
         schedule_id = self._extract_schedule_id(url)
 
-        # Fetch and parse the page
-        soup = self.fetch_page(url)
-
         # Extract race metadata
         metadata = self._extract_metadata(soup, schedule_id, url)
 
-        # Extract race results and schedule object
-        results = self._extract_results(soup)
-        schedule = self._extract_schedule(soup)
+        # Extract race results and schedule object (React props parsed once for both)
+        react_data = self._extract_react_data(soup)
+        results = self._extract_results(react_data)
+        schedule = self._extract_schedule(react_data)
 
         return {"metadata": metadata, "results": results, "schedule": schedule}
 
@@ -312,13 +341,13 @@ class RaceExtractor(BaseExtractor):
 
             # Extract text from each part
             if parts:
-                stats_soup = BeautifulSoup(parts[0], "html.parser")
+                stats_soup = BeautifulSoup(parts[0], HTML_PARSER)
                 stats_line = stats_soup.get_text(separator=" ", strip=True)
             else:
                 stats_line = None
 
             if len(parts) > 1:
-                weather_soup = BeautifulSoup(parts[1], "html.parser")
+                weather_soup = BeautifulSoup(parts[1], HTML_PARSER)
                 weather_line = weather_soup.get_text(separator=" ", strip=True)
             else:
                 weather_line = None
@@ -333,14 +362,11 @@ class RaceExtractor(BaseExtractor):
                 if "h " in part and "m" in part:
                     try:
                         # Parse format like "1h 11m"
-                        hours_match = re.search(r"(\d+)h", part)
-                        minutes_match = re.search(r"(\d+)m", part)
-
-                        hours = int(hours_match.group(1)) if hours_match else 0
-                        minutes = int(minutes_match.group(1)) if minutes_match else 0
-
-                        total_minutes = (hours * 60) + minutes
-                        info["race_duration_minutes"] = total_minutes
+                        duration_match = _DURATION_RE.search(part)
+                        if duration_match:
+                            hours, minutes = duration_match.groups()
+                            total_minutes = (int(hours or 0) * 60) + int(minutes)
+                            info["race_duration_minutes"] = total_minutes
                     except (ValueError, AttributeError):
                         pass
 
@@ -398,14 +424,15 @@ class RaceExtractor(BaseExtractor):
                 # Temperature: "88° F" or "23° C" - convert to Fahrenheit integer
                 elif "°" in part and ("C" in part or "F" in part):
                     try:
-                        temp_match = re.search(r"(\d+)°\s*([CF])", part)
+                        temp_match = _TEMP_RE.search(part)
                         if temp_match:
                             temp_value = int(temp_match.group(1))
                             temp_unit = temp_match.group(2)
 
                             # Convert to Fahrenheit if in Celsius
                             if temp_unit == "C":
-                                temp_f = int((temp_value * 9 / 5) + 32)
+                                # Integer form of int(v * 9 / 5 + 32) for v >= 0
+                                temp_f = (temp_value * 9 + 160) // 5
                             else:
                                 temp_f = temp_value
 
@@ -417,7 +444,7 @@ class RaceExtractor(BaseExtractor):
                 elif "Humidity" in part:
                     try:
                         humidity_str = part.replace("Humidity", "").strip()
-                        pct_match = re.search(r"(\d+)%?", humidity_str)
+                        pct_match = _PCT_RE.search(humidity_str)
                         if pct_match:
                             info["humidity_pct"] = int(pct_match.group(1))
                     except (ValueError, AttributeError):
@@ -427,7 +454,7 @@ class RaceExtractor(BaseExtractor):
                 elif "Fog" in part:
                     try:
                         fog_str = part.replace("Fog", "").strip()
-                        pct_match = re.search(r"(\d+)%?", fog_str)
+                        pct_match = _PCT_RE.search(fog_str)
                         if pct_match:
                             info["fog_pct"] = int(pct_match.group(1))
                     except (ValueError, AttributeError):
@@ -485,8 +512,8 @@ class RaceExtractor(BaseExtractor):
 
         return "Unknown Race"
 
-    def _extract_results(self, soup: BeautifulSoup) -> list[dict[str, Any]]:
-        """Extract race results from ReactDOM JSON data.
+    def _extract_react_data(self, soup: BeautifulSoup) -> list[dict[str, Any]]:
+        """Parse the ResultsTable props of each ReactDOM script on the page.
 
         SimRacerHub embeds race results in React props via:
             ReactDOM.createRoot(...).render(React.createElement(ResultsTable, {
@@ -499,28 +526,37 @@ class RaceExtractor(BaseExtractor):
             soup: BeautifulSoup object
 
         Returns:
-            List of result dictionaries with JSON field names
+            Parsed props per ReactDOM script, in page order
         """
         from ..utils import js_parser
 
-        # Find script tag containing ReactDOM
-        script_tags = soup.find_all("script", string=re.compile(r"ReactDOM"))
+        # Find script tags containing ReactDOM
+        script_tags = soup.find_all("script", string=_REACT_DOM_RE)
 
-        for script_tag in script_tags:
-            if not script_tag.string:
-                continue
+        return [
+            js_parser.extract_race_results_json(script_tag.string)
+            for script_tag in script_tags
+            if script_tag.string
+        ]
 
-            # Extract React props
-            react_data = js_parser.extract_race_results_json(script_tag.string)
+    def _extract_results(self, react_data: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Extract race results from parsed ReactDOM props.
 
-            rps = react_data.get("rps")
+        Args:
+            react_data: Props from _extract_react_data()
+
+        Returns:
+            List of result dictionaries with JSON field names
+        """
+        for props in react_data:
+            rps = props.get("rps")
             if not rps:
                 continue
 
             # Extract supplementary data
-            drivers_data = react_data.get("drivers") or {}
-            teams_data = react_data.get("teams") or {}
-            team_drivers = react_data.get("team_drivers") or {}
+            drivers_data = props.get("drivers") or {}
+            teams_data = props.get("teams") or {}
+            team_drivers = props.get("team_drivers") or {}
 
             # Process each race participant
             results = []
@@ -536,28 +572,17 @@ class RaceExtractor(BaseExtractor):
         # No JSON data found
         return []
 
-    def _extract_schedule(self, soup: BeautifulSoup) -> dict[str, Any] | None:
-        """Extract schedule object from ReactDOM JSON data.
+    def _extract_schedule(self, react_data: list[dict[str, Any]]) -> dict[str, Any] | None:
+        """Extract schedule object from parsed ReactDOM props.
 
         Args:
-            soup: BeautifulSoup object
+            react_data: Props from _extract_react_data()
 
         Returns:
             Schedule dictionary or None if not found
         """
-        from ..utils import js_parser
-
-        # Find script tag containing ReactDOM
-        script_tags = soup.find_all("script", string=re.compile(r"ReactDOM"))
-
-        for script_tag in script_tags:
-            if not script_tag.string:
-                continue
-
-            # Extract React props
-            react_data = js_parser.extract_race_results_json(script_tag.string)
-            schedule = react_data.get("schedule")
-
+        for props in react_data:
+            schedule = props.get("schedule")
             if schedule:
                 return schedule
 
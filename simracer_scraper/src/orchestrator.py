@@ -5,6 +5,7 @@ classes and database storage with smart caching.
 """
 
 import logging
+import sqlite3
 from typing import Any
 
 from .database import Database
@@ -244,8 +245,10 @@ class Orchestrator:
                 # This ensures we capture the correct names before fetching series pages
                 # NOTE: We set scraped_at to a very old date so cache checks know
                 # we haven't actually scraped the series page yet
+                series_rows = []
                 for series_info in series_urls:
                     series_data = {
+                        "series_id": series_info["series_id"],
                         "name": series_info.get("name", "Unknown Series"),
                         "url": series_info["url"],
                         "scraped_at": "1970-01-01T00:00:00",  # Epoch - forces re-scrape
@@ -259,11 +262,9 @@ class Orchestrator:
                     if "num_seasons" in series_info:
                         series_data["num_seasons"] = series_info["num_seasons"]
 
-                    self.db.upsert_series(
-                        series_id=series_info["series_id"],
-                        league_id=metadata["league_id"],
-                        data=series_data,
-                    )
+                    series_rows.append(series_data)
+
+                self.db.upsert_series_bulk(metadata["league_id"], series_rows)
 
                 # Scrape each series
                 for series_info in series_urls:
@@ -389,16 +390,17 @@ class Orchestrator:
                 # This ensures we capture the correct names before fetching season pages
                 # NOTE: We set scraped_at to a very old date so cache checks know
                 # we haven't actually scraped the season page yet
-                for season_info in seasons:
-                    self.db.upsert_season(
-                        season_id=season_info.get("season_id", 0),
-                        series_id=metadata["series_id"],
-                        data={
-                            "name": season_info.get("name", "Unknown Season"),
-                            "url": season_info["url"],
-                            "scraped_at": "1970-01-01T00:00:00",  # Epoch - forces re-scrape
-                        },
-                    )
+                with self.db.transaction():
+                    for season_info in seasons:
+                        self.db.upsert_season(
+                            season_id=season_info.get("season_id", 0),
+                            series_id=metadata["series_id"],
+                            data={
+                                "name": season_info.get("name", "Unknown Season"),
+                                "url": season_info["url"],
+                                "scraped_at": "1970-01-01T00:00:00",  # Epoch - forces re-scrape
+                            },
+                        )
 
                 # Scrape each season
                 for season_info in seasons:
@@ -599,8 +601,7 @@ class Orchestrator:
             self.progress["races_scraped"] += 1
 
             # Store race results
-            for result in results:
-                self._store_race_result(race_id, result, season_id)
+            self._store_race_results(race_id, results, season_id)
 
             # Log successful scrape
             duration_ms = int((time_module.time() - start_time) * 1000)
@@ -614,6 +615,70 @@ class Orchestrator:
             )
             # Don't re-raise, continue with other races
 
+    def _store_race_results(self, race_id: int, results: list[dict], season_id: int) -> None:
+        """Store all results of a race, batching the driver and result upserts.
+
+        Resolves the league once and writes drivers and results with one
+        executemany() transaction each. If a batch fails, falls back to storing
+        results one at a time so a single bad row does not drop the whole race.
+
+        Args:
+            race_id: Internal race ID (from races table)
+            results: Result dictionaries from RaceExtractor
+            season_id: Season ID for resolving league context
+        """
+        import datetime
+
+        # Results without a driver link are skipped (see _store_race_result)
+        results = [result for result in results if result.get("driver_id")]
+        if not results:
+            return
+
+        season = self.db.get_season(season_id)
+        series = self.db.get_series(season["series_id"]) if season else None
+        if not series:
+            # Can't resolve league - skip results
+            return
+
+        scraped_at = datetime.datetime.now().isoformat()
+        drivers = [
+            {"driver_id": result["driver_id"], **self._driver_record(result, scraped_at)}
+            for result in results
+        ]
+
+        try:
+            self.db.upsert_drivers_bulk(series["league_id"], drivers)
+            self.db.upsert_race_results_bulk(race_id, results)
+        except sqlite3.Error as e:
+            # Batch rolled back - store row by row, skipping only the bad rows
+            logger.warning(f"⚠️  Bulk result write failed for race {race_id}, storing per row: {e}")
+            for result in results:
+                self._store_race_result(race_id, result, season_id)
+
+    def _driver_record(self, result: dict, scraped_at: str) -> dict:
+        """Build the driver upsert data for a race result's driver.
+
+        Args:
+            result: Result dictionary from RaceExtractor (must have driver_id)
+            scraped_at: ISO timestamp to record for the driver
+
+        Returns:
+            Driver data dictionary for Database.upsert_driver()
+        """
+        driver_id = result["driver_id"]
+        driver_name = result.get("driver_name", "Unknown Driver")
+
+        # Parse driver name into first and last name
+        first_name, last_name = self._parse_driver_name(driver_name)
+
+        return {
+            "name": driver_name,
+            "first_name": first_name,
+            "last_name": last_name,
+            "url": f"https://www.simracerhub.com/driver_stats.php?driver_id={driver_id}",
+            "scraped_at": scraped_at,
+        }
+
     def _store_race_result(self, race_id: int, result: dict, season_id: int) -> None:
         """Store a single race result in the database.
 
@@ -636,8 +701,6 @@ class Orchestrator:
             # TODO: Implement fuzzy name matching with find_driver_by_name()
             return
 
-        driver_name = result.get("driver_name", "Unknown Driver")
-
         # Get league_id from season
         # Query database to get series_id from season, then league_id from series
         season = self.db.get_season(season_id)
@@ -653,21 +716,12 @@ class Orchestrator:
 
         league_id = series["league_id"]
 
-        # Parse driver name into first and last name
-        first_name, last_name = self._parse_driver_name(driver_name)
-
         # Ensure driver exists in database
         try:
             self.db.upsert_driver(
                 driver_id=driver_id,
                 league_id=league_id,
-                data={
-                    "name": driver_name,
-                    "first_name": first_name,
-                    "last_name": last_name,
-                    "url": f"https://www.simracerhub.com/driver_stats.php?driver_id={driver_id}",
-                    "scraped_at": datetime.datetime.now().isoformat(),
-                },
+                data=self._driver_record(result, datetime.datetime.now().isoformat()),
             )
         except Exception as e:
             # Driver upsert failed - skip this result
@@ -675,41 +729,13 @@ class Orchestrator:
             print(f"Warning: Failed to upsert driver {driver_id}: {e}")
             return
 
-        # Map result fields to database schema
-        # RaceExtractor provides fields with proper names that match database schema
-        result_data = {
-            "team": result.get("team"),
-            "finish_position": result.get("finish_position"),
-            "starting_position": result.get("starting_position"),
-            "car_number": result.get("car_number"),
-            "qualifying_time": result.get("qualifying_time"),
-            "fastest_lap": result.get("fastest_lap"),
-            "fastest_lap_number": result.get("fastest_lap_number"),
-            "average_lap": result.get("average_lap"),
-            "interval": result.get("interval"),
-            "laps_completed": result.get("laps_completed"),
-            "laps_led": result.get("laps_led"),
-            "incident_points": result.get("incident_points"),
-            "race_points": result.get("race_points"),
-            "bonus_points": result.get("bonus_points"),
-            "penalty_points": result.get("penalty_points"),
-            "total_points": result.get("total_points"),
-            "fast_laps": result.get("fast_laps"),
-            "quality_passes": result.get("quality_passes"),
-            "closing_passes": result.get("closing_passes"),
-            "total_passes": result.get("total_passes"),
-            "average_running_position": result.get("average_running_position"),
-            "irating": result.get("irating"),
-            "status": result.get("status"),
-            "car_id": result.get("car_id"),
-        }
-
-        # Store race result
+        # Store race result - RaceExtractor field names match the database schema and
+        # upsert_race_result reads only the columns it knows, so no per-row copy
         try:
             self.db.upsert_race_result(
                 race_id=race_id,
                 driver_id=driver_id,
-                data=result_data,
+                data=result,
             )
         except Exception:
             # Failed to store result - continue with others
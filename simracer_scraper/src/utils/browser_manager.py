@@ -7,23 +7,62 @@ crawling behavior.
 """
 
 import logging
+import os
+import queue
 import random
+import signal
+import subprocess
 import threading
 import time
 import warnings
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING
+from urllib.parse import urlparse
 
-from playwright.sync_api import Browser, Playwright, sync_playwright
+if TYPE_CHECKING:
+    from playwright.sync_api import Browser, BrowserContext, Page, Playwright
 
 logger = logging.getLogger(__name__)
 
-# Suppress Playwright cleanup warnings globally
-# This prevents "Task was destroyed but it is pending!" messages when interrupted
-warnings.filterwarnings("ignore", message="coroutine.*was never awaited", category=RuntimeWarning)
-warnings.filterwarnings(
-    "ignore",
-    message="Enable tracemalloc to get the object allocation traceback",
-    category=RuntimeWarning,
-)
+# Playwright is imported on first browser use (see _load_sync_playwright) so CLI runs
+# that never render JavaScript skip its import cost entirely.
+sync_playwright = None
+
+# Opt-in warm reuse: when set, connect to a long-lived Chromium over CDP instead of
+# launching a new browser for every scraper invocation.
+CDP_URL_ENV = "OBRL_CDP_URL"
+CHROMIUM_PID_FILE = Path.home() / ".cache" / "obrl" / "chromium.pid"
+CDP_CONNECT_ATTEMPTS = 20
+CDP_CONNECT_INTERVAL = 0.25
+# A detached Chromium is only started for CDP URLs on this machine
+LOCAL_CDP_HOSTS = frozenset({"localhost", "127.0.0.1"})
+# Where a recorded PID's command line is checked before it is signalled
+PROC_DIR = Path("/proc")
+
+
+def _load_sync_playwright():
+    """Import Playwright's sync API on first use and return sync_playwright.
+
+    Also installs the warning filters that only matter once Playwright is loaded.
+    """
+    global sync_playwright
+    if sync_playwright is None:
+        from playwright.sync_api import sync_playwright as _sync_playwright
+
+        # Suppress Playwright cleanup warnings globally
+        # This prevents "Task was destroyed but it is pending!" messages when interrupted
+        warnings.filterwarnings(
+            "ignore", message="coroutine.*was never awaited", category=RuntimeWarning
+        )
+        warnings.filterwarnings(
+            "ignore",
+            message="Enable tracemalloc to get the object allocation traceback",
+            category=RuntimeWarning,
+        )
+        sync_playwright = _sync_playwright
+    return sync_playwright
 
 
 class BrowserManager:
@@ -39,6 +78,10 @@ class BrowserManager:
        extractor followed by 13 race extractors could fire requests rapidly,
        violating respectful crawling behavior.
 
+    Pages are served from a bounded pool of persistent browser contexts
+    (see acquire_page()). Contexts are recycled between requests instead of
+    being created and torn down for every page.
+
     Example:
         >>> manager = BrowserManager(rate_limit_range=(2.0, 4.0))
         >>> browser = manager.get_browser()
@@ -47,22 +90,50 @@ class BrowserManager:
         >>> manager.close()
 
     Thread Safety:
-        All methods use threading.Lock to ensure thread-safe operation.
+        Rate limiting and browser lifecycle use separate locks, so a caller
+        sleeping in rate_limit() never blocks get_browser() or acquire_page().
+        Rate limit waits use a threading.Condition that close() notifies,
+        waking sleeping callers immediately on interrupt.
     """
 
-    def __init__(self, rate_limit_range: tuple[float, float] = (2.0, 4.0)):
+    def __init__(
+        self,
+        rate_limit_range: tuple[float, float] = (2.0, 4.0),
+        context_pool_size: int = 1,
+        clock: Callable[[], float] | None = None,
+    ):
         """Initialize browser manager.
 
         Args:
             rate_limit_range: Tuple of (min_delay, max_delay) in seconds.
                              Random delay is chosen from this range for each request.
                              Default: (2.0, 4.0) for human-like browsing behavior.
+            context_pool_size: Maximum number of browser contexts kept open.
+                             Contexts are created lazily and recycled between pages.
+                             Default: 1 (one page at a time, sequential scraping).
+            clock: Monotonic time source in seconds used for request spacing.
+                             Default: time.monotonic (tests pass a fake clock).
+
+        Raises:
+            ValueError: If context_pool_size is less than 1
         """
+        if context_pool_size < 1:
+            raise ValueError(f"context_pool_size must be >= 1, got {context_pool_size}")
+
         self._playwright: Playwright | None = None
         self._browser: Browser | None = None
-        self._last_request_time: float = 0
+        self._context_pool_size: int = context_pool_size
+        self._contexts: list[BrowserContext] = []
+        # None in a pool is the close() signal for callers waiting on it
+        self._idle_contexts: queue.Queue[BrowserContext | None] = queue.Queue()
+        self._pool_generation: int = 0  # Bumped by close(); stale contexts are not pooled
+        # Clock reading of the last reserved request slot (None: no request yet)
+        self._last_request_time: float | None = None
         self._rate_limit_range: tuple[float, float] = rate_limit_range
-        self._lock: threading.Lock = threading.Lock()
+        self._clock: Callable[[], float] = clock or time.monotonic
+        self._rng: random.Random = random.Random()  # Seeded from os.urandom, not shared
+        self._rate_cond: threading.Condition = threading.Condition()  # Guards request spacing
+        self._browser_lock: threading.Lock = threading.Lock()  # Guards browser and contexts
         self._interrupted: bool = False  # Track if cleanup is due to interrupt
 
         logger.info(
@@ -76,40 +147,60 @@ class BrowserManager:
         This method MUST be called by ALL extractors before EVERY request.
         It ensures proper delays are enforced across different extractor instances.
 
-        Thread-safe: Uses lock to coordinate across concurrent calls.
+        Thread-safe: Each caller reserves the next free slot (previous request's
+        slot + a random delay) while briefly holding the condition's lock, then
+        waits for it with the lock released. Concurrent callers are spaced out in
+        arrival order without re-checking after every wake-up, and return
+        immediately once close(interrupted=True) has been called.
 
         Example:
             >>> manager.rate_limit()  # Blocks until enough time has elapsed
             >>> # Now safe to make request
         """
-        with self._lock:
-            min_delay, max_delay = self._rate_limit_range
-            delay = random.uniform(min_delay, max_delay)
-
-            elapsed = time.time() - self._last_request_time
+        with self._rate_cond:
+            delay = self._compute_delay()
 
-            if elapsed < delay:
-                sleep_time = delay - elapsed
-                logger.info(f"⏱️  Rate limiting: sleeping {sleep_time:.2f}s before request")
-                time.sleep(sleep_time)
+            now = self._clock()
+            if self._last_request_time is not None:
+                slot = max(now, self._last_request_time + delay)
+            else:
+                slot = now  # First request goes immediately
+            self._last_request_time = slot
+
+            wait = slot - now
+            if wait > 0:
+                logger.info(f"⏱️  Rate limiting: sleeping {wait:.2f}s before request")
+                # wait() releases the lock, so other callers can reserve later slots
+                while not self._interrupted and wait > 0:
+                    self._rate_cond.wait(timeout=wait)
+                    wait = slot - self._clock()
             else:
                 logger.info(
-                    f"⏱️  Rate limiting: {elapsed:.2f}s elapsed (>= {delay:.2f}s target), no sleep needed"
+                    f"⏱️  Rate limiting: >= {delay:.2f}s since last request, no sleep needed"
                 )
 
-            self._last_request_time = time.time()
+    def _compute_delay(self) -> float:
+        """Draw the spacing before the next request from the rate limit range."""
+        min_delay, max_delay = self._rate_limit_range
+        return self._rng.uniform(min_delay, max_delay)
 
-    def get_browser(self) -> Browser:
+    def get_browser(self) -> "Browser":
         """Get shared browser instance.
 
         Creates browser on first call, reuses it for subsequent calls.
         This ensures only ONE browser is used across all extractors,
         preventing async loop conflicts.
 
+        If the OBRL_CDP_URL environment variable is set, connects to a
+        long-lived Chromium at that URL (starting a detached one if nothing
+        is listening on a local URL) so the browser stays warm across CLI
+        invocations. Stop it with stop_warm_browser().
+
         Returns:
             Browser: Playwright browser instance (Chromium).
 
-        Thread-safe: Uses lock to ensure only one browser is created.
+        Thread-safe: Uses lock to ensure only one browser is created. Once it
+        exists, callers get it without taking the lock.
 
         Example:
             >>> browser = manager.get_browser()
@@ -117,61 +208,269 @@ class BrowserManager:
             >>> # ... use page ...
             >>> page.close()  # Close page, but NOT browser
         """
-        with self._lock:
+        # Fast path: attribute reads are atomic, and _browser is only ever set to a
+        # fully initialized browser (or cleared by close())
+        browser = self._browser
+        if browser is not None:
+            return browser
+
+        with self._browser_lock:
             if not self._browser:
+                with self._rate_cond:
+                    # Reused after close(interrupted=True): rate limit waits apply again
+                    self._interrupted = False
+
                 logger.info("Initializing shared Playwright browser (Chromium)")
-                self._playwright = sync_playwright().start()
-                self._browser = self._playwright.chromium.launch(headless=True)
+                playwright = _load_sync_playwright()().start()
+                self._playwright = playwright
+
+                cdp_url = os.environ.get(CDP_URL_ENV)
+                if cdp_url:
+                    self._browser = self._connect_warm_browser(playwright, cdp_url)
+
+                if not self._browser:
+                    self._browser = playwright.chromium.launch(headless=True)
                 logger.info("Playwright browser initialized successfully")
 
             return self._browser
 
-    def close(self, interrupted: bool = False) -> None:
+    def _connect_warm_browser(self, playwright: "Playwright", cdp_url: str) -> "Browser | None":
+        """Connect to a persistent Chromium over CDP, starting one if needed.
+
+        A detached Chromium is only started when cdp_url points at this machine
+        (see LOCAL_CDP_HOSTS); a remote endpoint that does not answer is skipped.
+
+        Args:
+            playwright: Started Playwright instance
+            cdp_url: Chrome DevTools Protocol endpoint (e.g. "http://127.0.0.1:9222")
+
+        Returns:
+            Browser: Connected browser, or None if no warm browser is reachable.
+        """
+        try:
+            browser = playwright.chromium.connect_over_cdp(cdp_url)
+            logger.info(f"Reusing warm Chromium at {cdp_url}")
+            return browser
+        except Exception:
+            pass
+
+        if urlparse(cdp_url).hostname not in LOCAL_CDP_HOSTS:
+            logger.warning(f"No Chromium reachable at remote {cdp_url}, launching locally")
+            return None
+
+        logger.info(f"No Chromium listening at {cdp_url}, starting a detached one")
+        try:
+            self._launch_detached_chromium(playwright, cdp_url)
+        except OSError as e:
+            logger.warning(f"Could not start detached Chromium: {e}")
+            return None
+
+        # Chromium needs a moment before the debugging port accepts connections
+        for _ in range(CDP_CONNECT_ATTEMPTS):
+            time.sleep(CDP_CONNECT_INTERVAL)
+            try:
+                return playwright.chromium.connect_over_cdp(cdp_url)
+            except Exception:
+                continue
+
+        logger.warning(f"Detached Chromium did not come up at {cdp_url}, launching locally")
+        stop_warm_browser()  # Don't leave the unreachable browser running
+        return None
+
+    def _launch_detached_chromium(self, playwright: "Playwright", cdp_url: str) -> None:
+        """Start Chromium outside Playwright's process tree and record its PID.
+
+        Args:
+            playwright: Started Playwright instance (provides the Chromium binary)
+            cdp_url: CDP endpoint whose port the browser should listen on
+
+        Raises:
+            OSError: If the browser cannot be started or the PID file written
+        """
+        port = urlparse(cdp_url).port or 9222
+        process = subprocess.Popen(
+            [
+                playwright.chromium.executable_path,
+                "--headless=new",
+                f"--remote-debugging-port={port}",
+                f"--user-data-dir={_chromium_profile_dir()}",
+                "--no-first-run",
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+        CHROMIUM_PID_FILE.parent.mkdir(parents=True, exist_ok=True)
+        CHROMIUM_PID_FILE.write_text(str(process.pid))
+
+    @contextmanager
+    def acquire_page(self) -> Iterator["Page"]:
+        """Borrow a fresh page from the browser context pool.
+
+        Waits for an idle context (creating one if the pool is not yet full),
+        opens a new page in it and yields it. On release the page is closed
+        and the context is returned to the pool for the next request - or
+        closed, if close() ran while the page was out.
+
+        Does NOT rate limit - callers still call rate_limit() before each request.
+
+        Yields:
+            Page: Playwright page in a pooled browser context.
+
+        Raises:
+            RuntimeError: If close() runs while waiting for a free context
+
+        Example:
+            >>> manager.rate_limit()
+            >>> with manager.acquire_page() as page:
+            ...     page.goto(url)
+            ...     html = page.content()
+        """
+        context, generation = self._checkout_context()
+        try:
+            page = context.new_page()
+            try:
+                yield page
+            finally:
+                page.close()
+        finally:
+            self._release_context(context, generation)
+
+    def _checkout_context(self) -> "tuple[BrowserContext, int]":
+        """Take an idle context from the pool, creating one if there is room.
+
+        Returns:
+            Tuple of (context reserved for the caller until it is released,
+            pool generation the context belongs to)
+
+        Raises:
+            RuntimeError: If close() runs while waiting for a free context
+        """
+        with self._browser_lock:
+            pool, generation = self._idle_contexts, self._pool_generation
+
+        try:
+            return self._take_idle(pool, block=False), generation
+        except queue.Empty:
+            pass
+
+        browser = self.get_browser()
+        with self._browser_lock:
+            if (
+                generation == self._pool_generation
+                and len(self._contexts) < self._context_pool_size
+            ):
+                context = browser.new_context()
+                self._contexts.append(context)
+                logger.debug(
+                    f"Created browser context {len(self._contexts)}/{self._context_pool_size}"
+                )
+                return context, generation
+
+        # Pool is full - wait for another caller to release a context
+        return self._take_idle(pool, block=True), generation
+
+    @staticmethod
+    def _take_idle(pool: "queue.Queue[BrowserContext | None]", block: bool) -> "BrowserContext":
+        """Get a context from a pool, raising if the pool was closed.
+
+        Raises:
+            queue.Empty: If block is False and no context is idle
+            RuntimeError: If close() retired the pool
+        """
+        context = pool.get(block=block)
+        if context is None:
+            pool.put(None)  # Pass the close signal on to the next waiter
+            raise RuntimeError("BrowserManager closed while waiting for a browser context")
+        return context
+
+    def _release_context(self, context: "BrowserContext", generation: int) -> None:
+        """Return a context to its pool, or close it if close() retired that pool."""
+        with self._browser_lock:
+            if generation == self._pool_generation:
+                self._idle_contexts.put(context)
+                return
+
+        try:
+            context.close()
+        except Exception:
+            pass  # Browser is already gone
+
+    def close(self, interrupted: bool = False, kill: bool = False) -> None:
         """Close browser and cleanup Playwright resources.
 
         Should be called when orchestrator exits to free resources.
         Handles cleanup gracefully even when operations are interrupted.
+        A warm browser connected over CDP is only disconnected, not stopped.
 
         Args:
             interrupted: If True, skip slow cleanup operations (set during Ctrl+C)
+            kill: If True, also terminate the detached warm Chromium recorded
+                in the PID file to reclaim its memory
 
-        Thread-safe: Uses lock to ensure clean shutdown.
+        Thread-safe: Wakes rate limit sleepers first, then tears down the
+        browser under the browser lock.
 
         Example:
             >>> manager.close()
         """
-        with self._lock:
+        with self._rate_cond:
+            if interrupted:
+                # Wake any caller sleeping in rate_limit() so shutdown is immediate
+                self._interrupted = True
+            self._rate_cond.notify_all()
+
+        with self._browser_lock:
             # Suppress asyncio error logging permanently
             # This prevents error messages during cleanup after Ctrl+C
             asyncio_logger = logging.getLogger("asyncio")
             asyncio_logger.setLevel(logging.CRITICAL)
 
-            if self._browser:
-                logger.info("Closing shared Playwright browser")
-
-                if interrupted:
-                    # During interrupt: Don't call close(), it hangs waiting for pending operations
-                    # Just clear references and let process exit
-                    logger.debug("Skipping browser.close() due to interrupt")
-                    self._browser = None
-                    self._playwright = None
-                    return
-
-                try:
-                    self._browser.close()
-                except (Exception, KeyboardInterrupt):
-                    pass  # Ignore all errors during cleanup
-                finally:
-                    self._browser = None
-
-            if self._playwright:
-                logger.debug("Stopping Playwright")
-                try:
-                    self._playwright.stop()
-                except (Exception, KeyboardInterrupt):
-                    pass  # Ignore all errors during cleanup
-                finally:
-                    self._playwright = None
+            contexts = self._contexts
+            self._contexts = []
+            # Retire the pool: pages still out close their context on release, and
+            # callers waiting for a context are woken with the close signal
+            self._idle_contexts.put(None)
+            self._idle_contexts = queue.Queue()
+            self._pool_generation += 1
+
+            try:
+                if self._browser:
+                    logger.info("Closing shared Playwright browser")
+
+                    if interrupted:
+                        # During interrupt: Don't call close(), it hangs waiting for
+                        # pending operations. Just clear references and let process exit
+                        logger.debug("Skipping browser.close() due to interrupt")
+                        self._browser = None
+                        self._playwright = None
+                        return
+
+                    for context in contexts:
+                        try:
+                            context.close()
+                        except (Exception, KeyboardInterrupt):
+                            pass  # Ignore all errors during cleanup
+
+                    try:
+                        self._browser.close()
+                    except (Exception, KeyboardInterrupt):
+                        pass  # Ignore all errors during cleanup
+                    finally:
+                        self._browser = None
+
+                if self._playwright:
+                    logger.debug("Stopping Playwright")
+                    try:
+                        self._playwright.stop()
+                    except (Exception, KeyboardInterrupt):
+                        pass  # Ignore all errors during cleanup
+                    finally:
+                        self._playwright = None
+            finally:
+                # Also on the interrupted early return: Ctrl+C is when a kill matters most
+                if kill:
+                    stop_warm_browser()
 
     def __enter__(self):
         """Context manager entry."""
@@ -181,3 +480,54 @@ class BrowserManager:
         """Context manager exit - ensures cleanup."""
         self.close()
         return False
+
+
+def _chromium_profile_dir() -> Path:
+    """Return the user data directory the detached warm Chromium is started with."""
+    return CHROMIUM_PID_FILE.parent / "profile"
+
+
+def _is_warm_chromium(pid: int) -> bool:
+    """Check that pid still runs the warm Chromium, not a process that reused the PID.
+
+    Args:
+        pid: Process ID read from the PID file
+
+    Returns:
+        True if the process command line names our Chromium profile directory.
+        False if it does not, the process is gone, or its command line can't be read.
+    """
+    try:
+        cmdline = (PROC_DIR / str(pid) / "cmdline").read_bytes()
+    except OSError:
+        return False
+    return f"--user-data-dir={_chromium_profile_dir()}".encode() in cmdline.split(b"\0")
+
+
+def stop_warm_browser() -> bool:
+    """Terminate the detached warm Chromium recorded in the PID file, if any.
+
+    Used by ``scraper.py stop-browser`` and close(kill=True). The whole process
+    group is signalled, so Chromium's helper processes exit with it. A PID file
+    left behind by a reboot or crash is removed without signalling anything.
+
+    Returns:
+        True if the recorded browser was signalled, False otherwise
+    """
+    try:
+        pid = int(CHROMIUM_PID_FILE.read_text().strip())
+    except (OSError, ValueError):
+        return False
+
+    CHROMIUM_PID_FILE.unlink(missing_ok=True)
+    if not _is_warm_chromium(pid):
+        logger.info(f"Recorded pid {pid} is not the warm Chromium, removed stale PID file")
+        return False
+
+    logger.info(f"Terminating warm Chromium (pid {pid})")
+    try:
+        # Started with start_new_session=True, so the PID is also its process group ID
+        os.killpg(pid, signal.SIGTERM)
+    except OSError:
+        return False  # Already gone
+    return True
@@ -11,10 +11,90 @@ Supported Patterns:
 
 import json
 import re
+from collections.abc import Iterator
 from typing import Any
 
+# series.push({...}) calls on league pages
+_SERIES_PUSH_RE = re.compile(r"series\.push\(\{([^}]+)\}\)")
 
-def extract_series_data(html: str) -> list[dict[str, Any]]:
+# Locates the props argument of React.createElement(ResultsTable, {...}), also when
+# it is nested as a child of a wrapper element
+_REACT_ELEMENT_RE = re.compile(r"\bcreateElement\(\s*ResultsTable\s*,\s*")
+
+# Matches one bare (unquoted) prop key inside a JavaScript object literal
+_REACT_PROP_KEY_RE = re.compile(r"\s*,?\s*(\w+)\s*:\s*")
+
+# Bracket characters, or a whole double-quoted string so brackets inside it are skipped
+_BRACKET_SCAN_RE = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|[\[\]{}]')
+
+# Props consumed from the ResultsTable component on race pages
+_RESULTS_TABLE_KEYS = ("rps", "drivers", "teams", "team_drivers", "schedule")
+
+# Any ResultsTable prop followed by an array/object value, for a single-pass scan
+_REACT_PROPS_RE = re.compile(r"\b(rps|drivers|teams|team_drivers|schedule):\s*(?=[\[{])")
+
+# Bare object keys, quoted by _js_to_json
+_JS_KEY_RE = re.compile(r"(\w+)\s*:")
+
+# key: value pairs (number, double/single-quoted string, or identifier) for the
+# regex fallback in _parse_js_object
+_JS_PAIR_RE = re.compile(r'(\w+)\s*:\s*(?:(\d+)|"([^"]*)"|\'([^\']*)\'|([a-zA-Z_]\w*))')
+
+# Start of a <script> opening tag and a closing </script> tag (HTML tags are case-insensitive)
+_SCRIPT_START_RE = re.compile(r"<script\b", re.IGNORECASE)
+_SCRIPT_END_RE = re.compile(r"</script\s*>", re.IGNORECASE)
+
+_DECODER = json.JSONDecoder()
+
+
+def _as_text(html: str | bytes) -> str:
+    """Decode raw page bytes once so every pattern scans the same str.
+
+    Args:
+        html: Page content as str, or as UTF-8 bytes straight from the response
+
+    Returns:
+        The content as str (returned unchanged if it already is one)
+    """
+    if isinstance(html, (bytes, bytearray, memoryview)):
+        return bytes(html).decode("utf-8", errors="replace")
+    return html
+
+
+def _iter_script_bodies(html: str) -> Iterator[str]:
+    """Yield the body of each <script> element so regexes skip the page markup.
+
+    Input without any <script> tag is treated as bare JavaScript (for example a
+    script tag's text) and yielded whole.
+
+    Args:
+        html: HTML page or bare JavaScript
+
+    Yields:
+        Text between each <script ...> opening tag and its </script>
+
+    Examples:
+        >>> list(_iter_script_bodies('<p>x</p><script type="a">var a;</script>'))
+        ['var a;']
+    """
+    start = _SCRIPT_START_RE.search(html)
+    if start is None:
+        yield html
+        return
+
+    while start is not None:
+        body_start = html.find(">", start.end()) + 1
+        if not body_start:
+            return
+        end = _SCRIPT_END_RE.search(html, body_start)
+        if end is None:
+            yield html[body_start:]
+            return
+        yield html[body_start : end.start()]
+        start = _SCRIPT_START_RE.search(html, end.end())
+
+
+def extract_series_data(html: str | bytes) -> list[dict[str, Any]]:
     """Extract series data from JavaScript series.push() calls.
 
     SimRacerHub league pages contain JavaScript like:
@@ -23,7 +103,7 @@ def extract_series_data(html: str) -> list[dict[str, Any]]:
         series.push({sid:3714, sname:"Series Name", ...});
 
     Args:
-        html: HTML content containing JavaScript
+        html: HTML content containing JavaScript (str or UTF-8 bytes)
 
     Returns:
         List of series dictionaries with extracted fields
@@ -33,13 +113,14 @@ def extract_series_data(html: str) -> list[dict[str, Any]]:
         >>> extract_series_data(html)
         [{'id': 100, 'name': 'Test'}]
     """
+    html = _as_text(html)
     series_list = []
 
-    # Find all series.push() calls
+    # Find all series.push() calls, scanning script bodies only
     # Pattern: series.push({...});
-    pattern = r"series\.push\(\{([^}]+)\}\)"
-
-    matches = re.finditer(pattern, html, re.DOTALL)
+    matches = (
+        match for body in _iter_script_bodies(html) for match in _SERIES_PUSH_RE.finditer(body)
+    )
 
     for match in matches:
         series_js = match.group(1)
@@ -61,14 +142,14 @@ def extract_series_data(html: str) -> list[dict[str, Any]]:
     return series_list
 
 
-def extract_season_data(html: str) -> list[dict[str, Any]]:
+def extract_season_data(html: str | bytes) -> list[dict[str, Any]]:
     """Extract season data from JavaScript seasons array.
 
     SimRacerHub series pages contain JavaScript like:
         seasons = [{id: 26741, n: "2025 S1", scrt: 1754380800, ...}, ...];
 
     Args:
-        html: HTML content containing JavaScript
+        html: HTML content containing JavaScript (str or UTF-8 bytes)
 
     Returns:
         List of season dictionaries with extracted fields
@@ -81,13 +162,13 @@ def extract_season_data(html: str) -> list[dict[str, Any]]:
     return extract_js_array(html, "seasons")
 
 
-def extract_js_array(html: str, var_name: str) -> list[dict[str, Any]]:
+def extract_js_array(html: str | bytes, var_name: str) -> list[dict[str, Any]]:
     """Extract JavaScript array assignment into Python list.
 
     Finds patterns like: varName = [{...}, {...}];
 
     Args:
-        html: HTML content containing JavaScript
+        html: HTML content containing JavaScript (str or UTF-8 bytes)
         var_name: JavaScript variable name to extract
 
     Returns:
@@ -98,11 +179,18 @@ def extract_js_array(html: str, var_name: str) -> list[dict[str, Any]]:
         >>> extract_js_array(html, 'myData')
         [{'id': 1}, {'id': 2}]
     """
+    html = _as_text(html)
+
     # Pattern: varName = [...];
     # This handles multiline arrays with objects
-    pattern = rf"{re.escape(var_name)}\s*=\s*\[(.*?)\];"
+    pattern = re.compile(rf"{re.escape(var_name)}\s*=\s*\[(.*?)\];", re.DOTALL)
 
-    match = re.search(pattern, html, re.DOTALL)
+    # Only script bodies can hold the assignment - skip scanning the page markup
+    match = None
+    for body in _iter_script_bodies(html):
+        match = pattern.search(body)
+        if match:
+            break
 
     if not match:
         return []
@@ -112,15 +200,10 @@ def extract_js_array(html: str, var_name: str) -> list[dict[str, Any]]:
     if not array_content:
         return []
 
-    # Split by object boundaries: },{
-    # This is a simple approach that works for well-formatted JavaScript
     result = []
 
-    # Find all {...} objects in the array
-    object_pattern = r"\{([^{}]*(?:\{[^{}]*\}[^{}]*)*)\}"
-
-    for obj_match in re.finditer(object_pattern, array_content):
-        obj_content = obj_match.group(1)
+    # Parse each top-level {...} object in the array
+    for obj_content in _iter_top_level_objects(array_content):
         parsed = _parse_js_object(obj_content)
         if parsed:  # Only add non-empty objects
             result.append(parsed)
@@ -128,6 +211,37 @@ def extract_js_array(html: str, var_name: str) -> list[dict[str, Any]]:
     return result
 
 
+def _iter_top_level_objects(array_content: str) -> Iterator[str]:
+    """Yield the content of each top-level {...} object in a JavaScript array.
+
+    Tracks brace depth in one linear pass over the bracket tokens, so objects
+    nested at any depth stay inside their parent and braces in quoted strings
+    are ignored.
+
+    Args:
+        array_content: Content between the array's square brackets
+
+    Yields:
+        Text inside the braces of each top-level object
+
+    Examples:
+        >>> list(_iter_top_level_objects('{id: 1, t: {a: 2}}, {id: 3}'))
+        ['id: 1, t: {a: 2}', 'id: 3']
+    """
+    depth = 0
+    start = 0
+    for token in _BRACKET_SCAN_RE.finditer(array_content):
+        char = token.group()
+        if char == "{":
+            if depth == 0:
+                start = token.end()
+            depth += 1
+        elif char == "}" and depth > 0:
+            depth -= 1
+            if depth == 0:
+                yield array_content[start : token.start()]
+
+
 def _parse_js_object(js_content: str) -> dict[str, Any]:
     """Parse JavaScript object content into Python dictionary.
 
@@ -148,6 +262,16 @@ def _parse_js_object(js_content: str) -> dict[str, Any]:
     """
     data = {}
 
+    # Content that already has quoted keys is JSON as-is - skip the conversion passes
+    stripped = js_content.lstrip()
+    if stripped.startswith(('"', "{")):
+        try:
+            result = json.loads(stripped if stripped.startswith("{") else "{" + stripped + "}")
+        except json.JSONDecodeError:
+            result = None
+        if isinstance(result, dict):
+            return result
+
     # Try JSON parsing first after converting to valid JSON
     # This handles most cases if we can convert JavaScript object notation to JSON
     json_str = _js_to_json(js_content)
@@ -159,11 +283,8 @@ def _parse_js_object(js_content: str) -> dict[str, Any]:
         pass
 
     # Regex-based parsing as fallback
-    # Pattern for key-value pairs
     # Matches: key: value where value can be number, string, or boolean
-    pair_pattern = r'(\w+)\s*:\s*(?:(\d+)|"([^"]*)"|\'([^\']*)\'|([a-zA-Z_]\w*))'
-
-    for match in re.finditer(pair_pattern, js_content):
+    for match in _JS_PAIR_RE.finditer(js_content):
         key = match.group(1)
         # Try each capture group for the value
         num_val = match.group(2)
@@ -208,7 +329,7 @@ def _js_to_json(js_content: str) -> str:
     """
     # Add quotes to unquoted keys
     # Pattern: word characters followed by colon
-    result = re.sub(r"(\w+)\s*:", r'"\1":', js_content)
+    result = _JS_KEY_RE.sub(r'"\1":', js_content)
 
     # Replace single quotes with double quotes
     result = result.replace("'", '"')
@@ -221,7 +342,7 @@ def _js_to_json(js_content: str) -> str:
     return result
 
 
-def extract_react_props(html: str, prop_name: str) -> list[dict] | dict | None:
+def extract_react_props(html: str | bytes, prop_name: str) -> list[dict] | dict | None:
     """Extract data from ReactDOM.render() or ReactDOM.createRoot().render() calls.
 
     SimRacerHub uses React to render race results tables with embedded JSON data:
@@ -235,7 +356,7 @@ def extract_react_props(html: str, prop_name: str) -> list[dict] | dict | None:
         )
 
     Args:
-        html: HTML content containing ReactDOM script
+        html: HTML content containing ReactDOM script (str or UTF-8 bytes)
         prop_name: React prop name to extract (e.g., "rps", "drivers", "teams", "schedule")
 
     Returns:
@@ -252,11 +373,16 @@ def extract_react_props(html: str, prop_name: str) -> list[dict] | dict | None:
         >>> extract_react_props(html, 'drivers')
         {'123': {...}}
     """
-    # Find prop_name followed by colon
-    pattern = rf"{prop_name}:\s*"
-    match = re.search(pattern, html)
-
-    if not match:
+    html = _as_text(html)
+
+    # Find prop_name followed by colon, scanning script bodies only
+    pattern = re.compile(rf"{prop_name}:\s*")
+    for body in _iter_script_bodies(html):
+        match = pattern.search(body)
+        if match:
+            html = body
+            break
+    else:
         return None
 
     # Starting position after "prop_name: "
@@ -270,23 +396,24 @@ def extract_react_props(html: str, prop_name: str) -> list[dict] | dict | None:
     if first_char not in ("[", "{"):
         return None
 
-    # Count brackets/braces to find matching closing character
+    # Count brackets/braces to find matching closing character. The regex jumps
+    # straight between bracket tokens and skips quoted strings in one step.
     open_char = first_char
     close_char = "]" if open_char == "[" else "}"
     depth = 0
-    end_pos = start_pos
+    end_pos = None
 
-    for i in range(start_pos, len(html)):
-        char = html[i]
+    for token in _BRACKET_SCAN_RE.finditer(html, start_pos):
+        char = token.group()
         if char == open_char:
             depth += 1
         elif char == close_char:
             depth -= 1
             if depth == 0:
-                end_pos = i + 1
+                end_pos = token.end()
                 break
 
-    if depth != 0:
+    if end_pos is None:
         # Unmatched brackets/braces
         return None
 
@@ -300,7 +427,7 @@ def extract_react_props(html: str, prop_name: str) -> list[dict] | dict | None:
         return None
 
 
-def extract_race_results_json(html: str) -> dict[str, Any]:
+def extract_race_results_json(html: str | bytes) -> dict[str, Any]:
     """Extract race results data from ReactDOM JSON.
 
     Extracts all React props related to race results:
@@ -310,7 +437,7 @@ def extract_race_results_json(html: str) -> dict[str, Any]:
     - schedule: Race schedule metadata
 
     Args:
-        html: HTML content containing ReactDOM script
+        html: HTML content containing ReactDOM script (str or UTF-8 bytes)
 
     Returns:
         Dictionary with keys: rps, drivers, teams, schedule
@@ -322,10 +449,97 @@ def extract_race_results_json(html: str) -> dict[str, Any]:
         >>> data['rps']  # List of participant dicts
         >>> data['drivers']  # Dict of driver metadata
     """
-    return {
-        "rps": extract_react_props(html, "rps"),
-        "drivers": extract_react_props(html, "drivers"),
-        "teams": extract_react_props(html, "teams"),
-        "team_drivers": extract_react_props(html, "team_drivers"),
-        "schedule": extract_react_props(html, "schedule"),
-    }
+    html = _as_text(html)
+    props = _extract_results_table_props(html)
+
+    if any(key not in props for key in _RESULTS_TABLE_KEYS):
+        # The props object was missing or decoding stopped early (e.g. at an
+        # identifier-valued prop) - locate the remaining props anywhere in the page
+        for key, value in _find_results_table_props(html).items():
+            props.setdefault(key, value)
+
+    return {key: props.get(key) for key in _RESULTS_TABLE_KEYS}
+
+
+def _find_results_table_props(html: str) -> dict[str, Any]:
+    """Locate ResultsTable props anywhere in the page in a single scan.
+
+    Walks every ``prop: [`` / ``prop: {`` occurrence with one alternation regex
+    and decodes the value in place. The first value that decodes wins for each prop.
+
+    Args:
+        html: HTML content containing the props
+
+    Returns:
+        Dictionary of decoded props (props that were not found are absent)
+
+    Examples:
+        >>> _find_results_table_props('x = {teams: {"1": {}}, rps: []}')
+        {'teams': {'1': {}}, 'rps': []}
+    """
+    props = {}
+    for match in _REACT_PROPS_RE.finditer(html):
+        key = match.group(1)
+        if key in props:
+            continue
+        try:
+            props[key], _ = _DECODER.raw_decode(html, match.end())
+        except json.JSONDecodeError:
+            continue
+        if len(props) == len(_RESULTS_TABLE_KEYS):
+            break
+    return props
+
+
+def _extract_results_table_props(html: str) -> dict[str, Any]:
+    """Decode the props object passed to React.createElement(ResultsTable) in a single pass.
+
+    The props object is a JavaScript literal with bare keys and JSON values:
+        React.createElement(ResultsTable, {rps: [...], drivers: {...}, ...})
+
+    Locating it once and decoding each value in place avoids rescanning the
+    whole page for every prop.
+
+    Args:
+        html: HTML content containing ReactDOM script
+
+    Returns:
+        Dictionary of decoded props (empty if no props object was found).
+        Decoding stops at the first value that is not valid JSON; callers fill
+        in the remaining props with _find_results_table_props().
+
+    Examples:
+        >>> html = 'React.createElement(ResultsTable, {rps: [{"id": 1}], teams: {}})'
+        >>> _extract_results_table_props(html)
+        {'rps': [{'id': 1}], 'teams': {}}
+    """
+    for element_match in _REACT_ELEMENT_RE.finditer(html):
+        start_pos = element_match.end()
+        if not html.startswith("{", start_pos):
+            continue
+
+        # Props that are already valid JSON decode in one call
+        try:
+            props, _ = _DECODER.raw_decode(html, start_pos)
+            if isinstance(props, dict) and props:
+                return props
+        except json.JSONDecodeError:
+            pass
+
+        # Otherwise walk the bare keys and decode each value where it sits
+        props = {}
+        pos = start_pos + 1
+        while True:
+            key_match = _REACT_PROP_KEY_RE.match(html, pos)
+            if not key_match:
+                break
+            try:
+                value, pos = _DECODER.raw_decode(html, key_match.end())
+            except json.JSONDecodeError:
+                break
+            props[key_match.group(1)] = value
+
+        if props:
+            return props
+
+    return {}
@@ -13,9 +13,9 @@ if CLAUDE_TEMP.exists():
             sys.path.insert(0, str(task_dir))
 
 
-@pytest.fixture
-def test_db():
-    """Provide clean test database for each test."""
+@pytest.fixture(scope="session")
+def schema_template_db():
+    """Provide an initialized, empty database to copy test databases from."""
     # Import from current task directory or src
     try:
         from database import Database
@@ -27,3 +27,79 @@ def test_db():
     db.initialize_schema()
     yield db
     db.close()
+
+
+def _copy_db(template):
+    """Open a new in-memory Database holding a page-level copy of template."""
+    try:
+        from database import Database
+    except ImportError:
+        from src.database import Database
+
+    db = Database(":memory:")
+    db.connect()
+    # Copy the pages instead of replaying the DDL/DML for every test
+    template.conn.backup(db.conn)
+    # Throwaway database: skip durability work (test-only, production keeps its pragmas)
+    db.conn.execute("PRAGMA synchronous = OFF")
+    db.conn.execute("PRAGMA temp_store = MEMORY")
+    return db
+
+
+@pytest.fixture
+def test_db(schema_template_db):
+    """Provide clean test database for each test."""
+    db = _copy_db(schema_template_db)
+    yield db
+    db.close()
+
+
+@pytest.fixture(scope="session")
+def race_template_db(schema_template_db):
+    """Provide a database seeded with league 1558 -> series 3714 -> season 12345 -> race 67890."""
+    db = _copy_db(schema_template_db)
+    db.upsert_league(
+        1558, {"name": "The OBRL", "url": "http://test.com/league", "scraped_at": "2025-01-15"}
+    )
+    db.upsert_series(
+        3714,
+        1558,
+        {"name": "Series", "url": "http://test.com/series", "scraped_at": "2025-01-15"},
+    )
+    db.upsert_season(
+        12345,
+        3714,
+        {"name": "Season", "url": "http://test.com/season", "scraped_at": "2025-01-15"},
+    )
+    db.upsert_race(
+        67890,
+        12345,
+        {"race_number": 1, "url": "http://test.com/race", "scraped_at": "2025-01-15"},
+    )
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def race_db(race_template_db):
+    """Provide a fresh copy of the seeded race hierarchy for each test."""
+    db = _copy_db(race_template_db)
+    yield db
+    db.close()
+
+
+@pytest.fixture(scope="session")
+def base_extractor_cls():
+    """Provide the BaseExtractor class, imported once per session."""
+    try:
+        from extractors.base import BaseExtractor
+    except ImportError:
+        from src.extractors.base import BaseExtractor
+
+    return BaseExtractor
+
+
+@pytest.fixture
+def stateless_extractor(base_extractor_cls):
+    """Provide a default BaseExtractor for tests that don't fetch or mutate it."""
+    return base_extractor_cls()
@@ -1,40 +1,35 @@
 """Tests for base extractor."""
 
-import time
+import sys
 
 import pytest
 import requests
 
 
-def test_base_extractor_initialization():
-    """Test BaseExtractor can be initialized."""
-    try:
-        from extractors.base import BaseExtractor
-    except ImportError:
-        from src.extractors.base import BaseExtractor
+@pytest.fixture
+def base_module(base_extractor_cls):
+    """Provide the module defining BaseExtractor (page cache settings live there)."""
+    return sys.modules[base_extractor_cls.__module__]
 
-    extractor = BaseExtractor(rate_limit_seconds=2.0)
 
-    assert extractor is not None
-    assert extractor.rate_limit_seconds == 2.0
-    assert extractor.max_retries == 3
-    assert extractor.timeout == 30
+def test_base_extractor_initialization(stateless_extractor):
+    """Test BaseExtractor can be initialized."""
+    assert stateless_extractor is not None
+    assert stateless_extractor.rate_limit_seconds == 2.0
+    assert stateless_extractor.max_retries == 3
+    assert stateless_extractor.timeout == 30
 
 
-def test_fetch_page_success(mocker):
+def test_fetch_page_success(base_extractor_cls, mocker):
     """Test successful page fetch."""
-    try:
-        from extractors.base import BaseExtractor
-    except ImportError:
-        from src.extractors.base import BaseExtractor
-
     # Mock requests.get
     mock_response = mocker.Mock()
     mock_response.text = "<html><body>Test Content</body></html>"
+    mock_response.headers = {"Content-Type": "text/html; charset=utf-8"}
     mock_response.raise_for_status = mocker.Mock()
     mock_get = mocker.patch("requests.get", return_value=mock_response)
 
-    extractor = BaseExtractor(rate_limit_seconds=0)  # No delay for tests
+    extractor = base_extractor_cls(rate_limit_seconds=0)  # No delay for tests
     soup = extractor.fetch_page("https://example.com/test")
 
     # Verify request was made
@@ -47,266 +42,450 @@ def test_fetch_page_success(mocker):
     assert "Test Content" in soup.get_text()
 
 
-def test_fetch_page_rate_limiting():
-    """Test that rate limiting delays are enforced."""
-    try:
-        from extractors.base import BaseExtractor
-    except ImportError:
-        from src.extractors.base import BaseExtractor
+def test_fetch_page_uses_lxml_parser(base_extractor_cls, mocker):
+    """Test fetched pages are parsed with the lxml tree builder."""
+    mock_response = mocker.Mock()
+    mock_response.text = "<html><body><table><tr><td>1</td></tr></table></body></html>"
+    mock_response.headers = {"Content-Type": "text/html; charset=utf-8"}
+    mocker.patch("requests.get", return_value=mock_response)
 
-    extractor = BaseExtractor(rate_limit_seconds=0.5)
+    extractor = base_extractor_cls(rate_limit_seconds=0)
+    soup = extractor.fetch_page("https://example.com/test")
 
-    # Record time before first call
-    start_time = time.time()
+    assert "lxml" in soup.builder.features
+    assert soup.find("td").get_text() == "1"
 
-    # Make two calls (second should be delayed)
-    extractor._last_request_time = time.time() - 0.1  # Recent request
-    extractor._rate_limit()
 
-    elapsed = time.time() - start_time
+def test_fetch_page_parse_only(base_extractor_cls, mocker):
+    """Test fetch_page builds only the elements selected by a SoupStrainer."""
+    from bs4 import SoupStrainer
 
-    # Should have waited ~0.4 seconds (0.5 - 0.1)
-    assert elapsed >= 0.3  # Allow some tolerance
+    mock_response = mocker.Mock()
+    mock_response.text = "<html><body><nav><a>Home</a></nav><h1>Race</h1></body></html>"
+    mock_response.headers = {"Content-Type": "text/html; charset=utf-8"}
+    mocker.patch("requests.get", return_value=mock_response)
+
+    extractor = base_extractor_cls(rate_limit_seconds=0)
+    soup = extractor.fetch_page("https://example.com/test", parse_only=SoupStrainer("h1"))
+
+    assert soup.find("h1").get_text() == "Race"
+    assert soup.find("nav") is None
+
+
+def _html_response(content_type: str, body: bytes) -> requests.models.Response:
+    """Build a Response the way requests does, including its header-derived encoding."""
+    response = requests.models.Response()
+    response.status_code = 200
+    response.headers["Content-Type"] = content_type
+    response._content = body
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    return response
+
+
+def test_fetch_page_defaults_to_utf8_without_charset(base_extractor_cls, mocker):
+    """Test text/html pages without a charset are decoded as UTF-8, not ISO-8859-1."""
+    response = _html_response(
+        "text/html", "<html><body><h1>Jürgen Müller</h1></body></html>".encode()
+    )
+    assert response.encoding == "ISO-8859-1"  # requests' default for text/* without charset
+    mocker.patch("requests.get", return_value=response)
+    apparent_encoding = mocker.patch.object(
+        requests.models.Response, "apparent_encoding", new_callable=mocker.PropertyMock
+    )
+
+    extractor = base_extractor_cls(rate_limit_seconds=0)
+    soup = extractor.fetch_page("https://example.com/test")
 
+    assert soup.find("h1").get_text() == "Jürgen Müller"
+    apparent_encoding.assert_not_called()
 
-def test_fetch_page_retry_on_failure(mocker):
-    """Test retry logic on failed requests."""
-    try:
-        from extractors.base import BaseExtractor
-    except ImportError:
-        from src.extractors.base import BaseExtractor
 
-    # First two calls fail, third succeeds
-    mock_response = mocker.Mock()
-    mock_response.text = "<html><body>Success</body></html>"
-    mock_response.raise_for_status = mocker.Mock()
+def test_fetch_page_keeps_declared_charset(base_extractor_cls, mocker):
+    """Test a charset declared in Content-Type is still honoured."""
+    response = _html_response(
+        "text/html; charset=ISO-8859-1",
+        "<html><body><h1>Jürgen</h1></body></html>".encode("latin-1"),
+    )
+    mocker.patch("requests.get", return_value=response)
+
+    extractor = base_extractor_cls(rate_limit_seconds=0)
+    soup = extractor.fetch_page("https://example.com/test")
+
+    assert soup.find("h1").get_text() == "Jürgen"
+
+
+def test_fetch_raw_returns_utf8_bytes(base_extractor_cls, mocker):
+    """Test fetch_raw decodes with the declared charset and returns UTF-8 bytes."""
+    response = _html_response(
+        "text/html; charset=ISO-8859-1",
+        "<html><body><h1>Jürgen</h1></body></html>".encode("latin-1"),
+    )
+    mock_get = mocker.patch("requests.get", return_value=response)
+
+    extractor = base_extractor_cls(rate_limit_seconds=0)
+    raw = extractor.fetch_raw("https://example.com/test")
+
+    assert raw == "<html><body><h1>Jürgen</h1></body></html>".encode()
+    mock_get.assert_called_once()
+
+
+def test_fetch_raw_with_browser_returns_rendered_bytes(base_extractor_cls, mocker):
+    """Test fetch_raw encodes the rendered page when render_js is set."""
+    mock_page = mocker.MagicMock()
+    mock_page.content.return_value = "<html><body><table>Jürgen</table></body></html>"
+    mock_manager = mocker.MagicMock()
+    mock_manager.acquire_page.return_value.__enter__.return_value = mock_page
+
+    extractor = base_extractor_cls(render_js=True, browser_manager=mock_manager)
+    raw = extractor.fetch_raw("https://example.com/test")
 
-    mock_get = mocker.patch("requests.get")
-    mock_get.side_effect = [
-        requests.exceptions.RequestException("Network error"),
-        requests.exceptions.RequestException("Another error"),
-        mock_response,
-    ]
+    assert raw == "<html><body><table>Jürgen</table></body></html>".encode()
+    mock_manager.rate_limit.assert_called_once()
 
-    # Mock sleep to avoid delays in tests
-    mocker.patch("time.sleep")
 
-    extractor = BaseExtractor(rate_limit_seconds=0, max_retries=3)
+def test_page_cache_serves_repeat_fetches_from_disk(base_module, mocker, monkeypatch, tmp_path):
+    """Test OBRL_TEST_CACHE stores pages gzipped and skips the network on reruns."""
+    monkeypatch.setenv(base_module.PAGE_CACHE_ENV, "1")
+    monkeypatch.setattr(base_module, "PAGE_CACHE_DIR", tmp_path)
+
+    body = "<html><body><h1>Jürgen</h1></body></html>".encode()
+    mock_response = _html_response("text/html; charset=utf-8", body)
+    mock_get = mocker.patch("requests.get", return_value=mock_response)
+
+    extractor = base_module.BaseExtractor(rate_limit_seconds=0)
+    assert extractor.fetch_raw("https://example.com/test") == body
     soup = extractor.fetch_page("https://example.com/test")
 
-    # Should have retried and eventually succeeded
-    assert mock_get.call_count == 3
-    assert soup is not None
-    assert "Success" in soup.get_text()
+    assert soup.find("h1").get_text() == "Jürgen"
+    mock_get.assert_called_once()
+    assert len(list(tmp_path.glob("*.html.gz"))) == 1
 
 
-def test_fetch_page_max_retries_exceeded(mocker):
-    """Test that max retries raises exception."""
-    try:
-        from extractors.base import BaseExtractor
-    except ImportError:
-        from src.extractors.base import BaseExtractor
+def test_page_cache_corrupt_entry_is_a_miss(base_module, mocker, monkeypatch, tmp_path):
+    """Test a truncated cache file is refetched and replaced instead of raising."""
+    monkeypatch.setenv(base_module.PAGE_CACHE_ENV, "1")
+    monkeypatch.setattr(base_module, "PAGE_CACHE_DIR", tmp_path)
+    cache_path = base_module._page_cache_path("https://example.com/test", False)
+    cache_path.write_bytes(base_module.gzip.compress(b"<html></html>")[:10])
 
-    # All calls fail
-    mock_get = mocker.patch("requests.get")
-    mock_get.side_effect = requests.exceptions.RequestException("Persistent error")
+    body = b"<html><body>fresh</body></html>"
+    mock_response = _html_response("text/html; charset=utf-8", body)
+    mock_get = mocker.patch("requests.get", return_value=mock_response)
 
-    # Mock sleep to avoid delays
-    mocker.patch("time.sleep")
+    extractor = base_module.BaseExtractor(rate_limit_seconds=0)
 
-    extractor = BaseExtractor(rate_limit_seconds=0, max_retries=3)
+    assert extractor.fetch_raw("https://example.com/test") == body
+    mock_get.assert_called_once()
+    assert base_module.gzip.decompress(cache_path.read_bytes()) == body
+    assert list(tmp_path.glob("*.tmp")) == []
+
+
+def test_page_cache_interrupted_write_leaves_no_entry(base_module, mocker, monkeypatch, tmp_path):
+    """Test a write interrupted before the rename leaves no cache entry behind."""
+    monkeypatch.setenv(base_module.PAGE_CACHE_ENV, "1")
+    monkeypatch.setattr(base_module, "PAGE_CACHE_DIR", tmp_path)
+    mock_response = _html_response("text/html; charset=utf-8", b"<html></html>")
+    mocker.patch("requests.get", return_value=mock_response)
+    mocker.patch.object(base_module.os, "replace", side_effect=KeyboardInterrupt)
+
+    extractor = base_module.BaseExtractor(rate_limit_seconds=0)
+    with pytest.raises(KeyboardInterrupt):
+        extractor.fetch_raw("https://example.com/test")
+
+    assert not base_module._page_cache_path("https://example.com/test", False).exists()
+    assert list(tmp_path.glob("*.tmp")) == []
+
+
+def test_page_cache_failed_write_removes_temp_file(base_module, mocker, monkeypatch, tmp_path):
+    """Test a cache write that fails part-way removes its temp file and re-raises."""
+    monkeypatch.setenv(base_module.PAGE_CACHE_ENV, "1")
+    monkeypatch.setattr(base_module, "PAGE_CACHE_DIR", tmp_path)
+    mocker.patch(
+        "requests.get", return_value=_html_response("text/html; charset=utf-8", b"<html></html>")
+    )
+    mocker.patch.object(base_module.gzip, "compress", side_effect=OSError("No space left"))
+
+    extractor = base_module.BaseExtractor(rate_limit_seconds=0)
+    with pytest.raises(OSError, match="No space left"):
+        extractor.fetch_raw("https://example.com/test")
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_page_cache_keeps_declared_charset(base_module, mocker, monkeypatch, tmp_path):
+    """Test a cached page parses the same as a fresh fetch of a non-UTF-8 page."""
+    monkeypatch.setenv(base_module.PAGE_CACHE_ENV, "1")
+    monkeypatch.setattr(base_module, "PAGE_CACHE_DIR", tmp_path)
+    mocker.patch(
+        "requests.get",
+        return_value=_html_response(
+            "text/html; charset=ISO-8859-1",
+            "<html><body><h1>Jürgen</h1></body></html>".encode("latin-1"),
+        ),
+    )
+
+    extractor = base_module.BaseExtractor(rate_limit_seconds=0)
+    fresh = extractor.fetch_page("https://example.com/test")
+    cached = extractor.fetch_page("https://example.com/test")
+
+    assert fresh.find("h1").get_text() == "Jürgen"
+    assert cached.find("h1").get_text() == "Jürgen"
+
+
+def test_page_cache_separates_static_and_rendered_fetches(
+    base_module, mocker, monkeypatch, tmp_path
+):
+    """Test a cached static page is not replayed to a render_js extractor."""
+    monkeypatch.setenv(base_module.PAGE_CACHE_ENV, "1")
+    monkeypatch.setattr(base_module, "PAGE_CACHE_DIR", tmp_path)
+    mock_response = _html_response("text/html; charset=utf-8", b"<html>static</html>")
+    mocker.patch("requests.get", return_value=mock_response)
+    mock_manager = mocker.MagicMock()
+    mock_page = mock_manager.acquire_page.return_value.__enter__.return_value
+    mock_page.content.return_value = "<html>rendered</html>"
+
+    static = base_module.BaseExtractor(rate_limit_seconds=0)
+    rendered = base_module.BaseExtractor(render_js=True, browser_manager=mock_manager)
+
+    assert static.fetch_raw("https://example.com/test") == b"<html>static</html>"
+    assert rendered.fetch_raw("https://example.com/test") == b"<html>rendered</html>"
+    mock_manager.acquire_page.assert_called_once()
+    assert len(list(tmp_path.glob("*.html.gz"))) == 2
+
+
+def test_page_cache_disabled_by_default(base_module, mocker, monkeypatch, tmp_path):
+    """Test pages are not cached unless OBRL_TEST_CACHE is set."""
+    monkeypatch.delenv(base_module.PAGE_CACHE_ENV, raising=False)
+    monkeypatch.setattr(base_module, "PAGE_CACHE_DIR", tmp_path)
+
+    mock_response = _html_response("text/html; charset=utf-8", b"<html></html>")
+    mock_get = mocker.patch("requests.get", return_value=mock_response)
 
-    # Should raise after max retries
-    with pytest.raises(requests.exceptions.RequestException):
-        extractor.fetch_page("https://example.com/test")
+    extractor = base_module.BaseExtractor(rate_limit_seconds=0)
+    extractor.fetch_raw("https://example.com/test")
+    extractor.fetch_raw("https://example.com/test")
 
-    # Should have tried 4 times (initial + 3 retries)
-    assert mock_get.call_count == 4
+    assert mock_get.call_count == 2
+    assert list(tmp_path.iterdir()) == []
 
 
-def test_fetch_page_timeout_handling(mocker):
-    """Test timeout handling."""
-    try:
-        from extractors.base import BaseExtractor
-    except ImportError:
-        from src.extractors.base import BaseExtractor
+def test_fetch_page_rate_limiting(base_extractor_cls, mocker):
+    """Test that rate limiting delays are enforced."""
+    # Fake clock: last request 0.1s ago
+    mocker.patch("time.monotonic", return_value=100.1)
+    mock_sleep = mocker.patch("time.sleep")
 
-    mock_get = mocker.patch("requests.get")
-    mock_get.side_effect = requests.exceptions.Timeout("Timeout")
+    extractor = base_extractor_cls(rate_limit_seconds=0.5)
+    extractor._last_request_time = 100.0
+    extractor._rate_limit()
 
-    mocker.patch("time.sleep")
+    # Should wait the remaining 0.4 seconds (0.5 - 0.1)
+    mock_sleep.assert_called_once_with(pytest.approx(0.4))
 
-    extractor = BaseExtractor(rate_limit_seconds=0, max_retries=2)
 
-    with pytest.raises(requests.exceptions.Timeout):
-        extractor.fetch_page("https://example.com/test")
+def test_first_request_is_not_rate_limited(base_extractor_cls, mocker):
+    """Test the first standalone request never sleeps, whatever the monotonic clock reads."""
+    # Shortly after boot the monotonic clock can be smaller than the delay
+    mocker.patch("time.monotonic", return_value=0.5)
+    mock_sleep = mocker.patch("time.sleep")
 
-    # Should have tried 3 times (initial + 2 retries)
-    assert mock_get.call_count == 3
+    extractor = base_extractor_cls(rate_limit_seconds=2.0)
+    extractor._rate_limit()
 
+    mock_sleep.assert_not_called()
 
-def test_extract_text_single_element():
-    """Test extracting text from single element."""
-    try:
-        from extractors.base import BaseExtractor
-    except ImportError:
-        from src.extractors.base import BaseExtractor
 
-    from bs4 import BeautifulSoup
+class TestRetryLogic:
+    """Retry and backoff behaviour of static fetches (sleep is patched out)."""
 
-    html = "<html><body><h1>Title</h1><p>Paragraph</p></body></html>"
-    soup = BeautifulSoup(html, "html.parser")
+    @pytest.fixture(autouse=True)
+    def no_sleep(self, mocker):
+        """Patch time.sleep so retries and backoff run instantly."""
+        return mocker.patch("time.sleep")
 
-    extractor = BaseExtractor()
-    result = extractor.extract_text(soup, "h1")
+    def test_fetch_page_retry_on_failure(self, base_extractor_cls, mocker):
+        """Test retry logic on failed requests."""
+        # First two calls fail, third succeeds
+        mock_response = mocker.Mock()
+        mock_response.text = "<html><body>Success</body></html>"
+        mock_response.headers = {"Content-Type": "text/html; charset=utf-8"}
+        mock_response.raise_for_status = mocker.Mock()
 
-    assert result == "Title"
+        mock_get = mocker.patch("requests.get")
+        mock_get.side_effect = [
+            requests.exceptions.RequestException("Network error"),
+            requests.exceptions.RequestException("Another error"),
+            mock_response,
+        ]
 
+        extractor = base_extractor_cls(rate_limit_seconds=0, max_retries=3)
+        soup = extractor.fetch_page("https://example.com/test")
 
-def test_extract_text_not_found():
-    """Test extract_text returns None when element not found."""
-    try:
-        from extractors.base import BaseExtractor
-    except ImportError:
-        from src.extractors.base import BaseExtractor
+        # Should have retried and eventually succeeded
+        assert mock_get.call_count == 3
+        assert soup is not None
+        assert "Success" in soup.get_text()
 
-    from bs4 import BeautifulSoup
+    def test_fetch_page_max_retries_exceeded(self, base_extractor_cls, mocker):
+        """Test that max retries raises exception."""
+        # All calls fail
+        mock_get = mocker.patch("requests.get")
+        mock_get.side_effect = requests.exceptions.RequestException("Persistent error")
 
-    html = "<html><body><p>No heading</p></body></html>"
-    soup = BeautifulSoup(html, "html.parser")
+        extractor = base_extractor_cls(rate_limit_seconds=0, max_retries=3)
 
-    extractor = BaseExtractor()
-    result = extractor.extract_text(soup, "h1")
+        # Should raise after max retries
+        with pytest.raises(requests.exceptions.RequestException):
+            extractor.fetch_page("https://example.com/test")
 
-    assert result is None
+        # Should have tried 4 times (initial + 3 retries)
+        assert mock_get.call_count == 4
 
+    def test_fetch_page_timeout_handling(self, base_extractor_cls, mocker):
+        """Test timeout handling."""
+        mock_get = mocker.patch("requests.get")
+        mock_get.side_effect = requests.exceptions.Timeout("Timeout")
 
-def test_extract_text_with_strip():
-    """Test that extracted text is stripped of whitespace."""
-    try:
-        from extractors.base import BaseExtractor
-    except ImportError:
-        from src.extractors.base import BaseExtractor
+        extractor = base_extractor_cls(rate_limit_seconds=0, max_retries=2)
 
-    from bs4 import BeautifulSoup
+        with pytest.raises(requests.exceptions.Timeout):
+            extractor.fetch_page("https://example.com/test")
 
-    html = "<html><body><h1>  Whitespace  </h1></body></html>"
-    soup = BeautifulSoup(html, "html.parser")
+        # Should have tried 3 times (initial + 2 retries)
+        assert mock_get.call_count == 3
 
-    extractor = BaseExtractor()
-    result = extractor.extract_text(soup, "h1")
+    def test_exponential_backoff_timing(self, base_extractor_cls, mocker, no_sleep):
+        """Test that retry delays use exponential backoff."""
+        mock_get = mocker.patch("requests.get")
+        mock_get.side_effect = requests.exceptions.RequestException("Error")
 
-    assert result == "Whitespace"
+        extractor = base_extractor_cls(rate_limit_seconds=0, max_retries=3, backoff_factor=2)
 
+        with pytest.raises(requests.exceptions.RequestException):
+            extractor.fetch_page("https://example.com/test")
+
+        # Check that sleep was called with increasing delays
+        # Exponential backoff: (2^attempt) * backoff_factor
+        # First retry (attempt=1): 2^1 * 2 = 4
+        # Second retry (attempt=2): 2^2 * 2 = 8
+        # Third retry (attempt=3): 2^3 * 2 = 16
+        assert no_sleep.call_count == 3
+        delays = [call[0][0] for call in no_sleep.call_args_list]
+        assert delays[0] == 4  # First retry
+        assert delays[1] == 8  # Second retry
+        assert delays[2] == 16  # Third retry
 
-def test_extract_all_text_multiple_elements():
-    """Test extracting text from multiple elements."""
-    try:
-        from extractors.base import BaseExtractor
-    except ImportError:
-        from src.extractors.base import BaseExtractor
 
+@pytest.fixture(scope="module")
+def h1_soup():
+    """Parsed page with one heading and one paragraph (shared, read-only)."""
     from bs4 import BeautifulSoup
 
-    html = "<html><body><p>First</p><p>Second</p><p>Third</p></body></html>"
-    soup = BeautifulSoup(html, "html.parser")
+    return BeautifulSoup("<html><body><h1>Title</h1><p>Paragraph</p></body></html>", "lxml")
 
-    extractor = BaseExtractor()
-    result = extractor.extract_all_text(soup, "p")
 
-    assert len(result) == 3
-    assert result == ["First", "Second", "Third"]
+@pytest.fixture(scope="module")
+def paragraphs_soup():
+    """Parsed page with three paragraphs (shared, read-only)."""
+    from bs4 import BeautifulSoup
 
+    return BeautifulSoup("<html><body><p>First</p><p>Second</p><p>Third</p></body></html>", "lxml")
 
-def test_extract_all_text_empty():
-    """Test extract_all_text returns empty list when no elements found."""
-    try:
-        from extractors.base import BaseExtractor
-    except ImportError:
-        from src.extractors.base import BaseExtractor
 
+@pytest.fixture(scope="module")
+def empty_soup():
+    """Parsed page with no headings or paragraphs (shared, read-only)."""
     from bs4 import BeautifulSoup
 
-    html = "<html><body><div>No paragraphs</div></body></html>"
-    soup = BeautifulSoup(html, "html.parser")
+    return BeautifulSoup("<html><body><div>No content</div></body></html>", "lxml")
 
-    extractor = BaseExtractor()
-    result = extractor.extract_all_text(soup, "p")
 
-    assert result == []
+def test_extract_text_single_element(stateless_extractor, h1_soup):
+    """Test extracting text from single element."""
+    result = stateless_extractor.extract_text(h1_soup, "h1")
 
+    assert result == "Title"
 
-def test_context_manager():
-    """Test BaseExtractor works as context manager."""
-    try:
-        from extractors.base import BaseExtractor
-    except ImportError:
-        from src.extractors.base import BaseExtractor
 
-    with BaseExtractor() as extractor:
-        assert extractor is not None
-        assert hasattr(extractor, "fetch_page")
+def test_extract_text_not_found(stateless_extractor, empty_soup):
+    """Test extract_text returns None when element not found."""
+    result = stateless_extractor.extract_text(empty_soup, "h1")
 
-    # Context manager should exit cleanly
+    assert result is None
 
 
-def test_exponential_backoff_timing(mocker):
-    """Test that retry delays use exponential backoff."""
-    try:
-        from extractors.base import BaseExtractor
-    except ImportError:
-        from src.extractors.base import BaseExtractor
+def test_extract_text_with_strip(stateless_extractor):
+    """Test that extracted text is stripped of whitespace."""
+    from bs4 import BeautifulSoup
 
-    mock_get = mocker.patch("requests.get")
-    mock_get.side_effect = requests.exceptions.RequestException("Error")
+    html = "<html><body><h1>  Whitespace  </h1></body></html>"
+    soup = BeautifulSoup(html, "lxml")
 
-    mock_sleep = mocker.patch("time.sleep")
+    result = stateless_extractor.extract_text(soup, "h1")
+
+    assert result == "Whitespace"
 
-    extractor = BaseExtractor(rate_limit_seconds=0, max_retries=3, backoff_factor=2)
 
-    with pytest.raises(requests.exceptions.RequestException):
-        extractor.fetch_page("https://example.com/test")
+def test_extract_all_text_multiple_elements(stateless_extractor, paragraphs_soup):
+    """Test extracting text from multiple elements."""
+    result = stateless_extractor.extract_all_text(paragraphs_soup, "p")
+
+    assert len(result) == 3
+    assert result == ["First", "Second", "Third"]
 
-    # Check that sleep was called with increasing delays
-    # Exponential backoff: (2^attempt) * backoff_factor
-    # First retry (attempt=1): 2^1 * 2 = 4
-    # Second retry (attempt=2): 2^2 * 2 = 8
-    # Third retry (attempt=3): 2^3 * 2 = 16
-    assert mock_sleep.call_count == 3
-    delays = [call[0][0] for call in mock_sleep.call_args_list]
-    assert delays[0] == 4  # First retry
-    assert delays[1] == 8  # Second retry
-    assert delays[2] == 16  # Third retry
 
+def test_extract_all_text_empty(stateless_extractor, empty_soup):
+    """Test extract_all_text returns empty list when no elements found."""
+    result = stateless_extractor.extract_all_text(empty_soup, "p")
 
-def test_custom_timeout():
-    """Test custom timeout parameter."""
-    try:
-        from extractors.base import BaseExtractor
-    except ImportError:
-        from src.extractors.base import BaseExtractor
+    assert result == []
+
+
+def test_context_manager(base_extractor_cls):
+    """Test BaseExtractor works as context manager."""
+    with base_extractor_cls() as extractor:
+        assert extractor is not None
+        assert hasattr(extractor, "fetch_page")
+
+    # Context manager should exit cleanly
 
-    extractor = BaseExtractor(timeout=60)
+
+def test_custom_timeout(base_extractor_cls):
+    """Test custom timeout parameter."""
+    extractor = base_extractor_cls(timeout=60)
 
     assert extractor.timeout == 60
 
 
-def test_user_agent_header(mocker):
+def test_user_agent_header(base_extractor_cls, mocker):
     """Test that User-Agent header is set."""
-    try:
-        from extractors.base import BaseExtractor
-    except ImportError:
-        from src.extractors.base import BaseExtractor
-
     mock_response = mocker.Mock()
     mock_response.text = "<html></html>"
+    mock_response.headers = {"Content-Type": "text/html; charset=utf-8"}
     mock_response.raise_for_status = mocker.Mock()
     mock_get = mocker.patch("requests.get", return_value=mock_response)
 
-    extractor = BaseExtractor(rate_limit_seconds=0)
+    extractor = base_extractor_cls(rate_limit_seconds=0)
     extractor.fetch_page("https://example.com/test")
 
     # Check that User-Agent was set in headers
     call_kwargs = mock_get.call_args[1]
     assert "headers" in call_kwargs
     assert "User-Agent" in call_kwargs["headers"]
+
+
+def test_fetch_with_browser_uses_manager_page_pool(base_extractor_cls, mocker):
+    """Test browser fetch borrows a pooled page from the shared browser manager."""
+    mock_page = mocker.MagicMock()
+    mock_page.content.return_value = "<html><body><table>Rendered</table></body></html>"
+    mock_manager = mocker.MagicMock()
+    mock_manager.acquire_page.return_value.__enter__.return_value = mock_page
+
+    extractor = base_extractor_cls(render_js=True, browser_manager=mock_manager)
+    soup = extractor.fetch_page("https://example.com/test")
+
+    assert "Rendered" in soup.get_text()
+    mock_manager.rate_limit.assert_called_once()
+    mock_manager.acquire_page.assert_called_once()
+    mock_manager.get_browser.assert_not_called()
+    mock_page.goto.assert_called_once_with("https://example.com/test", wait_until="networkidle")
@@ -4,130 +4,158 @@ This module tests the shared browser and rate limiting functionality
 that ensures respectful crawling behavior across all extractors.
 """
 
+import sys
 import threading
 import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from types import ModuleType, SimpleNamespace
 from unittest.mock import MagicMock, patch
 
+import pytest
 
-def test_browser_manager_initialization():
-    """Test BrowserManager can be initialized with default rate limit range."""
-    try:
-        from utils.browser_manager import BrowserManager
-    except ImportError:
-        from src.utils.browser_manager import BrowserManager
+try:
+    from utils import browser_manager as bm_module
+    from utils.browser_manager import BrowserManager
+except ImportError:
+    from src.utils import browser_manager as bm_module
+    from src.utils.browser_manager import BrowserManager
 
-    manager = BrowserManager()
 
-    assert manager is not None
-    assert manager._rate_limit_range == (2.0, 4.0)
-    assert manager._last_request_time == 0
-    assert manager._browser is None
-    assert manager._playwright is None
+class FakeClock:
+    """Manually driven monotonic clock; wait() advances it instead of sleeping."""
+
+    def __init__(self, start: float = 100.0):
+        self.now = start
+        self.waits: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+    def wait(self, timeout: float) -> None:
+        self.waits.append(timeout)
+        self.now += timeout
+
+
+@pytest.fixture
+def fake_clock():
+    """Provide a FakeClock starting at t=100s."""
+    return FakeClock()
+
+
+def make_manager(clock: FakeClock, rate_limit_range: tuple[float, float]) -> BrowserManager:
+    """Build a BrowserManager whose rate limiter runs on the fake clock."""
+    manager = BrowserManager(rate_limit_range=rate_limit_range, clock=clock)
+    manager._rate_cond.wait = clock.wait
+    return manager
+
+
+@pytest.fixture(scope="module")
+def thread_pool():
+    """Provide worker threads shared by this module's concurrency tests."""
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        yield pool
+
+
+@pytest.fixture(scope="module")
+def default_bm():
+    """Provide one default BrowserManager for tests that only inspect it."""
+    return BrowserManager()
+
+
+@pytest.fixture
+def pw_mocks(mocker):
+    """Patch sync_playwright with a mock playwright -> chromium -> browser graph."""
+    playwright, browser, chromium = MagicMock(), MagicMock(), MagicMock()
+    chromium.launch.return_value = browser
+    playwright.chromium = chromium
+
+    sync_playwright = mocker.patch("src.utils.browser_manager.sync_playwright")
+    sync_playwright.return_value.start.return_value = playwright
+    return SimpleNamespace(
+        sync_playwright=sync_playwright,
+        playwright=playwright,
+        browser=browser,
+        chromium=chromium,
+    )
+
+
+def test_browser_manager_initialization(default_bm):
+    """Test BrowserManager can be initialized with default rate limit range."""
+    assert default_bm is not None
+    assert default_bm._rate_limit_range == (2.0, 4.0)
+    assert default_bm._last_request_time is None
+    assert default_bm._browser is None
+    assert default_bm._playwright is None
 
 
 def test_browser_manager_custom_rate_limit():
     """Test BrowserManager accepts custom rate limit range."""
-    try:
-        from utils.browser_manager import BrowserManager
-    except ImportError:
-        from src.utils.browser_manager import BrowserManager
-
     manager = BrowserManager(rate_limit_range=(1.0, 3.0))
 
     assert manager._rate_limit_range == (1.0, 3.0)
 
 
-def test_rate_limit_first_request():
+def test_rate_limit_first_request(fake_clock):
     """Test rate limiting on first request (no previous request time)."""
-    try:
-        from utils.browser_manager import BrowserManager
-    except ImportError:
-        from src.utils.browser_manager import BrowserManager
-
-    manager = BrowserManager(rate_limit_range=(0.1, 0.2))
+    manager = make_manager(fake_clock, (0.1, 0.2))
 
     # First request should NOT sleep (no previous request time)
-    start_time = time.time()
     manager.rate_limit()
-    elapsed = time.time() - start_time
 
-    # Should complete almost immediately (no sleep on first request)
-    assert elapsed < 0.1  # Should be very fast
+    assert fake_clock.waits == []
     # But should update last_request_time
-    assert manager._last_request_time > 0
+    assert manager._last_request_time == 100.0
 
 
-def test_rate_limit_subsequent_requests():
+def test_rate_limit_subsequent_requests(fake_clock):
     """Test rate limiting enforces delays between requests."""
-    try:
-        from utils.browser_manager import BrowserManager
-    except ImportError:
-        from src.utils.browser_manager import BrowserManager
-
-    manager = BrowserManager(rate_limit_range=(0.1, 0.2))
+    manager = make_manager(fake_clock, (0.1, 0.2))
 
-    # First request
+    # First request, then an immediate second one
     manager.rate_limit()
-    first_request_time = time.time()
-
-    # Immediate second request should be delayed
     manager.rate_limit()
-    second_request_time = time.time()
 
-    elapsed = second_request_time - first_request_time
+    # Second request waited a delay from the range
+    assert len(fake_clock.waits) == 1
+    assert 0.1 <= fake_clock.waits[0] <= 0.2
+    assert fake_clock.now == pytest.approx(100.0 + fake_clock.waits[0])
 
-    # Should be at least min_delay
-    assert elapsed >= 0.1
 
-
-def test_rate_limit_no_delay_if_enough_time_passed():
+def test_rate_limit_no_delay_if_enough_time_passed(fake_clock):
     """Test rate limiting doesn't sleep if enough time has already elapsed."""
-    try:
-        from utils.browser_manager import BrowserManager
-    except ImportError:
-        from src.utils.browser_manager import BrowserManager
-
-    manager = BrowserManager(rate_limit_range=(0.1, 0.2))
+    manager = make_manager(fake_clock, (0.1, 0.2))
 
     # First request
     manager.rate_limit()
 
     # Wait longer than max delay
-    time.sleep(0.3)
+    fake_clock.advance(0.3)
 
     # Second request should not need additional delay
-    start_time = time.time()
     manager.rate_limit()
-    elapsed = time.time() - start_time
 
-    # Should complete almost immediately (< 0.05s overhead)
-    assert elapsed < 0.05
+    assert fake_clock.waits == []
 
 
-def test_rate_limit_thread_safety():
+def test_rate_limit_thread_safety(thread_pool):
     """Test rate limiting is thread-safe with concurrent calls."""
-    try:
-        from utils.browser_manager import BrowserManager
-    except ImportError:
-        from src.utils.browser_manager import BrowserManager
-
     manager = BrowserManager(rate_limit_range=(0.05, 0.1))
     request_times = []
+    start = threading.Barrier(5, timeout=5)
 
     def make_request():
+        start.wait()
         manager.rate_limit()
-        request_times.append(time.time())
-
-    # Launch 5 threads simultaneously
-    threads = []
-    for _ in range(5):
-        t = threading.Thread(target=make_request)
-        threads.append(t)
-        t.start()
+        request_times.append(time.monotonic())
 
-    # Wait for all threads to complete
-    for t in threads:
-        t.join()
+    # Release 5 calls at once and wait for all of them
+    futures = [thread_pool.submit(make_request) for _ in range(5)]
+    for future in futures:
+        future.result()
 
     # Verify we got 5 request times
     assert len(request_times) == 5
@@ -140,302 +168,197 @@ def test_rate_limit_thread_safety():
         assert time_between >= 0.04  # Allow 0.01s tolerance
 
 
-def test_get_browser_creates_browser():
+def test_get_browser_creates_browser(pw_mocks):
     """Test get_browser creates a Playwright browser on first call."""
-    try:
-        from utils.browser_manager import BrowserManager
-    except ImportError:
-        from src.utils.browser_manager import BrowserManager
-
     manager = BrowserManager()
 
-    # Mock Playwright
-    mock_playwright = MagicMock()
-    mock_browser = MagicMock()
-    mock_chromium = MagicMock()
-    mock_chromium.launch.return_value = mock_browser
-    mock_playwright.chromium = mock_chromium
+    browser = manager.get_browser()
 
-    with patch("src.utils.browser_manager.sync_playwright") as mock_sync_playwright:
-        mock_sync_playwright.return_value.start.return_value = mock_playwright
+    # Verify Playwright was initialized
+    pw_mocks.sync_playwright.return_value.start.assert_called_once()
+    pw_mocks.chromium.launch.assert_called_once_with(headless=True)
 
-        browser = manager.get_browser()
-
-        # Verify Playwright was initialized
-        mock_sync_playwright.return_value.start.assert_called_once()
-        mock_chromium.launch.assert_called_once_with(headless=True)
-
-        # Verify browser is returned
-        assert browser is mock_browser
-        assert manager._browser is mock_browser
-        assert manager._playwright is mock_playwright
+    # Verify browser is returned
+    assert browser is pw_mocks.browser
+    assert manager._browser is pw_mocks.browser
+    assert manager._playwright is pw_mocks.playwright
 
 
-def test_get_browser_reuses_browser():
+def test_get_browser_reuses_browser(pw_mocks):
     """Test get_browser reuses existing browser on subsequent calls."""
-    try:
-        from utils.browser_manager import BrowserManager
-    except ImportError:
-        from src.utils.browser_manager import BrowserManager
-
     manager = BrowserManager()
 
-    # Mock Playwright
-    mock_playwright = MagicMock()
-    mock_browser = MagicMock()
-    mock_chromium = MagicMock()
-    mock_chromium.launch.return_value = mock_browser
-    mock_playwright.chromium = mock_chromium
+    # First call creates browser
+    browser1 = manager.get_browser()
 
-    with patch("src.utils.browser_manager.sync_playwright") as mock_sync_playwright:
-        mock_sync_playwright.return_value.start.return_value = mock_playwright
+    # Second call should reuse same browser
+    browser2 = manager.get_browser()
 
-        # First call creates browser
-        browser1 = manager.get_browser()
+    # Verify Playwright was only initialized once
+    assert pw_mocks.sync_playwright.return_value.start.call_count == 1
+    assert pw_mocks.chromium.launch.call_count == 1
 
-        # Second call should reuse same browser
-        browser2 = manager.get_browser()
+    # Verify same browser returned
+    assert browser1 is browser2
 
-        # Verify Playwright was only initialized once
-        assert mock_sync_playwright.return_value.start.call_count == 1
-        assert mock_chromium.launch.call_count == 1
 
-        # Verify same browser returned
-        assert browser1 is browser2
+def test_get_browser_skips_lock_once_initialized():
+    """Test get_browser returns an existing browser without taking the lock."""
+    manager = BrowserManager()
+    mock_browser = MagicMock()
+    manager._browser = mock_browser
+    manager._browser_lock = MagicMock()
+
+    assert manager.get_browser() is mock_browser
+    manager._browser_lock.__enter__.assert_not_called()
 
 
-def test_get_browser_thread_safety():
+def test_get_browser_thread_safety(pw_mocks, thread_pool):
     """Test get_browser is thread-safe when called concurrently."""
-    try:
-        from utils.browser_manager import BrowserManager
-    except ImportError:
-        from src.utils.browser_manager import BrowserManager
-
     manager = BrowserManager()
     browsers = []
+    start = threading.Barrier(5, timeout=5)
 
-    # Mock Playwright
-    mock_playwright = MagicMock()
-    mock_browser = MagicMock()
-    mock_chromium = MagicMock()
-    mock_chromium.launch.return_value = mock_browser
-    mock_playwright.chromium = mock_chromium
-
-    with patch("src.utils.browser_manager.sync_playwright") as mock_sync_playwright:
-        mock_sync_playwright.return_value.start.return_value = mock_playwright
+    def get_browser():
+        start.wait()
+        browsers.append(manager.get_browser())
 
-        def get_browser():
-            browsers.append(manager.get_browser())
+    # Release 5 calls at once and wait for all of them
+    futures = [thread_pool.submit(get_browser) for _ in range(5)]
+    for future in futures:
+        future.result()
 
-        # Launch 5 threads simultaneously
-        threads = []
-        for _ in range(5):
-            t = threading.Thread(target=get_browser)
-            threads.append(t)
-            t.start()
+    # Verify all threads got the same browser instance
+    assert len(browsers) == 5
+    assert all(b is pw_mocks.browser for b in browsers)
 
-        # Wait for all threads to complete
-        for t in threads:
-            t.join()
+    # Verify Playwright was only initialized once (thread-safe)
+    assert pw_mocks.sync_playwright.return_value.start.call_count == 1
 
-        # Verify all threads got the same browser instance
-        assert len(browsers) == 5
-        assert all(b is mock_browser for b in browsers)
 
-        # Verify Playwright was only initialized once (thread-safe)
-        assert mock_sync_playwright.return_value.start.call_count == 1
-
-
-def test_close_cleans_up_browser():
+def test_close_cleans_up_browser(pw_mocks):
     """Test close() properly cleans up browser and Playwright resources."""
-    try:
-        from utils.browser_manager import BrowserManager
-    except ImportError:
-        from src.utils.browser_manager import BrowserManager
-
     manager = BrowserManager()
 
-    # Mock Playwright
-    mock_playwright = MagicMock()
-    mock_browser = MagicMock()
-    mock_chromium = MagicMock()
-    mock_chromium.launch.return_value = mock_browser
-    mock_playwright.chromium = mock_chromium
-
-    with patch("src.utils.browser_manager.sync_playwright") as mock_sync_playwright:
-        mock_sync_playwright.return_value.start.return_value = mock_playwright
-
-        # Create browser
-        manager.get_browser()
+    # Create browser
+    manager.get_browser()
 
-        # Close
-        manager.close()
+    # Close
+    manager.close()
 
-        # Verify cleanup
-        mock_browser.close.assert_called_once()
-        mock_playwright.stop.assert_called_once()
+    # Verify cleanup
+    pw_mocks.browser.close.assert_called_once()
+    pw_mocks.playwright.stop.assert_called_once()
 
-        # Verify internal state cleared
-        assert manager._browser is None
-        assert manager._playwright is None
+    # Verify internal state cleared
+    assert manager._browser is None
+    assert manager._playwright is None
 
 
-def test_close_when_browser_not_initialized():
+def test_close_when_browser_not_initialized(default_bm):
     """Test close() handles case where browser was never created."""
-    try:
-        from utils.browser_manager import BrowserManager
-    except ImportError:
-        from src.utils.browser_manager import BrowserManager
-
-    manager = BrowserManager()
-
     # Should not raise exception
-    manager.close()
+    default_bm.close()
 
     # Internal state should remain None
-    assert manager._browser is None
-    assert manager._playwright is None
+    assert default_bm._browser is None
+    assert default_bm._playwright is None
 
 
-def test_context_manager_enter():
+def test_context_manager_enter(default_bm):
     """Test BrowserManager can be used as context manager (enter)."""
-    try:
-        from utils.browser_manager import BrowserManager
-    except ImportError:
-        from src.utils.browser_manager import BrowserManager
-
-    manager = BrowserManager()
-
     # __enter__ should return self
-    result = manager.__enter__()
-    assert result is manager
+    assert default_bm.__enter__() is default_bm
 
 
-def test_context_manager_exit():
+def test_context_manager_exit(pw_mocks):
     """Test BrowserManager context manager properly cleans up on exit."""
-    try:
-        from utils.browser_manager import BrowserManager
-    except ImportError:
-        from src.utils.browser_manager import BrowserManager
-
     manager = BrowserManager()
 
-    # Mock Playwright
-    mock_playwright = MagicMock()
-    mock_browser = MagicMock()
-    mock_chromium = MagicMock()
-    mock_chromium.launch.return_value = mock_browser
-    mock_playwright.chromium = mock_chromium
-
-    with patch("src.utils.browser_manager.sync_playwright") as mock_sync_playwright:
-        mock_sync_playwright.return_value.start.return_value = mock_playwright
+    # Create browser
+    manager.get_browser()
 
-        # Create browser
-        manager.get_browser()
+    # Call __exit__
+    result = manager.__exit__(None, None, None)
 
-        # Call __exit__
-        result = manager.__exit__(None, None, None)
+    # Verify cleanup
+    pw_mocks.browser.close.assert_called_once()
+    pw_mocks.playwright.stop.assert_called_once()
 
-        # Verify cleanup
-        mock_browser.close.assert_called_once()
-        mock_playwright.stop.assert_called_once()
+    # Verify __exit__ returns False (don't suppress exceptions)
+    assert result is False
 
-        # Verify __exit__ returns False (don't suppress exceptions)
-        assert result is False
 
-
-def test_context_manager_integration():
+def test_context_manager_integration(pw_mocks):
     """Test BrowserManager works correctly with 'with' statement."""
-    try:
-        from utils.browser_manager import BrowserManager
-    except ImportError:
-        from src.utils.browser_manager import BrowserManager
-
-    # Mock Playwright
-    mock_playwright = MagicMock()
-    mock_browser = MagicMock()
-    mock_chromium = MagicMock()
-    mock_chromium.launch.return_value = mock_browser
-    mock_playwright.chromium = mock_chromium
-
-    with patch("src.utils.browser_manager.sync_playwright") as mock_sync_playwright:
-        mock_sync_playwright.return_value.start.return_value = mock_playwright
-
-        with BrowserManager() as manager:
-            # Get browser inside context
-            browser = manager.get_browser()
-            assert browser is mock_browser
+    with BrowserManager() as manager:
+        # Get browser inside context
+        browser = manager.get_browser()
+        assert browser is pw_mocks.browser
 
-        # After exiting context, verify cleanup was called
-        mock_browser.close.assert_called_once()
-        mock_playwright.stop.assert_called_once()
+    # After exiting context, verify cleanup was called
+    pw_mocks.browser.close.assert_called_once()
+    pw_mocks.playwright.stop.assert_called_once()
 
 
 def test_rate_limit_randomization():
     """Test rate limiting uses random delays within range."""
-    try:
-        from utils.browser_manager import BrowserManager
-    except ImportError:
-        from src.utils.browser_manager import BrowserManager
-
     manager = BrowserManager(rate_limit_range=(0.1, 0.3))
 
-    # Collect multiple delay times (need to make 2 calls each time to measure delay)
-    delays = []
-    for _ in range(10):
-        # Reset to measure fresh delay
-        manager._last_request_time = 0
+    delays = [manager._compute_delay() for _ in range(10)]
 
-        # First call sets the baseline (no sleep)
-        manager.rate_limit()
+    # Verify all delays are within range
+    assert all(0.1 <= delay <= 0.3 for delay in delays)
 
-        # Second call will sleep - measure this
-        start_time = time.time()
-        manager.rate_limit()
-        elapsed = time.time() - start_time
-        delays.append(elapsed)
+    # Verify delays are different (not all the same)
+    assert len({round(delay, 2) for delay in delays}) >= 5
 
-    # Verify all delays are within range (with tolerance)
-    for delay in delays:
-        assert 0.09 <= delay <= 0.35  # Allow 0.05s overhead
 
-    # Verify delays are different (not all the same)
-    # At least 5 out of 10 should be different
-    unique_delays = len({round(d, 2) for d in delays})
-    assert unique_delays >= 5
+def test_rate_limit_waits_computed_delay(fake_clock, mocker):
+    """Test rate_limit() spaces requests by the drawn delay."""
+    manager = make_manager(fake_clock, (0.1, 0.3))
+    mocker.patch.object(manager, "_compute_delay", return_value=0.25)
 
+    manager.rate_limit()
+    manager.rate_limit()
 
-def test_rate_limit_updates_last_request_time():
-    """Test rate_limit() properly updates _last_request_time."""
-    try:
-        from utils.browser_manager import BrowserManager
-    except ImportError:
-        from src.utils.browser_manager import BrowserManager
+    assert fake_clock.waits == [0.25]
 
-    manager = BrowserManager(rate_limit_range=(0.05, 0.1))
+
+def test_rate_limit_updates_last_request_time(fake_clock):
+    """Test rate_limit() properly updates _last_request_time."""
+    manager = make_manager(fake_clock, (0.05, 0.1))
 
     # Initial state
-    assert manager._last_request_time == 0
+    assert manager._last_request_time is None
 
     # First call should update time
     manager.rate_limit()
     first_time = manager._last_request_time
-    assert first_time > 0
+    assert first_time == 100.0
 
     # Second call should update to new time
-    time.sleep(0.15)
+    fake_clock.advance(0.15)
+    manager.rate_limit()
+    assert manager._last_request_time == pytest.approx(100.15)
+
+
+def test_rate_limit_spaces_requests_from_clock_zero():
+    """Test a first request at t=0 still delays the next one (0.0 is a real reading)."""
+    clock = FakeClock(start=0.0)
+    manager = make_manager(clock, (1.0, 1.0))
+
+    manager.rate_limit()
+    assert manager._last_request_time == 0.0
+    assert clock.waits == []
+
     manager.rate_limit()
-    second_time = manager._last_request_time
-    assert second_time > first_time
+    assert clock.waits == [1.0]
+    assert manager._last_request_time == 1.0
 
 
 def test_multiple_managers_independent():
     """Test multiple BrowserManager instances are independent."""
-    try:
-        from utils.browser_manager import BrowserManager
-    except ImportError:
-        from src.utils.browser_manager import BrowserManager
-
     manager1 = BrowserManager(rate_limit_range=(0.1, 0.2))
     manager2 = BrowserManager(rate_limit_range=(0.2, 0.3))
 
@@ -443,27 +366,510 @@ def test_multiple_managers_independent():
     assert manager1._rate_limit_range != manager2._rate_limit_range
 
     # Different locks
-    assert manager1._lock is not manager2._lock
+    assert manager1._rate_cond is not manager2._rate_cond
+    assert manager1._browser_lock is not manager2._browser_lock
 
     # Independent last_request_time
     manager1.rate_limit()
-    assert manager1._last_request_time > 0
-    assert manager2._last_request_time == 0
+    assert manager1._last_request_time is not None
+    assert manager2._last_request_time is None
 
 
 def test_rate_limit_with_zero_range():
     """Test rate limiting with zero-delay range (for testing)."""
-    try:
-        from utils.browser_manager import BrowserManager
-    except ImportError:
-        from src.utils.browser_manager import BrowserManager
-
     manager = BrowserManager(rate_limit_range=(0.0, 0.0))
 
     # Should complete almost immediately
-    start_time = time.time()
+    start_time = time.monotonic()
     manager.rate_limit()
-    elapsed = time.time() - start_time
+    elapsed = time.monotonic() - start_time
 
     # Should be very fast (< 0.01s)
     assert elapsed < 0.01
+
+
+def test_context_pool_size_validation():
+    """Test BrowserManager rejects a context pool smaller than one."""
+    with pytest.raises(ValueError, match="context_pool_size"):
+        BrowserManager(context_pool_size=0)
+
+
+def test_acquire_page_recycles_context(pw_mocks):
+    """Test acquire_page closes pages but reuses the same browser context."""
+    manager = BrowserManager()
+
+    with manager.acquire_page() as page1:
+        assert page1 is pw_mocks.browser.new_context.return_value.new_page.return_value
+    with manager.acquire_page():
+        pass
+
+    # One context created, two pages opened and closed
+    assert pw_mocks.browser.new_context.call_count == 1
+    context = pw_mocks.browser.new_context.return_value
+    assert context.new_page.call_count == 2
+    assert context.new_page.return_value.close.call_count == 2
+
+
+def test_acquire_page_releases_context_on_error(pw_mocks):
+    """Test acquire_page returns the context to the pool when the caller raises."""
+    manager = BrowserManager()
+
+    with pytest.raises(RuntimeError):
+        with manager.acquire_page():
+            raise RuntimeError("navigation failed")
+
+    context = pw_mocks.browser.new_context.return_value
+    context.new_page.return_value.close.assert_called_once()
+    assert manager._idle_contexts.qsize() == 1
+
+
+def test_acquire_page_bounded_pool(pw_mocks):
+    """Test acquire_page never creates more contexts than the pool size."""
+    manager = BrowserManager(context_pool_size=2)
+    pw_mocks.browser.new_context.side_effect = lambda: MagicMock()
+
+    with manager.acquire_page(), manager.acquire_page():
+        assert pw_mocks.browser.new_context.call_count == 2
+
+    # Both contexts are idle again and get reused
+    with manager.acquire_page():
+        pass
+    assert pw_mocks.browser.new_context.call_count == 2
+    assert len(manager._contexts) == 2
+
+
+def test_close_closes_pooled_contexts(pw_mocks):
+    """Test close() closes pooled contexts before the browser."""
+    manager = BrowserManager()
+
+    with manager.acquire_page():
+        pass
+
+    manager.close()
+
+    pw_mocks.browser.new_context.return_value.close.assert_called_once()
+    pw_mocks.browser.close.assert_called_once()
+    assert manager._contexts == []
+    assert manager._idle_contexts.empty()
+
+
+def test_acquire_page_waits_for_context_when_pool_full(pw_mocks, thread_pool):
+    """Test a caller blocks until the only pooled context is released, then reuses it."""
+    manager = BrowserManager(context_pool_size=1)
+    pw_mocks.browser.new_context.side_effect = lambda: MagicMock()
+    acquired = threading.Event()
+
+    def second_caller():
+        with manager.acquire_page():
+            acquired.set()
+
+    with manager.acquire_page():
+        future = thread_pool.submit(second_caller)
+        assert not acquired.wait(timeout=0.05)  # Pool is full: second caller waits
+
+    future.result(timeout=5)
+    assert acquired.is_set()
+    assert pw_mocks.browser.new_context.call_count == 1
+
+
+def test_release_after_close_closes_context_instead_of_pooling(pw_mocks):
+    """Test a page released after close() does not put its dead context back in the pool."""
+    manager = BrowserManager()
+    old_context, new_context = MagicMock(), MagicMock()
+    pw_mocks.browser.new_context.side_effect = [old_context, new_context]
+
+    with manager.acquire_page():
+        manager.close()
+
+    assert manager._idle_contexts.empty()
+    assert old_context.close.call_count == 2  # Once by close(), once on release
+
+    # The next caller gets a fresh context, not the closed one
+    with manager.acquire_page() as page:
+        assert page is new_context.new_page.return_value
+
+
+def test_release_after_close_ignores_context_close_error(pw_mocks):
+    """Test releasing a context after close() tolerates the context already being gone."""
+    manager = BrowserManager()
+    pw_mocks.browser.new_context.return_value.close.side_effect = Exception("gone")
+
+    with manager.acquire_page():
+        manager.close()
+
+    assert manager._idle_contexts.empty()
+
+
+def test_close_wakes_callers_waiting_for_context(pw_mocks, thread_pool):
+    """Test close() wakes every caller blocked on a full pool instead of leaving them hung."""
+    manager = BrowserManager(context_pool_size=1)
+
+    def waiting_caller():
+        with manager.acquire_page():
+            pass
+
+    with manager.acquire_page():
+        futures = [thread_pool.submit(waiting_caller) for _ in range(3)]
+        time.sleep(0.05)  # Let the callers block on the full pool
+        manager.close()
+
+        for future in futures:
+            with pytest.raises(RuntimeError, match="closed while waiting"):
+                future.result(timeout=5)
+
+
+def test_close_ignores_cleanup_errors(pw_mocks):
+    """Test close() finishes and clears state when contexts, browser and Playwright fail to close."""
+    manager = BrowserManager()
+    with manager.acquire_page():
+        pass
+
+    pw_mocks.browser.new_context.return_value.close.side_effect = Exception("context")
+    pw_mocks.browser.close.side_effect = Exception("browser")
+    pw_mocks.playwright.stop.side_effect = Exception("playwright")
+
+    manager.close()
+
+    pw_mocks.playwright.stop.assert_called_once()
+    assert manager._browser is None
+    assert manager._playwright is None
+    assert manager._contexts == []
+
+
+def test_load_sync_playwright_imports_on_first_use(monkeypatch):
+    """Test Playwright's sync API is imported lazily and bound at module level."""
+    fake_sync_playwright = MagicMock(name="sync_playwright")
+    fake_sync_api = ModuleType("playwright.sync_api")
+    fake_sync_api.sync_playwright = fake_sync_playwright
+    fake_playwright = ModuleType("playwright")
+    fake_playwright.sync_api = fake_sync_api
+    monkeypatch.setitem(sys.modules, "playwright", fake_playwright)
+    monkeypatch.setitem(sys.modules, "playwright.sync_api", fake_sync_api)
+    monkeypatch.setattr(bm_module, "sync_playwright", None)
+
+    with warnings.catch_warnings():  # Keep the installed filters out of other tests
+        assert bm_module._load_sync_playwright() is fake_sync_playwright
+        assert bm_module.sync_playwright is fake_sync_playwright
+
+        # Later calls reuse the bound function without importing again
+        monkeypatch.delitem(sys.modules, "playwright.sync_api")
+        assert bm_module._load_sync_playwright() is fake_sync_playwright
+
+
+def test_get_browser_reuses_warm_browser_over_cdp(monkeypatch, pw_mocks):
+    """Test get_browser connects over CDP when OBRL_CDP_URL is set."""
+    monkeypatch.setenv("OBRL_CDP_URL", "http://127.0.0.1:9333")
+    manager = BrowserManager()
+
+    mock_browser = MagicMock()
+    pw_mocks.chromium.connect_over_cdp.return_value = mock_browser
+
+    browser = manager.get_browser()
+
+    assert browser is mock_browser
+    pw_mocks.chromium.connect_over_cdp.assert_called_once_with("http://127.0.0.1:9333")
+    pw_mocks.chromium.launch.assert_not_called()
+
+
+@pytest.fixture
+def warm_pid_file(monkeypatch, tmp_path):
+    """Point the PID file and /proc at tmp_path; pid 4242 runs the warm Chromium."""
+    pid_file = tmp_path / "chromium.pid"
+    monkeypatch.setattr(bm_module, "CHROMIUM_PID_FILE", pid_file)
+    monkeypatch.setattr(bm_module, "PROC_DIR", tmp_path / "proc")
+    set_cmdline(tmp_path, 4242, ["chromium", f"--user-data-dir={tmp_path / 'profile'}"])
+    return pid_file
+
+
+def set_cmdline(tmp_path, pid: int, argv: list[str]) -> None:
+    """Write a fake /proc/<pid>/cmdline under tmp_path."""
+    proc = tmp_path / "proc" / str(pid)
+    proc.mkdir(parents=True, exist_ok=True)
+    (proc / "cmdline").write_bytes(b"\0".join(arg.encode() for arg in argv) + b"\0")
+
+
+def test_get_browser_starts_detached_chromium_when_cdp_unreachable(monkeypatch, tmp_path, pw_mocks):
+    """Test get_browser starts a detached Chromium and records its PID."""
+    pid_file = tmp_path / "chromium.pid"
+    monkeypatch.setenv("OBRL_CDP_URL", "http://127.0.0.1:9333")
+    monkeypatch.setattr(bm_module, "CHROMIUM_PID_FILE", pid_file)
+    monkeypatch.setattr(bm_module, "CDP_CONNECT_INTERVAL", 0)
+    manager = bm_module.BrowserManager()
+
+    mock_browser = MagicMock()
+    pw_mocks.chromium.connect_over_cdp.side_effect = [ConnectionError(), mock_browser]
+
+    with patch("src.utils.browser_manager.subprocess.Popen") as mock_popen:
+        mock_popen.return_value.pid = 4242
+
+        browser = manager.get_browser()
+
+        assert browser is mock_browser
+        assert "--remote-debugging-port=9333" in mock_popen.call_args.args[0]
+        assert pid_file.read_text() == "4242"
+        pw_mocks.chromium.launch.assert_not_called()
+
+
+def test_get_browser_falls_back_to_launch_when_warm_start_fails(
+    monkeypatch, warm_pid_file, pw_mocks
+):
+    """Test a detached browser that never answers is stopped and a local one launched."""
+    monkeypatch.setenv("OBRL_CDP_URL", "http://127.0.0.1:9333")
+    monkeypatch.setattr(bm_module, "CDP_CONNECT_INTERVAL", 0)
+    manager = bm_module.BrowserManager()
+
+    pw_mocks.chromium.connect_over_cdp.side_effect = ConnectionError()
+
+    with (
+        patch("src.utils.browser_manager.subprocess.Popen") as mock_popen,
+        patch("src.utils.browser_manager.os.killpg") as mock_killpg,
+    ):
+        mock_popen.return_value.pid = 4242
+        browser = manager.get_browser()
+
+    mock_killpg.assert_called_once_with(4242, bm_module.signal.SIGTERM)
+    assert not warm_pid_file.exists()
+    assert browser is pw_mocks.browser
+    pw_mocks.chromium.launch.assert_called_once_with(headless=True)
+    # One probe before spawning, then every retry while waiting for the port
+    assert pw_mocks.chromium.connect_over_cdp.call_count == 1 + bm_module.CDP_CONNECT_ATTEMPTS
+
+
+def test_get_browser_falls_back_to_launch_when_spawn_fails(monkeypatch, tmp_path, pw_mocks):
+    """Test get_browser launches a local browser if the detached one cannot be started."""
+    monkeypatch.setenv("OBRL_CDP_URL", "http://localhost:9333")
+    monkeypatch.setattr(bm_module, "CHROMIUM_PID_FILE", tmp_path / "chromium.pid")
+    manager = bm_module.BrowserManager()
+
+    pw_mocks.chromium.connect_over_cdp.side_effect = ConnectionError()
+
+    with patch(
+        "src.utils.browser_manager.subprocess.Popen", side_effect=FileNotFoundError("chrome")
+    ):
+        browser = manager.get_browser()
+
+    assert browser is pw_mocks.browser
+    pw_mocks.chromium.connect_over_cdp.assert_called_once()  # No retries without a process
+    pw_mocks.chromium.launch.assert_called_once_with(headless=True)
+    assert not (tmp_path / "chromium.pid").exists()
+
+
+def test_get_browser_does_not_start_chromium_for_remote_cdp_url(monkeypatch, pw_mocks):
+    """Test an unreachable remote CDP endpoint falls back to launch without spawning."""
+    monkeypatch.setenv("OBRL_CDP_URL", "http://browser.example.com:9222")
+    manager = bm_module.BrowserManager()
+
+    pw_mocks.chromium.connect_over_cdp.side_effect = ConnectionError()
+
+    with patch("src.utils.browser_manager.subprocess.Popen") as mock_popen:
+        browser = manager.get_browser()
+
+    mock_popen.assert_not_called()
+    assert browser is pw_mocks.browser
+    pw_mocks.chromium.launch.assert_called_once_with(headless=True)
+
+
+def test_close_kill_terminates_warm_browser(warm_pid_file):
+    """Test close(kill=True) terminates the warm Chromium from the PID file."""
+    warm_pid_file.write_text("4242")
+    manager = bm_module.BrowserManager()
+
+    with patch("src.utils.browser_manager.os.killpg") as mock_killpg:
+        manager.close(kill=True)
+
+        mock_killpg.assert_called_once_with(4242, bm_module.signal.SIGTERM)
+        assert not warm_pid_file.exists()
+
+
+def test_close_interrupted_kill_terminates_warm_browser(warm_pid_file, pw_mocks):
+    """Test close(interrupted=True, kill=True) still stops the warm Chromium on Ctrl+C."""
+    warm_pid_file.write_text("4242")
+    manager = bm_module.BrowserManager()
+    manager.get_browser()
+
+    with patch("src.utils.browser_manager.os.killpg") as mock_killpg:
+        manager.close(interrupted=True, kill=True)
+
+        mock_killpg.assert_called_once_with(4242, bm_module.signal.SIGTERM)
+        assert not warm_pid_file.exists()
+    pw_mocks.browser.close.assert_not_called()  # Interrupted: references dropped only
+    assert manager._browser is None
+
+
+@pytest.mark.parametrize("contents", [None, "not-a-pid"])
+def test_stop_warm_browser_without_valid_pid_file(warm_pid_file, contents):
+    """Test stop_warm_browser does nothing when no usable PID was recorded."""
+    if contents is not None:
+        warm_pid_file.write_text(contents)
+
+    with patch("src.utils.browser_manager.os.killpg") as mock_killpg:
+        assert bm_module.stop_warm_browser() is False
+
+        mock_killpg.assert_not_called()
+
+
+def test_stop_warm_browser_process_already_gone(warm_pid_file):
+    """Test a stale PID file is removed when the recorded process has exited."""
+    warm_pid_file.write_text("5151")  # No /proc entry
+
+    with patch("src.utils.browser_manager.os.killpg") as mock_killpg:
+        assert bm_module.stop_warm_browser() is False
+
+        mock_killpg.assert_not_called()
+    assert not warm_pid_file.exists()
+
+
+def test_stop_warm_browser_exits_between_check_and_signal(warm_pid_file):
+    """Test a browser exiting right after the check is reported as not signalled."""
+    warm_pid_file.write_text("4242")
+
+    with patch("src.utils.browser_manager.os.killpg", side_effect=ProcessLookupError()):
+        assert bm_module.stop_warm_browser() is False
+
+    assert not warm_pid_file.exists()
+
+
+def test_stop_warm_browser_ignores_reused_pid(warm_pid_file, tmp_path):
+    """Test a PID now owned by an unrelated process is never signalled."""
+    warm_pid_file.write_text("5151")
+    set_cmdline(tmp_path, 5151, ["/usr/bin/postgres", "-D", "/var/lib/postgres"])
+
+    with patch("src.utils.browser_manager.os.killpg") as mock_killpg:
+        assert bm_module.stop_warm_browser() is False
+
+        mock_killpg.assert_not_called()
+    assert not warm_pid_file.exists()
+
+
+def test_stop_warm_browser_signals_recorded_process_group(warm_pid_file):
+    """Test stop_warm_browser sends SIGTERM to the recorded browser's process group."""
+    warm_pid_file.write_text("4242\n")
+
+    with patch("src.utils.browser_manager.os.killpg") as mock_killpg:
+        assert bm_module.stop_warm_browser() is True
+
+        mock_killpg.assert_called_once_with(4242, bm_module.signal.SIGTERM)
+    assert not warm_pid_file.exists()
+
+
+def test_close_without_kill_leaves_warm_browser(warm_pid_file):
+    """Test close() leaves the warm Chromium running by default."""
+    warm_pid_file.write_text("4242")
+    manager = bm_module.BrowserManager()
+
+    with patch("src.utils.browser_manager.os.killpg") as mock_killpg:
+        manager.close()
+
+        mock_killpg.assert_not_called()
+        assert warm_pid_file.exists()
+
+
+def test_close_interrupted_wakes_rate_limit_sleeper():
+    """Test close(interrupted=True) wakes a caller sleeping in rate_limit()."""
+    manager = BrowserManager(rate_limit_range=(5.0, 5.0))
+    manager.rate_limit()  # First request: no wait
+
+    sleeper = threading.Thread(target=manager.rate_limit)
+    start_time = time.monotonic()
+    sleeper.start()
+    time.sleep(0.05)
+
+    manager.close(interrupted=True)
+    sleeper.join(timeout=1.0)
+
+    # Woken long before the 5s delay elapsed
+    assert not sleeper.is_alive()
+    assert time.monotonic() - start_time < 1.0
+
+
+def test_reuse_after_interrupted_close_restores_rate_limit(pw_mocks, fake_clock):
+    """Test a browser re-created after close(interrupted=True) is rate limited again."""
+    manager = make_manager(fake_clock, (1.0, 1.0))
+    manager.close(interrupted=True)
+
+    manager.get_browser()
+    manager.rate_limit()
+    manager.rate_limit()
+
+    assert fake_clock.waits == [1.0]
+    assert manager._last_request_time == 101.0
+
+
+def test_rate_limit_uses_monotonic_clock(mocker):
+    """Test rate_limit() measures delays with the monotonic clock."""
+    mocker.patch("src.utils.browser_manager.time.monotonic", return_value=1234.5)
+    mocker.patch("src.utils.browser_manager.time.time", return_value=99999.0)
+    manager = BrowserManager(rate_limit_range=(0.0, 0.0))
+
+    manager.rate_limit()
+
+    assert manager._last_request_time == 1234.5
+
+
+def test_rate_limit_reserves_slot_after_pending_request():
+    """Test a caller arriving behind a reserved slot waits for the slot after it."""
+    clock = FakeClock(start=99.5)
+    manager = make_manager(clock, (1.0, 1.0))
+
+    # Another caller already holds the slot at t=100 (still in the future)
+    manager._last_request_time = 100.0
+    manager.rate_limit()
+
+    assert manager._last_request_time == 101.0
+    assert clock.waits == [1.5]
+    assert clock.now == 101.0
+
+
+def test_playwright_not_imported_until_browser_needed():
+    """Test importing the scraper modules does not import Playwright."""
+    import subprocess
+    import sys
+    from pathlib import Path
+
+    project_root = Path(__file__).parent.parent.parent
+    code = "import sys; import src.orchestrator; print('playwright' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=project_root, capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.strip() == "False"
+
+
+def test_rate_limit_uses_instance_rng():
+    """Test each manager draws delays from its own random.Random instance."""
+    import random
+
+    manager1 = BrowserManager(rate_limit_range=(0.0, 0.0))
+    manager2 = BrowserManager(rate_limit_range=(0.0, 0.0))
+
+    assert isinstance(manager1._rng, random.Random)
+    assert manager1._rng is not manager2._rng
+
+    with (
+        patch.object(manager1._rng, "uniform", return_value=0.0) as mock_uniform,
+        patch("random.uniform") as mock_global_uniform,
+    ):
+        manager1.rate_limit()
+
+    mock_uniform.assert_called_once_with(0.0, 0.0)
+    mock_global_uniform.assert_not_called()
+
+
+def test_get_browser_not_blocked_by_rate_limit_sleep(pw_mocks):
+    """Test get_browser() proceeds while another thread sleeps in rate_limit()."""
+    manager = BrowserManager(rate_limit_range=(5.0, 5.0))
+    manager.rate_limit()  # First request: no wait
+
+    sleeper = threading.Thread(target=manager.rate_limit)
+    sleeper.start()
+    time.sleep(0.05)
+
+    # Holding the rate limit condition would block this for ~5s
+    start_time = time.monotonic()
+    browser = manager.get_browser()
+    assert time.monotonic() - start_time < 1.0
+    assert browser is pw_mocks.browser
+
+    manager.close(interrupted=True)
+    sleeper.join(timeout=1.0)
+    assert not sleeper.is_alive()
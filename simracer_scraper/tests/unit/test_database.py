@@ -1,18 +1,17 @@
 """Tests for database module."""
 
 import sqlite3
-import time
 
 import pytest
 
+try:
+    from database import Database
+except ImportError:
+    from src.database import Database
+
 
 def test_database_initialization():
     """Test that Database can be initialized."""
-    try:
-        from database import Database
-    except ImportError:
-        from src.database import Database
-
     db = Database(":memory:")
     assert db.db_path == ":memory:"
     assert db.conn is None
@@ -20,27 +19,13 @@ def test_database_initialization():
 
 def test_database_connect():
     """Test database connection."""
-    try:
-        from database import Database
-    except ImportError:
-        from src.database import Database
-
-    db = Database(":memory:")
-    db.connect()
-
-    assert db.conn is not None
-    assert isinstance(db.conn, sqlite3.Connection)
-
-    db.close()
+    with Database(":memory:") as db:
+        assert db.conn is not None
+        assert isinstance(db.conn, sqlite3.Connection)
 
 
 def test_database_close():
     """Test database connection closing."""
-    try:
-        from database import Database
-    except ImportError:
-        from src.database import Database
-
     db = Database(":memory:")
     db.connect()
     db.close()
@@ -50,11 +35,6 @@ def test_database_close():
 
 def test_context_manager():
     """Test database as context manager."""
-    try:
-        from database import Database
-    except ImportError:
-        from src.database import Database
-
     with Database(":memory:") as db:
         assert db.conn is not None
 
@@ -62,17 +42,75 @@ def test_context_manager():
     assert db.conn is None
 
 
-def test_initialize_schema_creates_all_tables(test_db):
+def test_close_runs_pragma_optimize():
+    """Test that close() runs PRAGMA optimize once before closing."""
+    statements = []
+    with Database(":memory:") as db:
+        db.conn.set_trace_callback(statements.append)
+
+    assert statements.count("PRAGMA optimize") == 1
+
+
+def test_connect_uses_wal_journal(tmp_path):
+    """Test that file databases use WAL with synchronous=NORMAL."""
+    with Database(str(tmp_path / "test.db")) as db:
+        assert db.conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        # NORMAL == 1
+        assert db.conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+
+
+def test_transaction_commits_once(test_db):
+    """Test that upserts inside transaction() are committed together at the end."""
+    league = {"name": "League", "url": "http://test.com/league", "scraped_at": "2025-01-15"}
+
+    with test_db.transaction():
+        test_db.upsert_league(1558, league)
+        with test_db.transaction():
+            test_db.upsert_series(
+                3714, 1558, {"name": "S", "url": "http://test.com/s", "scraped_at": "2025-01-15"}
+            )
+        # Inner block joins the outer transaction - nothing committed yet
+        assert test_db.conn.in_transaction
+
+    assert not test_db.conn.in_transaction
+    assert test_db.get_series(3714) is not None
+
+
+def test_transaction_rolls_back_on_error(test_db):
+    """Test that an exception inside transaction() discards all its writes."""
+    league = {"name": "League", "url": "http://test.com/league", "scraped_at": "2025-01-15"}
+
+    with pytest.raises(ValueError):
+        with test_db.transaction():
+            test_db.upsert_league(1558, league)
+            raise ValueError("boom")
+
+    assert test_db.get_league(1558) is None
+
+    # Still usable afterwards
+    with test_db.transaction():
+        test_db.upsert_league(1558, league)
+    assert test_db.get_league(1558) is not None
+
+
+def test_transaction_without_connection():
+    """Test that transaction() raises RuntimeError when not connected."""
+    db = Database(":memory:")
+    with pytest.raises(RuntimeError, match="Database not connected"):
+        with db.transaction():
+            pass
+
+
+def test_initialize_schema_creates_all_tables(schema_template_db):
     """Test that all 9 tables are created."""
-    cursor = test_db.conn.cursor()
-    cursor.execute(
+    cursor = schema_template_db.conn.execute(
         """
         SELECT name FROM sqlite_master
         WHERE type='table' AND name NOT LIKE 'sqlite_%'
         ORDER BY name
     """
     )
-    tables = [row[0] for row in cursor.fetchall()]
+    tables = [row[0] for row in cursor]
 
     expected_tables = [
         "drivers",
@@ -89,258 +127,215 @@ def test_initialize_schema_creates_all_tables(test_db):
     assert tables == expected_tables, f"Expected {expected_tables}, got {tables}"
 
 
-def test_leagues_table_columns(test_db):
-    """Test that leagues table has all required columns."""
-    cursor = test_db.conn.cursor()
-    cursor.execute("PRAGMA table_info(leagues)")
-    columns = {row[1] for row in cursor.fetchall()}
-
-    required = {
-        "league_id",
-        "name",
-        "description",
-        "url",
-        "scraped_at",
-        "created_at",
-        "updated_at",
-    }
-
-    assert required.issubset(columns), f"Missing columns: {required - columns}"
-
-
-def test_teams_table_columns(test_db):
-    """Test that teams table has all required columns."""
-    cursor = test_db.conn.cursor()
-    cursor.execute("PRAGMA table_info(teams)")
-    columns = {row[1] for row in cursor.fetchall()}
-
-    required = {
-        "team_id",
-        "league_id",
-        "name",
-        "driver_count",
-        "url",
-        "scraped_at",
-        "created_at",
-        "updated_at",
-    }
-
-    assert required.issubset(columns), f"Missing columns: {required - columns}"
-
-
-def test_drivers_table_columns(test_db):
-    """Test that drivers table has all required columns."""
-    cursor = test_db.conn.cursor()
-    cursor.execute("PRAGMA table_info(drivers)")
-    columns = {row[1] for row in cursor.fetchall()}
-
-    required = {
-        "driver_id",
-        "league_id",
-        "team_id",
-        "name",
-        "first_name",
-        "last_name",
-        "car_numbers",
-        "primary_number",
-        "club",
-        "club_id",
-        "irating",
-        "safety_rating",
-        "license_class",
-        "url",
-        "scraped_at",
-        "created_at",
-        "updated_at",
-    }
-
-    assert required.issubset(columns), f"Missing columns: {required - columns}"
-
-
-def test_series_table_columns(test_db):
-    """Test that series table has all required columns."""
-    cursor = test_db.conn.cursor()
-    cursor.execute("PRAGMA table_info(series)")
-    columns = {row[1] for row in cursor.fetchall()}
-
-    required = {
-        "series_id",
-        "league_id",
-        "name",
-        "description",
-        "created_date",
-        "num_seasons",
-        "url",
-        "scraped_at",
-        "created_at",
-        "updated_at",
-    }
-
-    assert required.issubset(columns), f"Missing columns: {required - columns}"
-
-
-def test_seasons_table_columns(test_db):
-    """Test that seasons table has all required columns."""
-    cursor = test_db.conn.cursor()
-    cursor.execute("PRAGMA table_info(seasons)")
-    columns = {row[1] for row in cursor.fetchall()}
-
-    required = {
-        "season_id",
-        "series_id",
-        "name",
-        "description",
-        "url",
-        "scraped_at",
-        "created_at",
-        "updated_at",
-    }
-
-    assert required.issubset(columns), f"Missing columns: {required - columns}"
-
-
-def test_races_table_columns(test_db):
-    """Test that races table has all required columns."""
-    cursor = test_db.conn.cursor()
-    cursor.execute("PRAGMA table_info(races)")
-    columns = {row[1] for row in cursor.fetchall()}
-
-    required = {
-        "race_id",
-        "schedule_id",
-        "season_id",
-        "race_number",
-        "event_name",
-        "date",
-        "race_time",
-        "practice_time",
-        "track_id",
-        "track_config_id",
-        "track_name",
-        "track_type",
-        "track_length",
-        "track_config_iracing_id",
-        "planned_laps",
-        "points_race",
-        "off_week",
-        "night_race",
-        "playoff_race",
-        "race_duration_minutes",
-        "total_laps",
-        "leaders",
-        "lead_changes",
-        "cautions",
-        "caution_laps",
-        "num_drivers",
-        "weather_type",
-        "cloud_conditions",
-        "temperature_f",
-        "humidity_pct",
-        "fog_pct",
-        "weather_wind_speed",
-        "weather_wind_dir",
-        "weather_wind_unit",
-        "url",
-        "is_complete",
-        "scraped_at",
-        "created_at",
-        "updated_at",
+# Columns each table must have (extra columns are allowed)
+TABLE_COLUMNS = {
+    "leagues": frozenset(
+        {
+            "league_id",
+            "name",
+            "description",
+            "url",
+            "scraped_at",
+            "created_at",
+            "updated_at",
+        }
+    ),
+    "teams": frozenset(
+        {
+            "team_id",
+            "league_id",
+            "name",
+            "driver_count",
+            "url",
+            "scraped_at",
+            "created_at",
+            "updated_at",
+        }
+    ),
+    "drivers": frozenset(
+        {
+            "driver_id",
+            "league_id",
+            "team_id",
+            "name",
+            "first_name",
+            "last_name",
+            "car_numbers",
+            "primary_number",
+            "club",
+            "club_id",
+            "irating",
+            "safety_rating",
+            "license_class",
+            "url",
+            "scraped_at",
+            "created_at",
+            "updated_at",
+        }
+    ),
+    "series": frozenset(
+        {
+            "series_id",
+            "league_id",
+            "name",
+            "description",
+            "created_date",
+            "num_seasons",
+            "url",
+            "scraped_at",
+            "created_at",
+            "updated_at",
+        }
+    ),
+    "seasons": frozenset(
+        {
+            "season_id",
+            "series_id",
+            "name",
+            "description",
+            "url",
+            "scraped_at",
+            "created_at",
+            "updated_at",
+        }
+    ),
+    "races": frozenset(
+        {
+            "race_id",
+            "schedule_id",
+            "season_id",
+            "race_number",
+            "event_name",
+            "date",
+            "race_time",
+            "practice_time",
+            "track_id",
+            "track_config_id",
+            "track_name",
+            "track_type",
+            "track_length",
+            "track_config_iracing_id",
+            "planned_laps",
+            "points_race",
+            "off_week",
+            "night_race",
+            "playoff_race",
+            "race_duration_minutes",
+            "total_laps",
+            "leaders",
+            "lead_changes",
+            "cautions",
+            "caution_laps",
+            "num_drivers",
+            "weather_type",
+            "cloud_conditions",
+            "temperature_f",
+            "humidity_pct",
+            "fog_pct",
+            "weather_wind_speed",
+            "weather_wind_dir",
+            "weather_wind_unit",
+            "url",
+            "is_complete",
+            "scraped_at",
+            "created_at",
+            "updated_at",
+        }
+    ),
+    "race_results": frozenset(
+        {
+            "result_id",
+            "race_id",
+            "driver_id",
+            "team",
+            "finish_position",
+            "starting_position",
+            "car_number",
+            "qualifying_time",
+            "fastest_lap",
+            "fastest_lap_number",
+            "average_lap",
+            "interval",
+            "laps_completed",
+            "laps_led",
+            "incident_points",
+            "race_points",
+            "bonus_points",
+            "penalty_points",
+            "total_points",
+            "fast_laps",
+            "quality_passes",
+            "closing_passes",
+            "total_passes",
+            "average_running_position",
+            "irating",
+            "status",
+            "car_id",
+            "created_at",
+            "updated_at",
+        }
+    ),
+    "scrape_log": frozenset(
+        {
+            "log_id",
+            "entity_type",
+            "entity_id",
+            "entity_url",
+            "status",
+            "error_message",
+            "duration_ms",
+            "timestamp",
+        }
+    ),
+    "schema_alerts": frozenset(
+        {
+            "alert_id",
+            "entity_type",
+            "alert_type",
+            "details",
+            "url",
+            "resolved",
+            "timestamp",
+        }
+    ),
+}
+
+
+def _all_table_columns(conn: sqlite3.Connection) -> dict[str, set[str]]:
+    """Map every user table to its column names."""
+    tables = conn.execute(
+        "SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%'"
+    ).fetchall()
+    return {
+        table: {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+        for (table,) in tables
     }
 
-    assert required.issubset(columns), f"Missing columns: {required - columns}"
-
 
-def test_race_results_table_columns(test_db):
-    """Test that race_results table has all required columns."""
-    cursor = test_db.conn.cursor()
-    cursor.execute("PRAGMA table_info(race_results)")
-    columns = {row[1] for row in cursor.fetchall()}
-
-    required = {
-        "result_id",
-        "race_id",
-        "driver_id",
-        "team",
-        "finish_position",
-        "starting_position",
-        "car_number",
-        "qualifying_time",
-        "fastest_lap",
-        "fastest_lap_number",
-        "average_lap",
-        "interval",
-        "laps_completed",
-        "laps_led",
-        "incident_points",
-        "race_points",
-        "bonus_points",
-        "penalty_points",
-        "total_points",
-        "fast_laps",
-        "quality_passes",
-        "closing_passes",
-        "total_passes",
-        "average_running_position",
-        "irating",
-        "status",
-        "car_id",
-        "created_at",
-        "updated_at",
-    }
+@pytest.fixture(scope="module")
+def schema_columns(schema_template_db):
+    """Read the column names of every table once, from the schema template."""
+    return _all_table_columns(schema_template_db.conn)
 
-    assert required.issubset(columns), f"Missing columns: {required - columns}"
 
+@pytest.mark.parametrize("table,required", TABLE_COLUMNS.items(), ids=list(TABLE_COLUMNS))
+def test_table_columns(schema_columns, table, required):
+    """Test that each table has all required columns."""
+    columns = schema_columns.get(table, set())
 
-def test_scrape_log_table_columns(test_db):
-    """Test that scrape_log table has all required columns."""
-    cursor = test_db.conn.cursor()
-    cursor.execute("PRAGMA table_info(scrape_log)")
-    columns = {row[1] for row in cursor.fetchall()}
-
-    required = {
-        "log_id",
-        "entity_type",
-        "entity_id",
-        "entity_url",
-        "status",
-        "error_message",
-        "duration_ms",
-        "timestamp",
-    }
-
-    assert required.issubset(columns), f"Missing columns: {required - columns}"
+    assert required.issubset(columns), f"Missing columns in {table}: {required - columns}"
 
 
-def test_schema_alerts_table_columns(test_db):
-    """Test that schema_alerts table has all required columns."""
-    cursor = test_db.conn.cursor()
-    cursor.execute("PRAGMA table_info(schema_alerts)")
-    columns = {row[1] for row in cursor.fetchall()}
-
-    required = {
-        "alert_id",
-        "entity_type",
-        "alert_type",
-        "details",
-        "url",
-        "resolved",
-        "timestamp",
-    }
-
-    assert required.issubset(columns), f"Missing columns: {required - columns}"
-
-
-def test_indexes_exist(test_db):
+def test_indexes_exist(schema_template_db):
     """Test that all indexes are created."""
-    cursor = test_db.conn.cursor()
-    cursor.execute(
+    cursor = schema_template_db.conn.execute(
         """
         SELECT name FROM sqlite_master
         WHERE type='index' AND name NOT LIKE 'sqlite_%'
         ORDER BY name
     """
     )
-    indexes = [row[0] for row in cursor.fetchall()]
+    indexes = [row[0] for row in cursor]
 
     # Should have indexes for all major query patterns
     assert len(indexes) > 0, "No indexes created"
@@ -362,11 +357,9 @@ def test_indexes_exist(test_db):
 
 def test_foreign_keys_enforced(test_db):
     """Test that foreign key constraints are enforced."""
-    cursor = test_db.conn.cursor()
-
     # Try to insert a series with invalid league_id
     with pytest.raises(sqlite3.IntegrityError):
-        cursor.execute(
+        test_db.conn.execute(
             """
             INSERT INTO series (series_id, league_id, name, url, scraped_at)
             VALUES (1, 9999, 'Test', 'http://test.com', datetime('now'))
@@ -397,58 +390,55 @@ def test_unique_constraints_enforced(test_db):
         )
 
 
-def test_initialize_schema_without_connection_raises_error():
-    """Test that initializing schema without connection raises error."""
-    try:
-        from database import Database
-    except ImportError:
-        from src.database import Database
-
+VALID_PAYLOAD = {"name": "Test", "url": "http://test.com", "scraped_at": "2025-01-15"}
+
+
+@pytest.mark.parametrize(
+    "method,args",
+    [
+        ("initialize_schema", ()),
+        ("upsert_league", (1558, VALID_PAYLOAD)),
+        ("get_league", (1558,)),
+        ("get_league_by_url", ("http://test.com",)),
+        ("upsert_series", (3714, 1558, VALID_PAYLOAD)),
+        ("get_series", (3714,)),
+        ("get_series_by_league", (1558,)),
+        ("is_url_cached", ("http://test.com/league/1558", "league", 1)),
+        ("log_scrape", ("league", "http://test.com/league/1558", "success")),
+    ],
+)
+def test_method_without_connection(method, args):
+    """Test that database methods raise RuntimeError when not connected."""
     db = Database(":memory:")
     # Don't connect
 
     with pytest.raises(RuntimeError, match="Database not connected"):
-        db.initialize_schema()
+        getattr(db, method)(*args)
 
 
 def test_race_results_unique_constraint(test_db):
     """Test that race_results has unique constraint on race_id + driver_id."""
     cursor = test_db.conn.cursor()
 
-    # Insert test data
-    cursor.execute(
+    # Insert the parent rows in one script
+    test_db.conn.executescript(
         """
         INSERT INTO leagues (league_id, name, url, scraped_at)
-        VALUES (1, 'League', 'http://league.com', datetime('now'))
-    """
-    )
-    cursor.execute(
-        """
+        VALUES (1, 'League', 'http://league.com', datetime('now'));
         INSERT INTO drivers (driver_id, league_id, name, url, scraped_at)
-        VALUES (1, 1, 'Driver', 'http://driver.com', datetime('now'))
-    """
-    )
-    cursor.execute(
-        """
+        VALUES (1, 1, 'Driver', 'http://driver.com', datetime('now'));
         INSERT INTO series (series_id, league_id, name, url, scraped_at)
-        VALUES (1, 1, 'Series', 'http://series.com', datetime('now'))
-    """
-    )
-    cursor.execute(
-        """
+        VALUES (1, 1, 'Series', 'http://series.com', datetime('now'));
         INSERT INTO seasons (season_id, series_id, name, url, scraped_at)
-        VALUES (1, 1, 'Season', 'http://season.com', datetime('now'))
-    """
-    )
-    cursor.execute(
-        """
+        VALUES (1, 1, 'Season', 'http://season.com', datetime('now'));
         INSERT INTO races (schedule_id, season_id, race_number, url, scraped_at)
-        VALUES (1, 1, 1, 'http://race.com', datetime('now'))
+        VALUES (1, 1, 1, 'http://race.com', datetime('now'));
     """
     )
 
-    # Get the auto-generated race_id
-    race_id = cursor.lastrowid
+    # executescript() leaves lastrowid unset, so look up the generated race_id
+    cursor.execute("SELECT race_id FROM races WHERE schedule_id = 1")
+    race_id = cursor.fetchone()[0]
 
     # Insert first result
     cursor.execute(
@@ -537,9 +527,6 @@ def test_upsert_league_updates_existing(test_db):
     league1 = test_db.get_league(1558)
     updated_at_1 = league1["updated_at"]
 
-    # Wait to ensure timestamp difference
-    time.sleep(0.01)
-
     # Update with new data
     test_db.upsert_league(
         1558,
@@ -629,9 +616,6 @@ def test_league_timestamps_auto_update(test_db):
     created_at_1 = league1["created_at"]
     updated_at_1 = league1["updated_at"]
 
-    # Wait to ensure timestamp difference
-    time.sleep(0.01)
-
     # Update league
     test_db.upsert_league(
         1558,
@@ -651,63 +635,19 @@ def test_league_timestamps_auto_update(test_db):
     assert league2["updated_at"] >= updated_at_1
 
 
-def test_upsert_league_missing_required_fields(test_db):
-    """Test that upsert_league raises error for missing required fields."""
-    # Missing name
-    with pytest.raises(ValueError, match="name, url, and scraped_at are required"):
-        test_db.upsert_league(1558, {"url": "http://test.com", "scraped_at": "2025-01-15"})
+# Payloads missing one of the fields every upsert requires, keyed by the missing field
+MISSING_REQUIRED_FIELD = {
+    "name": {"url": "http://test.com", "scraped_at": "2025-01-15"},
+    "url": {"name": "Test", "scraped_at": "2025-01-15"},
+    "scraped_at": {"name": "Test", "url": "http://test.com"},
+}
 
-    # Missing url
-    with pytest.raises(ValueError, match="name, url, and scraped_at are required"):
-        test_db.upsert_league(1558, {"name": "Test", "scraped_at": "2025-01-15"})
 
-    # Missing scraped_at
+@pytest.mark.parametrize("missing", MISSING_REQUIRED_FIELD)
+def test_upsert_league_missing_required_fields(test_db, missing):
+    """Test that upsert_league raises error for missing required fields."""
     with pytest.raises(ValueError, match="name, url, and scraped_at are required"):
-        test_db.upsert_league(1558, {"name": "Test", "url": "http://test.com"})
-
-
-def test_upsert_league_without_connection():
-    """Test that upsert_league raises error when database not connected."""
-    try:
-        from database import Database
-    except ImportError:
-        from src.database import Database
-
-    db = Database(":memory:")
-    # Don't connect
-
-    with pytest.raises(RuntimeError, match="Database not connected"):
-        db.upsert_league(
-            1558, {"name": "Test", "url": "http://test.com", "scraped_at": "2025-01-15"}
-        )
-
-
-def test_get_league_without_connection():
-    """Test that get_league raises error when database not connected."""
-    try:
-        from database import Database
-    except ImportError:
-        from src.database import Database
-
-    db = Database(":memory:")
-    # Don't connect
-
-    with pytest.raises(RuntimeError, match="Database not connected"):
-        db.get_league(1558)
-
-
-def test_get_league_by_url_without_connection():
-    """Test that get_league_by_url raises error when database not connected."""
-    try:
-        from database import Database
-    except ImportError:
-        from src.database import Database
-
-    db = Database(":memory:")
-    # Don't connect
-
-    with pytest.raises(RuntimeError, match="Database not connected"):
-        db.get_league_by_url("http://test.com")
+        test_db.upsert_league(1558, MISSING_REQUIRED_FIELD[missing])
 
 
 # Task 2.3: Series CRUD Operations Tests
@@ -746,7 +686,6 @@ def test_upsert_series(test_db):
     assert series["num_seasons"] == 5
 
     # Update series
-    time.sleep(0.01)
     test_db.upsert_series(
         3714,
         1558,
@@ -804,33 +743,30 @@ def test_get_series_by_league(test_db):
     )
 
     # Insert multiple series
-    test_db.upsert_series(
-        3714,
-        1558,
-        {
-            "name": "Wednesday Night Series",
-            "url": "http://test.com/series/3714",
-            "scraped_at": "2025-01-15",
-        },
-    )
-    test_db.upsert_series(
-        3715,
-        1558,
-        {
-            "name": "Friday Night Series",
-            "url": "http://test.com/series/3715",
-            "scraped_at": "2025-01-15",
-        },
-    )
-    test_db.upsert_series(
-        3716,
+    written = test_db.upsert_series_bulk(
         1558,
-        {
-            "name": "Sunday Series",
-            "url": "http://test.com/series/3716",
-            "scraped_at": "2025-01-15",
-        },
+        [
+            {
+                "series_id": 3714,
+                "name": "Wednesday Night Series",
+                "url": "http://test.com/series/3714",
+                "scraped_at": "2025-01-15",
+            },
+            {
+                "series_id": 3715,
+                "name": "Friday Night Series",
+                "url": "http://test.com/series/3715",
+                "scraped_at": "2025-01-15",
+            },
+            {
+                "series_id": 3716,
+                "name": "Sunday Series",
+                "url": "http://test.com/series/3716",
+                "scraped_at": "2025-01-15",
+            },
+        ],
     )
+    assert written == 3
 
     # Get all series for league
     series_list = test_db.get_series_by_league(1558)
@@ -863,65 +799,28 @@ def test_series_requires_valid_league_id(test_db):
         )
 
 
-def test_upsert_series_missing_required_fields(test_db):
+@pytest.mark.parametrize("missing", MISSING_REQUIRED_FIELD)
+def test_upsert_series_missing_required_fields(test_db, missing):
     """Test that upsert_series validates required fields."""
-    # Setup league
+    # Validation runs before the insert, so no parent league is needed
+    with pytest.raises(ValueError, match="name, url, and scraped_at are required"):
+        test_db.upsert_series(3714, 1558, MISSING_REQUIRED_FIELD[missing])
+
+
+def test_upsert_series_bulk_validates_before_writing(test_db):
+    """Test that upsert_series_bulk writes nothing if any series is invalid."""
     test_db.upsert_league(
         1558, {"name": "The OBRL", "url": "http://test.com/league", "scraped_at": "2025-01-15"}
     )
+    series = [
+        {"series_id": 3714, "name": "Valid", "url": "http://test.com/s/1", "scraped_at": "2025"},
+        {"series_id": 3715, "url": "http://test.com/s/2", "scraped_at": "2025"},
+    ]
 
-    # Missing name
-    with pytest.raises(ValueError, match="name, url, and scraped_at are required"):
-        test_db.upsert_series(3714, 1558, {"url": "http://test.com", "scraped_at": "2025-01-15"})
-
-    # Missing url
-    with pytest.raises(ValueError, match="name, url, and scraped_at are required"):
-        test_db.upsert_series(3714, 1558, {"name": "Test", "scraped_at": "2025-01-15"})
-
-    # Missing scraped_at
     with pytest.raises(ValueError, match="name, url, and scraped_at are required"):
-        test_db.upsert_series(3714, 1558, {"name": "Test", "url": "http://test.com"})
-
-
-def test_upsert_series_without_connection():
-    """Test that upsert_series raises error when database not connected."""
-    try:
-        from database import Database
-    except ImportError:
-        from src.database import Database
-
-    db = Database(":memory:")
-
-    with pytest.raises(RuntimeError, match="Database not connected"):
-        db.upsert_series(
-            3714, 1558, {"name": "Test", "url": "http://test.com", "scraped_at": "2025-01-15"}
-        )
-
+        test_db.upsert_series_bulk(1558, series)
 
-def test_get_series_without_connection():
-    """Test that get_series raises error when database not connected."""
-    try:
-        from database import Database
-    except ImportError:
-        from src.database import Database
-
-    db = Database(":memory:")
-
-    with pytest.raises(RuntimeError, match="Database not connected"):
-        db.get_series(3714)
-
-
-def test_get_series_by_league_without_connection():
-    """Test that get_series_by_league raises error when database not connected."""
-    try:
-        from database import Database
-    except ImportError:
-        from src.database import Database
-
-    db = Database(":memory:")
-
-    with pytest.raises(RuntimeError, match="Database not connected"):
-        db.get_series_by_league(1558)
+    assert test_db.get_series_by_league(1558) == []
 
 
 # ============================================================================
@@ -975,79 +874,67 @@ def test_is_url_cached_missing_returns_false(test_db):
     assert result is False
 
 
-def test_is_url_cached_all_entity_types(test_db):
-    """Test that is_url_cached works for all entity types."""
+@pytest.fixture(scope="module")
+def fresh_entity_db(schema_template_db):
+    """Provide a read-only database holding one just-scraped row of every entity type."""
     from datetime import datetime
 
+    db = Database(":memory:")
+    db.connect()
+    schema_template_db.conn.backup(db.conn)
     now = datetime.now().isoformat()
 
-    # League
-    test_db.upsert_league(
+    db.upsert_league(
         1558, {"name": "Test League", "url": "http://test.com/league/1558", "scraped_at": now}
     )
-    assert test_db.is_url_cached("http://test.com/league/1558", "league", max_age_days=1)
-
-    # Series
-    test_db.upsert_series(
-        3714,
-        1558,
-        {
-            "name": "Test Series",
-            "url": "http://test.com/series/3714",
-            "scraped_at": now,
-        },
+    db.upsert_series(
+        3714, 1558, {"name": "Test Series", "url": "http://test.com/series/3714", "scraped_at": now}
     )
-    assert test_db.is_url_cached("http://test.com/series/3714", "series", max_age_days=1)
-
-    # Season
-    test_db.upsert_season(
+    db.upsert_season(
         12345,
         3714,
-        {
-            "name": "2025 Season",
-            "url": "http://test.com/season/12345",
-            "year": 2025,
-            "scraped_at": now,
-        },
+        {"name": "2025 Season", "url": "http://test.com/season/12345", "scraped_at": now},
     )
-    assert test_db.is_url_cached("http://test.com/season/12345", "season", max_age_days=1)
-
-    # Race
-    test_db.upsert_race(
+    db.upsert_race(
         67890,
         12345,
-        {
-            "name": "Race 1",
-            "url": "http://test.com/race/67890",
-            "race_number": 1,
-            "scraped_at": now,
-        },
+        {"url": "http://test.com/race/67890", "race_number": 1, "scraped_at": now},
     )
-    assert test_db.is_url_cached("http://test.com/race/67890", "race", max_age_days=1)
-
-    # Driver
-    test_db.upsert_driver(
-        111,
-        1558,
-        {
-            "name": "John Smith",
-            "url": "http://test.com/driver/111",
-            "scraped_at": now,
-        },
+    db.upsert_driver(
+        111, 1558, {"name": "John Smith", "url": "http://test.com/driver/111", "scraped_at": now}
     )
-    assert test_db.is_url_cached("http://test.com/driver/111", "driver", max_age_days=1)
-
-    # Team
-    test_db.upsert_team(
-        222,
-        1558,
-        {
-            "name": "Team Alpha",
-            "url": "http://test.com/team/222",
-            "scraped_at": now,
-        },
+    db.upsert_team(
+        222, 1558, {"name": "Team Alpha", "url": "http://test.com/team/222", "scraped_at": now}
     )
-    assert test_db.is_url_cached("http://test.com/team/222", "team", max_age_days=1)
+    yield db
+    db.close()
+
+
+@pytest.mark.parametrize(
+    "entity_type,url",
+    [
+        ("league", "http://test.com/league/1558"),
+        ("series", "http://test.com/series/3714"),
+        ("season", "http://test.com/season/12345"),
+        ("race", "http://test.com/race/67890"),
+        ("driver", "http://test.com/driver/111"),
+        ("team", "http://test.com/team/222"),
+    ],
+)
+def test_is_url_cached_all_entity_types(fresh_entity_db, entity_type, url):
+    """Test that is_url_cached works for all entity types."""
+    assert fresh_entity_db.is_url_cached(url, entity_type, max_age_days=1)
+
+
+@pytest.mark.parametrize("table", ["leagues", "series", "seasons", "races", "drivers", "teams"])
+def test_url_lookup_uses_index(schema_template_db, table):
+    """Test that is_url_cached's url lookup searches an index instead of scanning."""
+    plan = schema_template_db.conn.execute(
+        f"EXPLAIN QUERY PLAN SELECT scraped_at FROM {table} WHERE url = ?", ("x",)
+    ).fetchall()
+    detail = " ".join(row[3] for row in plan)
+
+    assert detail.startswith("SEARCH"), detail
 
 
 def test_is_url_cached_boundary_exactly_max_age(test_db):
@@ -1113,19 +1000,6 @@ def test_is_url_cached_invalid_timestamp_returns_false(test_db):
     assert result is False
 
 
-def test_is_url_cached_without_connection():
-    """Test that is_url_cached raises error when database not connected."""
-    try:
-        from database import Database
-    except ImportError:
-        from src.database import Database
-
-    db = Database(":memory:")
-
-    with pytest.raises(RuntimeError, match="Database not connected"):
-        db.is_url_cached("http://test.com/league/1558", "league", max_age_days=1)
-
-
 # ============================================================================
 # Scrape Logging Tests (Task 2.6)
 # ============================================================================
@@ -1242,7 +1116,7 @@ def test_log_scrape_without_entity_id(test_db):
 def test_log_scrape_invalid_status(test_db):
     """Test that log_scrape validates status field."""
     # Try to log with invalid status
-    with pytest.raises(ValueError, match="Invalid status"):
+    with pytest.raises(ValueError, match="Must be one of: success, failed, skipped"):
         test_db.log_scrape(
             entity_type="league",
             entity_url="http://test.com/league/1558",
@@ -1278,20 +1152,3 @@ def test_log_scrape_required_fields(test_db):
             entity_url="http://test.com/league/1558",
             status=None,
         )
-
-
-def test_log_scrape_without_connection():
-    """Test that log_scrape raises error when database not connected."""
-    try:
-        from database import Database
-    except ImportError:
-        from src.database import Database
-
-    db = Database(":memory:")
-
-    with pytest.raises(RuntimeError, match="Database not connected"):
-        db.log_scrape(
-            entity_type="league",
-            entity_url="http://test.com/league/1558",
-            status="success",
-        )
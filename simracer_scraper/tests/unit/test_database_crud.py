@@ -305,39 +305,21 @@ def test_find_driver_by_name(test_db):
     assert len(results) == 0
 
 
-def test_upsert_race_result(test_db):
+def test_upsert_race_result(race_db):
     """Test that upsert_race_result inserts and updates race results."""
-    # Setup full hierarchy
-    test_db.upsert_league(
-        1558, {"name": "The OBRL", "url": "http://test.com/league", "scraped_at": "2025-01-15"}
-    )
-    test_db.upsert_driver(
+    # League -> race hierarchy comes from the race_db template
+    race_db.upsert_driver(
         9001,
         1558,
         {"name": "Driver 1", "url": "http://test.com/driver/1", "scraped_at": "2025-01-15"},
     )
-    test_db.upsert_series(
-        3714,
-        1558,
-        {"name": "Series", "url": "http://test.com/series", "scraped_at": "2025-01-15"},
-    )
-    test_db.upsert_season(
-        12345,
-        3714,
-        {"name": "Season", "url": "http://test.com/season", "scraped_at": "2025-01-15"},
-    )
-    test_db.upsert_race(
-        67890,
-        12345,
-        {"race_number": 1, "url": "http://test.com/race", "scraped_at": "2025-01-15"},
-    )
 
     # Get the auto-generated race_id
-    race = test_db.get_race(67890)
+    race = race_db.get_race(67890)
     race_id = race["race_id"]
 
     # Insert race result
-    result_id = test_db.upsert_race_result(
+    result_id = race_db.upsert_race_result(
         race_id,
         9001,
         {
@@ -353,55 +335,81 @@ def test_upsert_race_result(test_db):
     assert result_id is not None
 
     # Get results
-    results = test_db.get_race_results(race_id)
+    results = race_db.get_race_results(race_id)
     assert len(results) == 1
     assert results[0]["finish_position"] == 1
     assert results[0]["driver_id"] == 9001
 
 
-def test_get_driver_results(test_db):
+def test_upsert_bulk_drivers_and_race_results(race_db):
+    """Test that the bulk upserts write every row and update on conflict."""
+    race_id = race_db.get_race(67890)["race_id"]
+    drivers = [
+        {
+            "driver_id": 9000 + i,
+            "name": f"Driver {i}",
+            "url": f"http://test.com/driver/{i}",
+            "scraped_at": "2025-01-15",
+        }
+        for i in range(1, 4)
+    ]
+
+    assert race_db.upsert_drivers_bulk(1558, drivers) == 3
+    assert len(race_db.get_drivers_by_league(1558)) == 3
+
+    results = [
+        {"driver_id": 9000 + i, "finish_position": i, "car_number": str(i)} for i in range(1, 4)
+    ]
+    assert race_db.upsert_race_results_bulk(race_id, results) == 3
+
+    # Re-running updates existing rows instead of duplicating them
+    results[0]["finish_position"] = 3
+    results[2]["finish_position"] = 1
+    race_db.upsert_race_results_bulk(race_id, results)
+
+    stored = {row["driver_id"]: row for row in race_db.get_race_results(race_id)}
+    assert len(stored) == 3
+    assert stored[9001]["finish_position"] == 3
+    assert stored[9003]["finish_position"] == 1
+    assert stored[9002]["car_number"] == "2"
+
+
+def test_upsert_drivers_bulk_validates_before_writing(race_db):
+    """Test that a driver missing required fields fails the whole batch."""
+    drivers = [
+        {"driver_id": 9001, "name": "Driver 1", "url": "http://x", "scraped_at": "2025-01-15"},
+        {"driver_id": 9002, "name": "Driver 2"},
+    ]
+
+    with pytest.raises(ValueError):
+        race_db.upsert_drivers_bulk(1558, drivers)
+
+    assert race_db.get_drivers_by_league(1558) == []
+
+
+def test_get_driver_results(race_db):
     """Test getting all race results for a driver."""
-    # Setup
-    test_db.upsert_league(
-        1558, {"name": "The OBRL", "url": "http://test.com/league", "scraped_at": "2025-01-15"}
-    )
-    test_db.upsert_driver(
+    # Setup: race 67890 comes from the race_db template, add a driver and a second race
+    race_db.upsert_driver(
         9001,
         1558,
         {"name": "Driver 1", "url": "http://test.com/driver/1", "scraped_at": "2025-01-15"},
     )
-    test_db.upsert_series(
-        3714,
-        1558,
-        {"name": "Series", "url": "http://test.com/series", "scraped_at": "2025-01-15"},
-    )
-    test_db.upsert_season(
-        12345,
-        3714,
-        {"name": "Season", "url": "http://test.com/season", "scraped_at": "2025-01-15"},
-    )
-
-    # Insert two races
-    test_db.upsert_race(
-        67890,
-        12345,
-        {"race_number": 1, "url": "http://test.com/race/1", "scraped_at": "2025-01-15"},
-    )
-    test_db.upsert_race(
+    race_db.upsert_race(
         67891,
         12345,
         {"race_number": 2, "url": "http://test.com/race/2", "scraped_at": "2025-01-15"},
     )
 
-    race1 = test_db.get_race(67890)
-    race2 = test_db.get_race(67891)
+    race1 = race_db.get_race(67890)
+    race2 = race_db.get_race(67891)
 
     # Insert results for same driver in different races
-    test_db.upsert_race_result(race1["race_id"], 9001, {"finish_position": 1})
-    test_db.upsert_race_result(race2["race_id"], 9001, {"finish_position": 2})
+    race_db.upsert_race_result(race1["race_id"], 9001, {"finish_position": 1})
+    race_db.upsert_race_result(race2["race_id"], 9001, {"finish_position": 2})
 
     # Get all results for driver
-    results = test_db.get_driver_results(9001)
+    results = race_db.get_driver_results(9001)
     assert len(results) == 2
 
 
@@ -438,16 +446,7 @@ def test_foreign_key_constraints(test_db):
 
 def test_required_fields_validation(test_db):
     """Test that required fields are validated."""
-    # Setup
-    test_db.upsert_league(
-        1558, {"name": "The OBRL", "url": "http://test.com/league", "scraped_at": "2025-01-15"}
-    )
-    test_db.upsert_series(
-        3714,
-        1558,
-        {"name": "Series", "url": "http://test.com/series", "scraped_at": "2025-01-15"},
-    )
-
+    # Validation runs before any SQL, so no parent rows are needed
     # Season missing required fields
     with pytest.raises(ValueError):
         test_db.upsert_season(12345, 3714, {"name": "Season"})
@@ -465,8 +464,50 @@ def test_required_fields_validation(test_db):
         test_db.upsert_driver(9001, 1558, {"name": "Driver"})
 
 
-def test_methods_without_connection():
-    """Test that all methods raise RuntimeError when database not connected."""
+SEASON_PAYLOAD = {"name": "Season", "url": "http://test.com", "scraped_at": "2025-01-15"}
+
+
+@pytest.mark.parametrize(
+    "method,args",
+    [
+        # Season methods
+        ("upsert_season", (12345, 3714, SEASON_PAYLOAD)),
+        ("get_season", (12345,)),
+        ("get_seasons_by_series", (3714,)),
+        # Race methods
+        (
+            "upsert_race",
+            (
+                67890,
+                12345,
+                {"race_number": 1, "url": "http://test.com", "scraped_at": "2025-01-15"},
+            ),
+        ),
+        ("get_race", (67890,)),
+        ("get_races_by_season", (12345,)),
+        # Team methods
+        ("upsert_team", (5001, 1558, {"name": "Team", "scraped_at": "2025-01-15"})),
+        ("get_team", (5001,)),
+        ("get_teams_by_league", (1558,)),
+        # Driver methods
+        (
+            "upsert_driver",
+            (9001, 1558, {"name": "Driver", "url": "http://test.com", "scraped_at": "2025-01-15"}),
+        ),
+        ("get_driver", (9001,)),
+        ("get_drivers_by_league", (1558,)),
+        ("find_driver_by_name", ("John",)),
+        # Race result methods
+        ("upsert_race_result", (1, 9001, {})),
+        ("upsert_race_results_bulk", (1, [{"driver_id": 9001}])),
+        ("upsert_drivers_bulk", (1558, [])),
+        ("upsert_series_bulk", (1558, [])),
+        ("get_race_results", (1,)),
+        ("get_driver_results", (9001,)),
+    ],
+)
+def test_methods_without_connection(method, args):
+    """Test that CRUD methods raise RuntimeError when database not connected."""
     try:
         from database import Database
     except ImportError:
@@ -475,52 +516,5 @@ def test_methods_without_connection():
     db = Database(":memory:")
     # Don't connect
 
-    # Season methods
-    with pytest.raises(RuntimeError, match="Database not connected"):
-        db.upsert_season(
-            12345, 3714, {"name": "Season", "url": "http://test.com", "scraped_at": "2025-01-15"}
-        )
-    with pytest.raises(RuntimeError, match="Database not connected"):
-        db.get_season(12345)
-    with pytest.raises(RuntimeError, match="Database not connected"):
-        db.get_seasons_by_series(3714)
-
-    # Race methods
-    with pytest.raises(RuntimeError, match="Database not connected"):
-        db.upsert_race(
-            67890,
-            12345,
-            {"race_number": 1, "url": "http://test.com", "scraped_at": "2025-01-15"},
-        )
-    with pytest.raises(RuntimeError, match="Database not connected"):
-        db.get_race(67890)
-    with pytest.raises(RuntimeError, match="Database not connected"):
-        db.get_races_by_season(12345)
-
-    # Team methods
-    with pytest.raises(RuntimeError, match="Database not connected"):
-        db.upsert_team(5001, 1558, {"name": "Team", "scraped_at": "2025-01-15"})
-    with pytest.raises(RuntimeError, match="Database not connected"):
-        db.get_team(5001)
-    with pytest.raises(RuntimeError, match="Database not connected"):
-        db.get_teams_by_league(1558)
-
-    # Driver methods
-    with pytest.raises(RuntimeError, match="Database not connected"):
-        db.upsert_driver(
-            9001, 1558, {"name": "Driver", "url": "http://test.com", "scraped_at": "2025-01-15"}
-        )
-    with pytest.raises(RuntimeError, match="Database not connected"):
-        db.get_driver(9001)
-    with pytest.raises(RuntimeError, match="Database not connected"):
-        db.get_drivers_by_league(1558)
-    with pytest.raises(RuntimeError, match="Database not connected"):
-        db.find_driver_by_name("John")
-
-    # Race result methods
-    with pytest.raises(RuntimeError, match="Database not connected"):
-        db.upsert_race_result(1, 9001, {})
-    with pytest.raises(RuntimeError, match="Database not connected"):
-        db.get_race_results(1)
     with pytest.raises(RuntimeError, match="Database not connected"):
-        db.get_driver_results(9001)
+        getattr(db, method)(*args)
@@ -1,7 +1,6 @@
 """Tests for DriverExtractor."""
 
 from pathlib import Path
-from unittest.mock import patch
 
 import pytest
 from bs4 import BeautifulSoup
@@ -16,13 +15,23 @@ def driver_extractor():
 
 
 @pytest.fixture
+def stub_fetch(driver_extractor, monkeypatch):
+    """Make driver_extractor.fetch_page return the given soup for any URL."""
+
+    def stub(soup):
+        monkeypatch.setattr(driver_extractor, "fetch_page", lambda url, parse_only=None: soup)
+
+    return stub
+
+
+@pytest.fixture(scope="module")
 def driver_html_with_stats():
     """Sample HTML with driver stats embedded in JavaScript."""
     # Note: Actual format has the stats in a specific order: irating, sr, license
     return """<!DOCTYPE html><html><head><title>Driver Stats</title></head><body><div id="driver_stats"></div><script>ReactDOM.createRoot(document.getElementById('driver_stats')).render(React.createElement(DriverStats,{user: {"driver_id":0,"site_admin":null},league_id: 0,series_id: 0,season_id: 0,rps: {"6376792":{"race_participant_id":"6376792","driver_id":"1071","irating":"3126","sr":"4.79","license":"Class A","race_date":"2025-11-06"}}}));</script></body></html>"""
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def driver_html_no_races():
     """Sample HTML for a driver with no race history."""
     return """
@@ -47,6 +56,18 @@ def driver_html_no_races():
     """
 
 
+@pytest.fixture(scope="module")
+def driver_soup_with_stats(driver_html_with_stats):
+    """Parsed driver page with stats (shared, read-only)."""
+    return BeautifulSoup(driver_html_with_stats, "lxml")
+
+
+@pytest.fixture(scope="module")
+def driver_soup_no_races(driver_html_no_races):
+    """Parsed driver page with no race history (shared, read-only)."""
+    return BeautifulSoup(driver_html_no_races, "lxml")
+
+
 class TestDriverExtractorBasic:
     """Test basic DriverExtractor functionality."""
 
@@ -91,77 +112,75 @@ class TestDriverExtractorURLValidation:
 class TestDriverExtractorExtraction:
     """Test data extraction from driver profile pages."""
 
-    def test_extract_from_html_with_stats(self, driver_extractor, driver_html_with_stats):
+    def test_extract_from_html_with_stats(
+        self, driver_extractor, stub_fetch, driver_soup_with_stats
+    ):
         """Test extracting driver stats from HTML."""
-        with patch.object(driver_extractor, "fetch_page") as mock_fetch:
-            mock_fetch.return_value = BeautifulSoup(driver_html_with_stats, "html.parser")
+        stub_fetch(driver_soup_with_stats)
 
-            result = driver_extractor.extract(
-                "https://www.simracerhub.com/driver_stats.php?driver_id=1071"
-            )
+        result = driver_extractor.extract(
+            "https://www.simracerhub.com/driver_stats.php?driver_id=1071"
+        )
 
-            assert isinstance(result, dict)
-            assert "metadata" in result
+        assert isinstance(result, dict)
+        assert "metadata" in result
 
-    def test_extract_metadata_structure(self, driver_extractor, driver_html_with_stats):
+    def test_extract_metadata_structure(self, driver_extractor, stub_fetch, driver_soup_with_stats):
         """Test extracted metadata has correct structure."""
-        with patch.object(driver_extractor, "fetch_page") as mock_fetch:
-            mock_fetch.return_value = BeautifulSoup(driver_html_with_stats, "html.parser")
-
-            result = driver_extractor.extract(
-                "https://www.simracerhub.com/driver_stats.php?driver_id=1071"
-            )
-
-            metadata = result["metadata"]
-            assert "driver_id" in metadata
-            assert "url" in metadata
-            assert "irating" in metadata
-            assert "safety_rating" in metadata
-            assert "license_class" in metadata
-
-    def test_extract_driver_stats_values(self, driver_extractor, driver_html_with_stats):
+        stub_fetch(driver_soup_with_stats)
+
+        result = driver_extractor.extract(
+            "https://www.simracerhub.com/driver_stats.php?driver_id=1071"
+        )
+
+        metadata = result["metadata"]
+        assert "driver_id" in metadata
+        assert "url" in metadata
+        assert "irating" in metadata
+        assert "safety_rating" in metadata
+        assert "license_class" in metadata
+
+    def test_extract_driver_stats_values(
+        self, driver_extractor, stub_fetch, driver_soup_with_stats
+    ):
         """Test extracted driver stats have correct values."""
-        with patch.object(driver_extractor, "fetch_page") as mock_fetch:
-            mock_fetch.return_value = BeautifulSoup(driver_html_with_stats, "html.parser")
+        stub_fetch(driver_soup_with_stats)
 
-            result = driver_extractor.extract(
-                "https://www.simracerhub.com/driver_stats.php?driver_id=1071"
-            )
+        result = driver_extractor.extract(
+            "https://www.simracerhub.com/driver_stats.php?driver_id=1071"
+        )
 
-            metadata = result["metadata"]
-            assert metadata["driver_id"] == 1071
-            assert metadata["irating"] == 3126
-            assert metadata["safety_rating"] == 4.79
-            assert metadata["license_class"] == "Class A"
+        metadata = result["metadata"]
+        assert metadata["driver_id"] == 1071
+        assert metadata["irating"] == 3126
+        assert metadata["safety_rating"] == 4.79
+        assert metadata["license_class"] == "Class A"
 
-    def test_extract_driver_no_races(self, driver_extractor, driver_html_no_races):
+    def test_extract_driver_no_races(self, driver_extractor, stub_fetch, driver_soup_no_races):
         """Test extraction when driver has no race history."""
-        with patch.object(driver_extractor, "fetch_page") as mock_fetch:
-            mock_fetch.return_value = BeautifulSoup(driver_html_no_races, "html.parser")
+        stub_fetch(driver_soup_no_races)
 
-            result = driver_extractor.extract(
-                "https://www.simracerhub.com/driver_stats.php?driver_id=9999"
-            )
+        result = driver_extractor.extract(
+            "https://www.simracerhub.com/driver_stats.php?driver_id=9999"
+        )
 
-            metadata = result["metadata"]
-            assert metadata["driver_id"] == 9999
-            assert metadata["irating"] is None
-            assert metadata["safety_rating"] is None
-            assert metadata["license_class"] is None
+        metadata = result["metadata"]
+        assert metadata["driver_id"] == 9999
+        assert metadata["irating"] is None
+        assert metadata["safety_rating"] is None
+        assert metadata["license_class"] is None
 
-    def test_extract_stats_method(self, driver_extractor, driver_html_with_stats):
+    def test_extract_stats_method(self, driver_extractor, driver_soup_with_stats):
         """Test _extract_stats method directly."""
-        soup = BeautifulSoup(driver_html_with_stats, "html.parser")
-        stats = driver_extractor._extract_stats(soup)
+        stats = driver_extractor._extract_stats(driver_soup_with_stats)
 
         assert stats["irating"] == 3126
         assert stats["safety_rating"] == 4.79
         assert stats["license_class"] == "Class A"
 
-    def test_extract_stats_no_data(self, driver_extractor, driver_html_no_races):
+    def test_extract_stats_no_data(self, driver_extractor, driver_soup_no_races):
         """Test _extract_stats returns None values when no data."""
-        soup = BeautifulSoup(driver_html_no_races, "html.parser")
-        stats = driver_extractor._extract_stats(soup)
+        stats = driver_extractor._extract_stats(driver_soup_no_races)
 
         assert stats["irating"] is None
         assert stats["safety_rating"] is None
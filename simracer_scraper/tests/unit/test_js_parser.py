@@ -1,13 +1,37 @@
 """Tests for JavaScript parser utilities."""
 
+try:
+    from utils import js_parser
+    from utils.js_parser import (
+        _extract_results_table_props,
+        _find_results_table_props,
+        _iter_script_bodies,
+        _iter_top_level_objects,
+        _parse_js_object,
+        extract_js_array,
+        extract_race_results_json,
+        extract_react_props,
+        extract_season_data,
+        extract_series_data,
+    )
+except ImportError:
+    from src.utils import js_parser
+    from src.utils.js_parser import (
+        _extract_results_table_props,
+        _find_results_table_props,
+        _iter_script_bodies,
+        _iter_top_level_objects,
+        _parse_js_object,
+        extract_js_array,
+        extract_race_results_json,
+        extract_react_props,
+        extract_season_data,
+        extract_series_data,
+    )
+
 
 def test_extract_series_data_valid():
     """Test extracting series data from valid JavaScript."""
-    try:
-        from utils.js_parser import extract_series_data
-    except ImportError:
-        from src.utils.js_parser import extract_series_data
-
     # Valid HTML with series.push() calls
     html = """
     <script>
@@ -31,11 +55,6 @@ def test_extract_series_data_valid():
 
 def test_extract_series_data_empty():
     """Test that empty/missing JavaScript returns empty list."""
-    try:
-        from utils.js_parser import extract_series_data
-    except ImportError:
-        from src.utils.js_parser import extract_series_data
-
     # No JavaScript
     html = "<html><body>No JavaScript here</body></html>"
 
@@ -46,11 +65,6 @@ def test_extract_series_data_empty():
 
 def test_extract_series_data_partial_fields():
     """Test extracting series with only required fields."""
-    try:
-        from utils.js_parser import extract_series_data
-    except ImportError:
-        from src.utils.js_parser import extract_series_data
-
     # Minimal series data (only id and name)
     html = """
     <script>
@@ -68,11 +82,6 @@ def test_extract_series_data_partial_fields():
 
 def test_extract_season_data_valid():
     """Test extracting season data from valid JavaScript."""
-    try:
-        from utils.js_parser import extract_season_data
-    except ImportError:
-        from src.utils.js_parser import extract_season_data
-
     # Valid HTML with seasons array
     html = """
     <script>
@@ -97,11 +106,6 @@ def test_extract_season_data_valid():
 
 def test_extract_season_data_empty():
     """Test that empty/missing JavaScript returns empty list."""
-    try:
-        from utils.js_parser import extract_season_data
-    except ImportError:
-        from src.utils.js_parser import extract_season_data
-
     # No JavaScript
     html = "<html><body>No seasons here</body></html>"
 
@@ -112,11 +116,6 @@ def test_extract_season_data_empty():
 
 def test_extract_season_data_empty_array():
     """Test extracting from empty seasons array."""
-    try:
-        from utils.js_parser import extract_season_data
-    except ImportError:
-        from src.utils.js_parser import extract_season_data
-
     # Empty seasons array
     html = """
     <script>
@@ -131,11 +130,6 @@ def test_extract_season_data_empty_array():
 
 def test_extract_js_array_custom_pattern():
     """Test extracting JavaScript array with custom pattern."""
-    try:
-        from utils.js_parser import extract_js_array
-    except ImportError:
-        from src.utils.js_parser import extract_js_array
-
     # Custom JavaScript array
     html = """
     <script>
@@ -155,11 +149,6 @@ def test_extract_js_array_custom_pattern():
 
 def test_extract_js_array_malformed_json():
     """Test that malformed JSON raises helpful error."""
-    try:
-        from utils.js_parser import extract_js_array
-    except ImportError:
-        from src.utils.js_parser import extract_js_array
-
     # Malformed JSON (missing quotes, trailing commas, etc.)
     html = """
     <script>
@@ -177,11 +166,6 @@ def test_extract_js_array_malformed_json():
 
 def test_extract_series_data_special_characters():
     """Test extracting series with special characters in names."""
-    try:
-        from utils.js_parser import extract_series_data
-    except ImportError:
-        from src.utils.js_parser import extract_series_data
-
     # Series name with apostrophes, quotes, etc.
     html = """
     <script>
@@ -198,11 +182,6 @@ def test_extract_series_data_special_characters():
 
 def test_extract_series_data_no_id():
     """Test that series without id are skipped."""
-    try:
-        from utils.js_parser import extract_series_data
-    except ImportError:
-        from src.utils.js_parser import extract_series_data
-
     # Series missing required 'id' field
     html = """
     <script>
@@ -220,11 +199,6 @@ def test_extract_series_data_no_id():
 
 def test_extract_season_data_multiline():
     """Test extracting seasons from multiline JavaScript."""
-    try:
-        from utils.js_parser import extract_season_data
-    except ImportError:
-        from src.utils.js_parser import extract_season_data
-
     # Multiline formatting
     html = """
     <script>
@@ -256,11 +230,6 @@ def test_extract_season_data_multiline():
 
 def test_extract_js_array_not_found():
     """Test that missing array variable returns empty list."""
-    try:
-        from utils.js_parser import extract_js_array
-    except ImportError:
-        from src.utils.js_parser import extract_js_array
-
     html = "<script>var other = [];</script>"
 
     result = extract_js_array(html, "notFound")
@@ -268,13 +237,30 @@ def test_extract_js_array_not_found():
     assert result == []
 
 
+def test_extract_js_array_deeply_nested_objects():
+    """Test top-level objects are split correctly at any nesting depth."""
+    html = """
+    <script>
+    data = [{"id": 1, "meta": {"a": {"b": {"c": 1}}}}, {"id": 2, "note": "} not a brace {"}];
+    </script>
+    """
+
+    result = extract_js_array(html, "data")
+
+    assert result == [
+        {"id": 1, "meta": {"a": {"b": {"c": 1}}}},
+        {"id": 2, "note": "} not a brace {"},
+    ]
+
+
+def test_iter_top_level_objects_linear_on_unbalanced_input():
+    """Test the splitter handles stray and unbalanced braces without backtracking."""
+    assert list(_iter_top_level_objects("}{id: 1}")) == ["id: 1"]
+    assert list(_iter_top_level_objects("{" * 50000)) == []
+
+
 def test_extract_series_data_numeric_fields():
     """Test that numeric fields are parsed as integers."""
-    try:
-        from utils.js_parser import extract_series_data
-    except ImportError:
-        from src.utils.js_parser import extract_series_data
-
     html = """
     <script>
     series.push({id: 999, name: "Test", season_count: 42});
@@ -290,11 +276,6 @@ def test_extract_series_data_numeric_fields():
 
 def test_parse_js_object_with_single_quotes():
     """Test parsing JavaScript object with single-quoted strings (regex fallback)."""
-    try:
-        from utils.js_parser import _parse_js_object
-    except ImportError:
-        from src.utils.js_parser import _parse_js_object
-
     # Malformed JavaScript that forces regex fallback
     # Trailing comma makes JSON parsing fail
     js = "id: 100, name: 'Single Quote', active: true, data: null,"
@@ -309,11 +290,6 @@ def test_parse_js_object_with_single_quotes():
 
 def test_parse_js_object_with_booleans():
     """Test parsing JavaScript object with boolean values (regex fallback)."""
-    try:
-        from utils.js_parser import _parse_js_object
-    except ImportError:
-        from src.utils.js_parser import _parse_js_object
-
     # JavaScript with boolean values and trailing comma (forces regex fallback)
     js = "active: true, archived: false,"
 
@@ -325,11 +301,6 @@ def test_parse_js_object_with_booleans():
 
 def test_parse_js_object_with_null():
     """Test parsing JavaScript object with null value (regex fallback)."""
-    try:
-        from utils.js_parser import _parse_js_object
-    except ImportError:
-        from src.utils.js_parser import _parse_js_object
-
     # JavaScript with null value and trailing comma (forces regex fallback)
     js = "id: 100, description: null,"
 
@@ -339,13 +310,25 @@ def test_parse_js_object_with_null():
     assert result["description"] is None
 
 
+def test_parse_js_object_quoted_keys_skip_conversion(mocker):
+    """Test content with quoted keys is parsed as JSON without conversion."""
+    spy = mocker.spy(js_parser, "_js_to_json")
+
+    # "1:23" would be mangled by the key-quoting regex
+    assert js_parser._parse_js_object(' "id": 7, "best": "1:23.456"') == {
+        "id": 7,
+        "best": "1:23.456",
+    }
+    assert js_parser._parse_js_object('{"id": 8}') == {"id": 8}
+    spy.assert_not_called()
+
+    # Mixed quoting is not JSON and still goes through the conversion
+    assert js_parser._parse_js_object('"id": 9, name: "x"') == {"id": 9, "name": "x"}
+    spy.assert_called_once()
+
+
 def test_extract_react_props_array():
     """Test extracting array prop from ReactDOM."""
-    try:
-        from utils.js_parser import extract_react_props
-    except ImportError:
-        from src.utils.js_parser import extract_react_props
-
     html = """
     <script>
     ReactDOM.createRoot(document.getElementById('root')).render(
@@ -369,11 +352,6 @@ def test_extract_react_props_array():
 
 def test_extract_react_props_object():
     """Test extracting object prop from ReactDOM."""
-    try:
-        from utils.js_parser import extract_react_props
-    except ImportError:
-        from src.utils.js_parser import extract_react_props
-
     html = """
     <script>
     ReactDOM.render(
@@ -397,11 +375,6 @@ def test_extract_react_props_object():
 
 def test_extract_react_props_not_found():
     """Test handling of missing prop."""
-    try:
-        from utils.js_parser import extract_react_props
-    except ImportError:
-        from src.utils.js_parser import extract_react_props
-
     html = """
     <script>
     ReactDOM.render(React.createElement(Table, {other: []}));
@@ -415,11 +388,6 @@ def test_extract_react_props_not_found():
 
 def test_extract_react_props_nested_objects():
     """Test extracting nested object structures."""
-    try:
-        from utils.js_parser import extract_react_props
-    except ImportError:
-        from src.utils.js_parser import extract_react_props
-
     html = """
     <script>
     ReactDOM.createRoot(...).render(
@@ -442,13 +410,29 @@ def test_extract_react_props_nested_objects():
     assert isinstance(result["100"]["members"], list)
 
 
+def test_extract_react_props_brackets_in_strings():
+    """Test brackets inside quoted strings do not end the prop early."""
+    html = """
+    <script>
+    React.createElement(ResultsTable, {
+        rps: [{"name": "Driver ] One", "team": "{Alpha}"}, {"name": "Say \\"[hi]\\""}],
+        teams: {}
+    });
+    </script>
+    """
+
+    result = extract_react_props(html, "rps")
+
+    assert result == [{"name": "Driver ] One", "team": "{Alpha}"}, {"name": 'Say "[hi]"'}]
+
+
+def test_extract_react_props_unmatched_brackets():
+    """Test an unterminated prop value returns None."""
+    assert extract_react_props('{rps: [{"id": 1}, {"id": 2}', "rps") is None
+
+
 def test_extract_race_results_json():
     """Test extraction of all race result props."""
-    try:
-        from utils.js_parser import extract_race_results_json
-    except ImportError:
-        from src.utils.js_parser import extract_race_results_json
-
     html = """
     <script>
     ReactDOM.createRoot(document.getElementById('driver_table_12345')).render(
@@ -475,11 +459,6 @@ def test_extract_race_results_json():
 
 def test_extract_race_results_json_missing_props():
     """Test handling when some props are missing."""
-    try:
-        from utils.js_parser import extract_race_results_json
-    except ImportError:
-        from src.utils.js_parser import extract_race_results_json
-
     html = """
     <script>
     ReactDOM.render(
@@ -496,3 +475,219 @@ def test_extract_race_results_json_missing_props():
     assert result["drivers"] is None
     assert result["teams"] is None
     assert result["schedule"] is None
+
+
+def test_extract_race_results_json_team_drivers():
+    """Test team_drivers is extracted alongside the other props."""
+    html = """
+    <script>
+    ReactDOM.render(
+        React.createElement(ResultsTable, {
+            teams: {"100": {"name": "Team Alpha"}},
+            team_drivers: {"1": "100"}
+        })
+    );
+    </script>
+    """
+
+    result = extract_race_results_json(html)
+
+    assert result["teams"] == {"100": {"name": "Team Alpha"}}
+    assert result["team_drivers"] == {"1": "100"}
+    assert result["rps"] is None
+
+
+def test_extract_race_results_json_without_create_element():
+    """Test fallback to a page-wide prop scan when no createElement props object exists."""
+    html = '<script>ReactDOM.render(Table, {rps: [{"driver_id": "1"}]})</script>'
+
+    result = extract_race_results_json(html)
+
+    assert result["rps"] == [{"driver_id": "1"}]
+    assert result["drivers"] is None
+
+
+def test_extract_results_table_props_json_object():
+    """Test props that are already valid JSON decode in one call."""
+    html = 'React.createElement(ResultsTable, {"rps": [{"id": 1}], "teams": {}})'
+
+    result = _extract_results_table_props(html)
+
+    assert result == {"rps": [{"id": 1}], "teams": {}}
+
+
+def test_extract_results_table_props_skips_empty_elements():
+    """Test other components and ResultsTable calls without a props object are skipped."""
+    html = """
+    React.createElement(Spinner, {rps: [{"id": 0}]});
+    React.createElement(ResultsTable, null);
+    React.createElement(ResultsTable, {});
+    React.createElement(ResultsTable, {rps: [{"id": 1}]});
+    """
+
+    result = _extract_results_table_props(html)
+
+    assert result == {"rps": [{"id": 1}]}
+
+
+def test_extract_results_table_props_stops_at_non_json_value():
+    """Test decoding stops at the first prop value that is not JSON."""
+    html = 'React.createElement(ResultsTable, {rps: [{"id": 1}], onClick: handler, teams: {}})'
+
+    result = _extract_results_table_props(html)
+
+    assert result == {"rps": [{"id": 1}]}
+
+
+def test_extract_race_results_json_identifier_prop_before_rps():
+    """Test props after an identifier-valued prop are still extracted."""
+    html = """
+    <script>
+    React.createElement(ResultsTable, {
+        league_id: 1558,
+        is_admin: isAdmin,
+        rps: [{"driver_id": "1"}],
+        drivers: {"1": {"name": "Driver One"}},
+        schedule: {"schedule_id": "12345"}
+    });
+    </script>
+    """
+
+    result = extract_race_results_json(html)
+
+    assert result["rps"] == [{"driver_id": "1"}]
+    assert result["drivers"] == {"1": {"name": "Driver One"}}
+    assert result["schedule"] == {"schedule_id": "12345"}
+    assert result["teams"] is None
+
+
+def test_extract_race_results_json_wrapper_element():
+    """Test ResultsTable props are found when it is a child of a wrapper element."""
+    html = """
+    <script>
+    ReactDOM.createRoot(root).render(
+        React.createElement(Wrapper, {title: "Results"},
+            React.createElement(ResultsTable, {
+                rps: [{"driver_id": "1"}],
+                drivers: {"1": {"name": "Driver One"}},
+                schedule: {"schedule_id": "12345"}
+            })
+        )
+    );
+    </script>
+    """
+
+    assert _extract_results_table_props(html) == {
+        "rps": [{"driver_id": "1"}],
+        "drivers": {"1": {"name": "Driver One"}},
+        "schedule": {"schedule_id": "12345"},
+    }
+    result = extract_race_results_json(html)
+    assert result["rps"] == [{"driver_id": "1"}]
+    assert result["drivers"] == {"1": {"name": "Driver One"}}
+    assert result["schedule"] == {"schedule_id": "12345"}
+
+
+def test_extract_results_table_props_not_found():
+    """Test empty dict is returned when there is no createElement call."""
+    assert _extract_results_table_props("<html><body>No React</body></html>") == {}
+
+
+def test_extract_race_results_json_accepts_bytes():
+    """Test race results can be extracted from raw UTF-8 page bytes."""
+    html = 'React.createElement(ResultsTable, {rps: [{"name": "Jürgen"}], teams: {}})'
+
+    result = extract_race_results_json(memoryview(html.encode("utf-8")))
+
+    assert result["rps"] == [{"name": "Jürgen"}]
+    assert result["teams"] == {}
+
+
+def test_extract_series_and_react_props_accept_bytes():
+    """Test bytes input gives the same results as str input."""
+    html = 'series.push({id: 100, name: "Test"}); x = {drivers: {"1": {"n": "A"}}}'
+
+    assert extract_series_data(html.encode()) == extract_series_data(html)
+    assert extract_react_props(html.encode(), "drivers") == {"1": {"n": "A"}}
+
+
+def test_find_results_table_props_single_scan():
+    """Test the page-wide scan decodes each prop once and skips non-JSON values."""
+    html = """
+    var cfg = {myrps: [1], teams: {bad js}, schedule: "x"};
+    render({teams: {"1": {"name": "Team One"}}, rps: [{"id": 1}], team_drivers: {}});
+    other({rps: [{"id": 2}]});
+    """
+
+    result = _find_results_table_props(html)
+
+    assert result == {
+        "teams": {"1": {"name": "Team One"}},
+        "rps": [{"id": 1}],
+        "team_drivers": {},
+    }
+
+
+def test_iter_script_bodies():
+    """Test script bodies are isolated from the surrounding markup."""
+    html = (
+        "<html><p>seasons = [{id: 1}];</p>"
+        '<script src="a.js"></script>'
+        '<script type="text/javascript">var a = 1;</script>'
+        "<script>var b = 2;"
+    )
+
+    assert list(_iter_script_bodies(html)) == ["", "var a = 1;", "var b = 2;"]
+    assert list(_iter_script_bodies("var bare = 1;")) == ["var bare = 1;"]
+    # A page cut off inside an opening tag has no body to yield
+    assert list(_iter_script_bodies('<script>var c = 3;</script><script type="a')) == ["var c = 3;"]
+
+
+def test_iter_script_bodies_mixed_case_tags():
+    """Test upper- and mixed-case script tags are found like lowercase ones."""
+    html = (
+        '<script src="a.js"></script>'
+        '<SCRIPT>series.push({id: 2, name: "Upper"});</SCRIPT>'
+        "<Script type='a'>var c = 3;</script >"
+    )
+
+    assert list(_iter_script_bodies(html)) == [
+        "",
+        'series.push({id: 2, name: "Upper"});',
+        "var c = 3;",
+    ]
+    assert [s["id"] for s in extract_series_data(html)] == [2]
+
+
+def test_extract_functions_ignore_data_outside_scripts():
+    """Test JavaScript-looking text in page markup is not extracted."""
+    html = """
+    <p>series.push({id: 1, name: "Markup"}); seasons = [{id: 1}]; rps: [{"id": 1}]</p>
+    <script>
+    series.push({id: 2, name: "Script"});
+    seasons = [{id: 2}];
+    </script>
+    <script>render({rps: [{"id": 2}]});</script>
+    """
+
+    assert [s["id"] for s in extract_series_data(html)] == [2]
+    assert extract_js_array(html, "seasons") == [{"id": 2}]
+    assert extract_react_props(html, "rps") == [{"id": 2}]
+
+
+def test_find_results_table_props_stops_once_all_found():
+    """Test the page-wide scan stops as soon as every ResultsTable prop is decoded."""
+    html = """
+    render({rps: [{"id": 1}], drivers: {}, teams: {}, team_drivers: {}, schedule: {}});
+    later({rps: [{"id": 2}], drivers: {"2": {}}});
+    """
+
+    result = _find_results_table_props(html)
+
+    assert result == {
+        "rps": [{"id": 1}],
+        "drivers": {},
+        "teams": {},
+        "team_drivers": {},
+        "schedule": {},
+    }
@@ -1,21 +1,13 @@
 """Tests for Orchestrator."""
 
+import sqlite3
+
 import pytest
 
-from src.database import Database
 from src.orchestrator import Orchestrator
 from src.schema_validator import SchemaValidator
 
 
-@pytest.fixture
-def test_db():
-    """Create a temporary test database."""
-    db = Database(":memory:")
-    db.connect()
-    yield db
-    db.close()
-
-
 @pytest.fixture
 def schema_validator():
     """Create a SchemaValidator instance."""
@@ -28,6 +20,12 @@ def orchestrator(test_db, schema_validator):
     return Orchestrator(database=test_db, validator=schema_validator, rate_limit_seconds=0)
 
 
+@pytest.fixture
+def race_orchestrator(race_db, schema_validator):
+    """Create an Orchestrator over the seeded league 1558 -> race 67890 hierarchy."""
+    return Orchestrator(database=race_db, validator=schema_validator, rate_limit_seconds=0)
+
+
 class TestOrchestratorInitialization:
     """Test orchestrator initialization."""
 
@@ -187,3 +185,176 @@ class TestOrchestratorHelpers:
         first, last = orchestrator._parse_driver_name(None)
         assert first is None
         assert last is None
+
+
+class TestOrchestratorStoreRaceResults:
+    """Test batched storage of race results."""
+
+    RESULTS = [
+        {"driver_id": 101, "driver_name": "Doe, John", "finish_position": 1},
+        {"driver_id": 102, "driver_name": "Smith, Jane", "finish_position": 2},
+    ]
+
+    def test_store_race_results_bulk(self, race_orchestrator, race_db):
+        """Test drivers and results are written through the bulk upserts."""
+        race_id = race_db.get_race(67890)["race_id"]
+
+        race_orchestrator._store_race_results(race_id, self.RESULTS, 12345)
+
+        driver = race_db.get_driver(101)
+        assert driver["league_id"] == 1558
+        assert driver["first_name"] == "John"
+        assert driver["last_name"] == "Doe"
+        results = race_db.get_race_results(race_id)
+        assert {(r["driver_id"], r["finish_position"]) for r in results} == {(101, 1), (102, 2)}
+
+    def test_store_race_results_skips_results_without_driver_id(self, race_orchestrator, race_db):
+        """Test results without a driver link are dropped before the batch."""
+        race_id = race_db.get_race(67890)["race_id"]
+        results = [*self.RESULTS, {"driver_name": "Unlinked Driver", "finish_position": 3}]
+
+        race_orchestrator._store_race_results(race_id, results, 12345)
+
+        assert len(race_db.get_race_results(race_id)) == 2
+
+    def test_store_race_results_no_linked_drivers(self, race_orchestrator, race_db):
+        """Test a race with no linked drivers writes nothing."""
+        race_id = race_db.get_race(67890)["race_id"]
+
+        race_orchestrator._store_race_results(race_id, [{"driver_name": "Unlinked"}], 12345)
+
+        assert race_db.get_all_drivers() == []
+        assert race_db.get_race_results(race_id) == []
+
+    def test_store_race_results_unresolved_league(self, orchestrator, test_db):
+        """Test nothing is written when the season's league can't be resolved."""
+        orchestrator._store_race_results(1, self.RESULTS, 99999)
+
+        assert test_db.get_all_drivers() == []
+
+    def test_store_race_results_falls_back_per_row(self, race_orchestrator, race_db, monkeypatch):
+        """Test a failed batch is retried row by row and every row is stored."""
+        race_id = race_db.get_race(67890)["race_id"]
+
+        def failing_bulk(race_id, results):
+            raise sqlite3.OperationalError("database is locked")
+
+        monkeypatch.setattr(race_db, "upsert_race_results_bulk", failing_bulk)
+
+        race_orchestrator._store_race_results(race_id, self.RESULTS, 12345)
+
+        results = race_db.get_race_results(race_id)
+        assert {(r["driver_id"], r["finish_position"]) for r in results} == {(101, 1), (102, 2)}
+
+    def test_store_race_results_does_not_mask_other_errors(
+        self, race_orchestrator, race_db, monkeypatch
+    ):
+        """Test non-SQLite errors from the batch propagate instead of falling back."""
+        race_id = race_db.get_race(67890)["race_id"]
+
+        def broken_bulk(race_id, results):
+            raise KeyError("driver_id")
+
+        monkeypatch.setattr(race_db, "upsert_race_results_bulk", broken_bulk)
+
+        with pytest.raises(KeyError):
+            race_orchestrator._store_race_results(race_id, self.RESULTS, 12345)
+
+
+class TestOrchestratorChildPrestore:
+    """Test child names stored from the parent page before their own pages are scraped."""
+
+    LEAGUE_URL = "https://www.simracerhub.com/league_series.php?league_id=1558"
+    SERIES_URL = "https://www.simracerhub.com/series_seasons.php?series_id=3714"
+
+    def test_scrape_league_stores_series_rows(self, orchestrator, test_db, monkeypatch):
+        """Test series from the league page are stored in one bulk upsert."""
+        league_data = {
+            "metadata": {"league_id": 1558, "name": "The OBRL", "url": self.LEAGUE_URL},
+            "child_urls": {
+                "series": [
+                    {
+                        "series_id": 3714,
+                        "name": "Wednesday Night Cup",
+                        "url": self.SERIES_URL,
+                        "description": "Cup series",
+                        "created_date": "2023-01-01",
+                        "num_seasons": 5,
+                    },
+                    {
+                        "series_id": 3713,
+                        "url": "https://www.simracerhub.com/series_seasons.php?series_id=3713",
+                    },
+                ]
+            },
+        }
+        monkeypatch.setattr(orchestrator.league_extractor, "extract", lambda url: league_data)
+        scraped = []
+        monkeypatch.setattr(orchestrator, "scrape_series", lambda **kw: scraped.append(kw))
+
+        orchestrator.scrape_league(self.LEAGUE_URL, depth="series")
+
+        rows = {row["series_id"]: row for row in test_db.get_series_by_league(1558)}
+        assert set(rows) == {3713, 3714}
+        assert rows[3714]["name"] == "Wednesday Night Cup"
+        assert rows[3714]["url"] == self.SERIES_URL
+        assert rows[3714]["description"] == "Cup series"
+        assert rows[3714]["created_date"] == "2023-01-01"
+        assert rows[3714]["num_seasons"] == 5
+        assert rows[3714]["scraped_at"] == "1970-01-01T00:00:00"
+        assert rows[3713]["name"] == "Unknown Series"
+        assert rows[3713]["description"] is None
+        assert [kw["series_url"] for kw in scraped] == [self.SERIES_URL, rows[3713]["url"]]
+
+    def _seed_league(self, db):
+        db.upsert_league(
+            1558, {"name": "The OBRL", "url": self.LEAGUE_URL, "scraped_at": "2025-01-15"}
+        )
+
+    def _series_data(self, seasons):
+        return {
+            "metadata": {"series_id": 3714, "name": "Series", "url": self.SERIES_URL},
+            "child_urls": {"seasons": seasons},
+        }
+
+    def test_scrape_series_stores_season_rows(self, orchestrator, test_db, monkeypatch):
+        """Test seasons from the series page are stored before each season is scraped."""
+        self._seed_league(test_db)
+        seasons = [
+            {"season_id": 1, "name": "2025 Season 1", "url": "http://test.com/season/1"},
+            {"season_id": 2, "url": "http://test.com/season/2"},
+        ]
+        monkeypatch.setattr(
+            orchestrator.series_extractor, "extract", lambda url: self._series_data(seasons)
+        )
+        scraped = []
+        monkeypatch.setattr(orchestrator, "scrape_season", lambda **kw: scraped.append(kw))
+
+        orchestrator.scrape_series(self.SERIES_URL, league_id=1558, depth="season")
+
+        rows = {row["season_id"]: row for row in test_db.get_seasons_by_series(3714)}
+        assert rows[1]["name"] == "2025 Season 1"
+        assert rows[2]["name"] == "Unknown Season"
+        assert {row["scraped_at"] for row in rows.values()} == {"1970-01-01T00:00:00"}
+        assert [kw["season_id"] for kw in scraped] == [1, 2]
+
+    def test_scrape_series_season_prestore_rolls_back(self, orchestrator, test_db, monkeypatch):
+        """Test a bad season row rolls back the whole season pre-store."""
+        self._seed_league(test_db)
+        seasons = [
+            {"season_id": 1, "name": "2025 Season 1", "url": "http://test.com/season/1"},
+            {"season_id": 2, "name": "2025 Season 2"},  # No URL - upsert fails
+        ]
+        monkeypatch.setattr(
+            orchestrator.series_extractor, "extract", lambda url: self._series_data(seasons)
+        )
+        scraped = []
+        monkeypatch.setattr(orchestrator, "scrape_season", lambda **kw: scraped.append(kw))
+
+        orchestrator.scrape_series(self.SERIES_URL, league_id=1558, depth="season")
+
+        assert test_db.get_seasons_by_series(3714) == []
+        assert scraped == []
+        assert orchestrator.progress["errors"][0]["entity"] == "series"
+        # The series row itself was committed before the season block
+        assert test_db.get_series(3714) is not None
@@ -1,7 +1,7 @@
 """Tests for RaceExtractor."""
 
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 import pytest
 from bs4 import BeautifulSoup
@@ -124,6 +124,88 @@ class TestRaceExtractorExtraction:
             # Verify structure is correct (list of driver IDs or empty if no links)
             assert isinstance(driver_ids, list)
 
+    def test_extract_from_soup_matches_extract(self, race_extractor, race_fixture_html):
+        """Test extract_from_soup gives extract()'s result without fetching."""
+        url = "https://www.simracerhub.com/season_race.php?schedule_id=324462"
+        soup = BeautifulSoup(race_fixture_html, "lxml")
+
+        with patch.object(race_extractor, "fetch_page", return_value=soup) as mock_fetch:
+            expected = race_extractor.extract(url)
+            mock_fetch.reset_mock()
+
+            result = race_extractor.extract_from_soup(soup, url)
+
+        mock_fetch.assert_not_called()
+        assert result == expected
+        assert result["metadata"]["schedule_id"] == 324462
+
+    def _fetch(self, race_extractor, html, url):
+        """Run extract() over html served by a stubbed requests.get."""
+        response = Mock(text=html, headers={"Content-Type": "text/html; charset=utf-8"})
+        with patch("requests.get", return_value=response):
+            return race_extractor.extract(url)
+
+    def test_fetched_extract_matches_full_parse(self, race_extractor, race_fixture_html):
+        """Test extract() parses the fetched page exactly as extract_from_soup sees it."""
+        url = "https://www.simracerhub.com/season_race.php?schedule_id=324462"
+
+        result = self._fetch(race_extractor, race_fixture_html, url)
+
+        expected = race_extractor.extract_from_soup(BeautifulSoup(race_fixture_html, "lxml"), url)
+        assert result == expected
+        assert result["metadata"]["date"]
+        assert result["metadata"]["track_name"]
+
+    @pytest.mark.parametrize(
+        "block",
+        [
+            "<p>Date: Oct 29, 2025</p>\n<p>Track: Daytona - Oval</p>\n<p>Laps 200</p>",
+            "<div>Date: Oct 29, 2025</div>\n<div>Track: Daytona - Oval</div>\n<div>Laps 200</div>",
+            "<h3>Date: Oct 29, 2025</h3>\n<h3>Track: Daytona - Oval</h3>\n<h3>Laps 200</h3>",
+            "<dl><dt>Date: Oct 29, 2025</dt>\n<dt>Track: Daytona - Oval</dt>\n</dl>",
+            "<strong>Date: Oct 29, 2025</strong><br>\n<strong>Track: Daytona - Oval</strong>",
+        ],
+    )
+    def test_extract_reads_date_and_track_text(self, race_extractor, block):
+        """Test the "Date:"/"Track:" fallback sees the whole fetched page, newlines included."""
+        url = "https://www.simracerhub.com/season_race.php?schedule_id=324462"
+        html = (
+            "<html><head><title>Race</title></head><body>"
+            f'<div class="session-details">0h 59m · <span>63 laps</span></div>\n{block}'
+            "</body></html>"
+        )
+
+        metadata = self._fetch(race_extractor, html, url)["metadata"]
+
+        assert metadata["date"] == "2025-10-29T00:00:00"
+        assert metadata["track_name"] == "Daytona"
+        assert metadata["track_config"] == "Oval"
+
+    def test_react_props_parsed_once_per_page(self, race_extractor, race_fixture_html):
+        """Test results and schedule share one parse of the ReactDOM props."""
+        from src.utils import js_parser
+
+        soup = BeautifulSoup(race_fixture_html, "lxml")
+        url = "https://www.simracerhub.com/season_race.php?schedule_id=324462"
+
+        with patch.object(
+            js_parser,
+            "extract_race_results_json",
+            wraps=js_parser.extract_race_results_json,
+        ) as mock_parse:
+            result = race_extractor.extract_from_soup(soup, url)
+
+        assert mock_parse.call_count == 1
+        assert result["results"]
+        assert result["schedule"]
+
+    def test_extract_from_soup_invalid_url(self, race_extractor):
+        """Test extract_from_soup validates the URL like extract()."""
+        with pytest.raises(ValueError, match="Invalid race URL format"):
+            race_extractor.extract_from_soup(
+                BeautifulSoup("", "lxml"), "https://www.simracerhub.com/season_race.php"
+            )
+
 
 class TestRaceExtractorEdgeCases:
     """Test edge cases and error handling."""
@@ -461,6 +543,30 @@ class TestRaceExtractorMetadata:
             assert "leaders" not in metadata
             assert "lead_changes" not in metadata
 
+    @pytest.mark.parametrize(
+        "stats, weather, expected",
+        [
+            ("2h 5m", "50° F", {"race_duration_minutes": 125, "temperature_f": 50}),
+            ("1h 0m", "37° C", {"race_duration_minutes": 60, "temperature_f": 98}),
+            ("0h 45m", "0° C", {"race_duration_minutes": 45, "temperature_f": 32}),
+            ("3h 59m", "100° C", {"race_duration_minutes": 239, "temperature_f": 212}),
+            ("1h 11m", "88° F", {"race_duration_minutes": 71, "temperature_f": 88}),
+        ],
+    )
+    def test_session_details_duration_and_temperature(
+        self, race_extractor, stats, weather, expected
+    ):
+        """Test duration and Celsius-to-Fahrenheit conversion from session-details."""
+        html = f"""
+        <div class="session-details">
+            {stats} · <span>50 laps</span><br/>Realistic weather · <span>{weather}</span>
+        </div>
+        """
+        info = race_extractor._extract_race_info(BeautifulSoup(html, "html.parser"))
+
+        for key, value in expected.items():
+            assert info[key] == value
+
 
 class TestRaceExtractorContextManager:
     """Test context manager functionality."""